@@ -0,0 +1,215 @@
+"""Generates src/lib/kernels.py, the vectorized NumPy versions of lib formulas.
+
+Each listed function is evaluated on a fully symbolic conic, its result is
+reduced with `sympy.cse`, and printed as NumPy code. Run the script after
+changing any of the formulas; with `--check` it only verifies that the
+generated module is up to date.
+"""
+
+import argparse
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+from sympy import Expr, Matrix, MatrixBase, Symbol, cse, symbols
+from sympy.printing.numpy import NumPyPrinter
+
+from lib.central_conic import (
+    center_to_covertex_vector,
+    center_to_focus_vector,
+    center_to_vertex_vector,
+    conic_center,
+    linear_eccentricity,
+    primary_radius,
+    secondary_radius,
+    semi_axis_lengths,
+    shrink_conic_to_zero,
+)
+from lib.circle import circle_radius, director_circle
+from lib.conic_direction import (
+    ConicNormFactor,
+    conjugate_axis_direction,
+    focal_axis_direction,
+)
+from lib.matrix import conic_matrix
+from lib.parabola import (
+    parabola_axis,
+    parabola_direction,
+    parabola_directrix,
+    parabola_focal_parameter,
+    parabola_focus,
+    parabola_vertex,
+)
+
+OUTPUT_FILE = Path(__file__).parent.parent / "src" / "lib" / "kernels.py"
+
+#: The functions to compile, in the order they appear in the generated module.
+FUNCTIONS: tuple[Callable[[Matrix], Expr | Matrix | tuple[Expr, ...]], ...] = (
+    conic_center,
+    semi_axis_lengths,
+    primary_radius,
+    secondary_radius,
+    linear_eccentricity,
+    center_to_focus_vector,
+    center_to_vertex_vector,
+    center_to_covertex_vector,
+    shrink_conic_to_zero,
+    circle_radius,
+    director_circle,
+    parabola_directrix,
+    parabola_focus,
+    parabola_vertex,
+    parabola_direction,
+    parabola_axis,
+    parabola_focal_parameter,
+    focal_axis_direction,
+    conjugate_axis_direction,
+)
+
+COEFFICIENTS = symbols("a b c d e f", real=True)
+NORM_SIGN = Symbol("norm_sign", real=True)
+
+HEADER = '''\
+# fmt: off
+"""Vectorized NumPy kernels of closed-form conic formulas.
+
+*Generated by scripts/generate_kernels.py. Do not edit.*
+
+Each kernel takes the elements `a, b, c, d, e, f` of conic matrices (see
+[conic_matrix](#matrix.conic_matrix)) as NumPy arrays of the same or
+broadcastable shapes, and evaluates the formula of its symbolic counterpart
+with common subexpressions computed once. Use
+[conic_coefficients](#kernels.conic_coefficients) to split an (N,3,3) conic
+stack into these arrays.
+
+Kernels returning a scalar per conic return an array of the broadcast shape,
+the others append the shape of their symbolic result, e.g. `(N,2)` for 2D
+vectors or `(N,3,3)` for matrices. Results that are complex for real inputs
+evaluate to `nan`, unless the inputs are complex arrays.
+"""
+
+import numpy  # noqa: ICN001 (the sympy printer emits numpy.*)
+from numpy.typing import ArrayLike, NDArray
+
+
+def conic_coefficients(conics: ArrayLike) -> tuple[NDArray[numpy.float64], ...]:
+    """Splits a stack of conic matrices into the arrays `a, b, c, d, e, f`.
+
+    Takes a 3x3 matrix or an (...,3,3) array, and returns six arrays of shape
+    `(...)`.
+    """
+    conics = numpy.asarray(conics, dtype=float)
+    if conics.shape[-2:] != (3, 3):
+        raise ValueError("The conics must be an (...,3,3) array.")
+    return (
+        conics[..., 0, 0],
+        conics[..., 0, 1],
+        conics[..., 1, 1],
+        conics[..., 0, 2],
+        conics[..., 1, 2],
+        conics[..., 2, 2],
+    )
+
+
+def _stack(elements: list[ArrayLike], shape: tuple[int, ...]) -> NDArray:
+    """Stacks broadcast element arrays along new trailing axes of `shape`."""
+    arrays = numpy.broadcast_arrays(*elements)
+    return numpy.stack(arrays, axis=-1).reshape(arrays[0].shape + shape)
+
+
+def _conic_norm_factor(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [ConicNormFactor](#conic_direction.ConicNormFactor)."""
+    det = a * (c * f - e * e) - b * (b * f - d * e) + d * (b * e - c * d)
+    # Some 2x2 principal minor of a point conic's matrix is positive.
+    is_point_conic = (det == 0) & (
+        (c * f - e * e > 0) | (a * f - d * d > 0) | (a * c - b * b > 0)
+    )
+    has_positive_diagonal = (a > 0) | (c > 0) | (f > 0)
+    degenerate_factor = numpy.where(is_point_conic & has_positive_diagonal, -1, 1)
+    return numpy.where(det == 0, degenerate_factor, numpy.sign(det))
+'''
+
+
+def _result_elements(result: Expr | Matrix | tuple) -> tuple[list[Expr], tuple]:
+    """Flattens a symbolic result, also returning its shape."""
+    if isinstance(result, MatrixBase):
+        shape = (result.rows,) if result.cols == 1 else result.shape
+        return list(result), shape
+    if isinstance(result, tuple):
+        return list(result), (len(result),)
+    return [result], ()
+
+
+def _reference(function: Callable) -> str:
+    return f"[{function.__name__}](#{function.__module__[4:]}.{function.__name__})"
+
+
+def generate_kernel(function: Callable) -> str:
+    """Generates the source code of a single kernel."""
+    conic = conic_matrix(*COEFFICIENTS)
+    elements, shape = _result_elements(function(conic))
+    elements = [
+        el.replace(lambda e: isinstance(e, ConicNormFactor), lambda _: NORM_SIGN)
+        for el in elements
+    ]
+    replacements, reduced = cse(elements)
+    printer = NumPyPrinter({"fully_qualified_modules": True})
+
+    params = ", ".join(map(str, COEFFICIENTS))
+    lines = [
+        "",
+        "",
+        f"def {function.__name__}(",
+        *(f"    {coefficient}: ArrayLike," for coefficient in COEFFICIENTS),
+        ") -> NDArray:",
+        f'    """Vectorized {_reference(function)}."""',
+    ]
+    if any(NORM_SIGN in el.free_symbols for el in elements):
+        lines.append(f"    {NORM_SIGN} = _conic_norm_factor({params})")
+    lines.extend(
+        f"    {symbol} = {printer.doprint(expr)}" for symbol, expr in replacements
+    )
+    printed = [printer.doprint(expr) for expr in reduced]
+    if shape:
+        lines.append(f"    return _stack([{', '.join(printed)}], {shape})")
+    else:
+        lines.append(f"    return {printed[0]}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_module() -> str:
+    """Generates the source code of the kernel module."""
+    return HEADER + "".join(generate_kernel(function) for function in FUNCTIONS)
+
+
+def main() -> None:
+    """Writes or checks the generated module."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only check whether the generated module is up to date",
+    )
+    args = parser.parse_args()
+
+    source = generate_module()
+    if not args.check:
+        OUTPUT_FILE.write_text(source, encoding="utf-8")
+    elif OUTPUT_FILE.read_text(encoding="utf-8") != source:
+        print(
+            f"{OUTPUT_FILE.name} is out of date. "
+            "Run 'python scripts/generate_kernels.py' to regenerate.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
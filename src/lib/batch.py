@@ -0,0 +1,716 @@
+"""Vectorized floating-point counterparts of the symbolic functions.
+
+The functions in this module take NumPy arrays (or anything convertible to
+them, including numeric sympy matrices) and process many conics, points or
+lines in a single pass. Unlike their symbolic counterparts, which remain the
+exact reference, they decide equalities with relative tolerances.
+"""
+
+from enum import Enum
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from lib.conic_classes import ConicType
+
+#: The default relative tolerance of the approximate equality checks.
+DEFAULT_TOLERANCE: float = 1e-9
+
+#: The relative rounding error of a floating-point sum of a few products.
+_ROUNDING_ERROR_FACTOR = 16 * np.finfo(float).eps
+
+
+def _points_to_vec3(points: ArrayLike) -> NDArray[np.float64]:
+    """Converts an (M,2) or (M,3) point array to homogeneous coordinates."""
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2 or points.shape[1] not in (2, 3):
+        raise ValueError("The points must be an (M,2) or (M,3) array.")
+    if points.shape[1] == 2:
+        return np.column_stack([points, np.ones(len(points))])
+    return points
+
+
+def _as_point_tuples(
+    points: ArrayLike,
+    count: int,
+) -> tuple[NDArray[np.float64], bool]:
+    """Converts `count` points or an (N,count,2|3) array of point tuples to an
+    (N,count,3) array of homogeneous coordinates.
+
+    Also tells whether the input was a single point tuple.
+    """
+    points = np.asarray(points, dtype=float)
+    single = points.ndim == 2
+    if single:
+        points = points[np.newaxis]
+    if points.ndim != 3 or points.shape[1] != count or points.shape[2] not in (2, 3):
+        msg = f"The points must be a ({count},2|3) or an (N,{count},2|3) array."
+        raise ValueError(msg)
+    if points.shape[2] == 2:
+        points = np.concatenate([points, np.ones((*points.shape[:2], 1))], axis=2)
+    return points, single
+
+
+def _row_dot(u: NDArray[np.float64], v: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Computes the dot products of the corresponding rows of two arrays."""
+    return np.einsum("ni,ni->n", u, v)
+
+
+def _as_conic_stack(conics: ArrayLike) -> tuple[NDArray[np.float64], bool]:
+    """Converts a 3x3 conic matrix or an (N,3,3) stack to an (N,3,3) array.
+
+    Also tells whether the input was a single conic.
+    """
+    conics = np.asarray(conics, dtype=float)
+    if conics.shape == (3, 3):
+        return conics[np.newaxis], True
+    if conics.ndim != 3 or conics.shape[1:] != (3, 3):
+        raise ValueError("The conics must be a 3x3 matrix or an (N,3,3) array.")
+    return conics, False
+
+
+def _conic_coefficients(conics: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Extracts the `(a, 2b, c, 2d, 2e, f)` coefficients of an (N,3,3) stack.
+
+    The quadratic form of a conic equals the dot product of these coefficients
+    and the `(x², xy, y², xz, yz, z²)` monomials of the point.
+    """
+    return np.stack(
+        [
+            conics[:, 0, 0],
+            conics[:, 0, 1] + conics[:, 1, 0],
+            conics[:, 1, 1],
+            conics[:, 0, 2] + conics[:, 2, 0],
+            conics[:, 1, 2] + conics[:, 2, 1],
+            conics[:, 2, 2],
+        ],
+        axis=1,
+    )
+
+
+def _veronese(points: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Maps (M,3) homogeneous points to their (M,6) quadratic monomials."""
+    x, y, z = points.T
+    return np.stack([x * x, x * y, y * y, x * z, y * z, z * z], axis=1)
+
+
+def quadratic_form(conics: ArrayLike, points: ArrayLike) -> NDArray[np.float64]:
+    """Evaluates the quadratic forms of conics at many points.
+
+    `conics` is either a 3x3 matrix or an (N,3,3) stack of them, `points` is an
+    (M,2) array of Euclidean or an (M,3) array of homogeneous coordinates.
+
+    Returns an (M,) array of `vᵀ·C·v` values for a single conic, or an (N,M)
+    array for a stack of conics.
+
+    *Exact counterpart*: [quadratic_form](#matrix.quadratic_form)
+    """
+    conic_stack, single = _as_conic_stack(conics)
+    values = _conic_coefficients(conic_stack) @ _veronese(_points_to_vec3(points)).T
+    return values[0] if single else values
+
+
+def conic_contains_point(
+    conics: ArrayLike,
+    points: ArrayLike,
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> NDArray[np.bool_]:
+    """Checks which points lie on which conics.
+
+    Takes the same arguments as [quadratic_form](#batch.quadratic_form), and
+    returns a boolean mask of the same shape. A point is considered to be on a
+    conic if `|vᵀ·C·v| ≤ tolerance·‖C‖·‖v‖²`, where `‖C‖` is the Frobenius norm
+    of the conic matrix. The check is invariant under rescaling the conic
+    matrices or the homogeneous point coordinates.
+
+    *Exact counterpart*: [conic_contains_point](#incidence.conic_contains_point)
+    """
+    conic_stack, single = _as_conic_stack(conics)
+    vectors = _points_to_vec3(points)
+    values = _conic_coefficients(conic_stack) @ _veronese(vectors).T
+    conic_norms = np.linalg.norm(conic_stack, axis=(1, 2))
+    point_norms = np.einsum("ij,ij->i", vectors, vectors)
+    mask = np.abs(values) <= tolerance * np.outer(conic_norms, point_norms)
+    return mask[0] if single else mask
+
+
+def sampson_distances(
+    conics: ArrayLike,
+    points: ArrayLike,
+) -> NDArray[np.float64]:
+    """Approximates the distances between conics and Euclidean points.
+
+    Takes a 3x3 matrix or an (N,3,3) stack of conics and an (M,2) array of
+    points. Returns an (M,) or (N,M) array of Sampson distances
+    `|pᵀCp| / ‖∇(pᵀCp)‖`, the first-order approximation of the geometric
+    distance, which is exact for lines and accurate near the conics.
+    """
+    conics = np.asarray(conics, dtype=float)
+    points = np.asarray(points, dtype=float)
+    # For p = (x, y, 1): pᵀCp = x·(Cp)₀ + y·(Cp)₁ + C₂₀x + C₂₁y + C₂₂, and the
+    # gradient of the symmetric quadratic form is 2·((Cp)₀, (Cp)₁).
+    rows = conics[..., :2, :2] @ points.T + conics[..., :2, 2:]
+    x, y = points.T
+    values = (
+        x * rows[..., 0, :]
+        + y * rows[..., 1, :]
+        + conics[..., 2:, 0] * x
+        + conics[..., 2:, 1] * y
+        + conics[..., 2:, 2]
+    )
+    gradient_norms = 2 * np.hypot(rows[..., 0, :], rows[..., 1, :])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distances = np.abs(values) / gradient_norms
+    return np.where(values == 0, 0, distances)
+
+
+def classify_conic(
+    conics: ArrayLike,
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> NDArray[np.int8]:
+    """Determines the types of many conics at once.
+
+    Takes a 3x3 matrix or an (N,3,3) stack of them, and returns a scalar or an
+    (N,) array of [ConicType](#conic_classes.ConicType) values. Use
+    `ConicType(code)` to convert the codes back to enum members.
+
+    The matrices are scaled to unit Frobenius norm, then rotated and
+    translated to the canonical form `diag(λ₁, λ₂, f)` with the eigenvalues
+    `λ₁, λ₂` of the upper-left 2x2 submatrix, plus a linear part for
+    parabolas. The rank and signature are derived from these coefficients,
+    treating the ones below `tolerance` relative to the largest eigenvalue as
+    zero, and non-degenerate conics are further split by the sign of `λ₁λ₂`.
+    Unlike the eigenvalues of the matrix itself, the canonical coefficients
+    don't depend on the position of the conic, so small conics far from the
+    origin aren't mistaken for degenerate ones.
+
+    *Exact counterpart*: [classify_conic](#conic_classes.classify_conic)
+    """
+    conic_stack, single = _as_conic_stack(conics)
+    conic_stack = _normalize_conics(conic_stack)
+    is_zero = ~conic_stack.any(axis=(1, 2))
+
+    eigenvalues, constants, linear_norms = _canonical_coefficients(
+        conic_stack,
+        tolerance,
+    )
+    # The linear part of a parabola adds a positive and a negative eigenvalue,
+    # and makes the constant term irrelevant.
+    constants = np.where(linear_norms > 0, 0, constants)
+    signs = np.column_stack([np.sign(eigenvalues), np.sign(constants)])
+    positive = np.count_nonzero(signs > 0, axis=1) + (linear_norms > 0)
+    negative = np.count_nonzero(signs < 0, axis=1) + (linear_norms > 0)
+    rank = positive + negative
+    submatrix_det = eigenvalues[:, 0] * eigenvalues[:, 1]
+
+    codes = np.select(
+        [
+            is_zero,
+            rank == 1,
+            (rank == 2) & ((positive == 0) | (negative == 0)),
+            rank == 2,
+            (positive == 0) | (negative == 0),
+            submatrix_det > 0,
+            submatrix_det < 0,
+        ],
+        [
+            ConicType.ZERO_MATRIX.value,
+            ConicType.DOUBLE_LINE.value,
+            ConicType.POINT_CONIC.value,
+            ConicType.LINE_PAIR.value,
+            ConicType.IMAGINARY_ELLIPSE.value,
+            ConicType.ELLIPSE.value,
+            ConicType.HYPERBOLA.value,
+        ],
+        ConicType.PARABOLA.value,
+    ).astype(np.int8)
+    return codes[0] if single else codes
+
+
+def conic_through_points(
+    points: ArrayLike,
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    """Computes the conics through many 5-tuples of points.
+
+    Takes a (5,2) or (5,3) array of Euclidean or homogeneous point coordinates,
+    or an (N,5,2) or (N,5,3) stack of them. Returns the conic matrices as a
+    3x3 or an (N,3,3) array, computed with the same formula as the exact
+    counterpart, together with a boolean flag or an (N,) mask telling which
+    results are ambiguous.
+
+    The exact counterpart returns a zero matrix if the conic is not unique,
+    i.e. two points coincide or four are collinear. The conic matrix is
+    homogeneous of degree 2 in each point, so the result counts as ambiguous
+    if `‖C‖ ≤ tolerance·∏‖pᵢ‖²` with Frobenius and Euclidean norms.
+
+    *Exact counterpart*: [conic_through_points](#conic.conic_through_points)
+    """
+    point_stack, single = _as_point_tuples(points, 5)
+    p1, p2, p3, p4, p5 = point_stack.transpose(1, 0, 2)
+    g1 = np.cross(p1, p3)
+    g2 = np.cross(p2, p4)
+    h1 = np.cross(p1, p4)
+    h2 = np.cross(p2, p3)
+    g = np.einsum("ni,nj->nij", g1, g2)
+    g += g.transpose(0, 2, 1)
+    h = np.einsum("ni,nj->nij", h1, h2)
+    h += h.transpose(0, 2, 1)
+    g_factor = _row_dot(p5, h1) * _row_dot(p5, h2)
+    h_factor = _row_dot(p5, g1) * _row_dot(p5, g2)
+    conics = (
+        g * g_factor[:, np.newaxis, np.newaxis]
+        - h * h_factor[:, np.newaxis, np.newaxis]
+    )
+    scale = np.prod(np.einsum("nki,nki->nk", point_stack, point_stack), axis=1)
+    is_ambiguous = np.linalg.norm(conics, axis=(1, 2)) <= tolerance * scale
+    if single:
+        return conics[0], is_ambiguous[0]
+    return conics, is_ambiguous
+
+
+def _normalize_conics(conics: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Symmetrizes an (N,3,3) conic stack, and scales the non-zero matrices to
+    unit Frobenius norm.
+    """
+    conics = (conics + conics.transpose(0, 2, 1)) / 2
+    norms = np.linalg.norm(conics, axis=(1, 2))
+    return conics / np.where(norms == 0, 1, norms)[:, np.newaxis, np.newaxis]
+
+
+def _canonical_coefficients(
+    conics: NDArray[np.float64],
+    tolerance: float,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Reduces an (N,3,3) stack of normalized conics to their canonical forms.
+
+    Rotations and translations don't change the type of a conic. In the
+    eigenbasis of the upper-left 2x2 submatrix `A`, with the origin at the
+    least-squares center `-A⁺b`, where `b` is the upper part of the last
+    column, the matrix becomes `diag(λ₁, λ₂, f)`, plus a linear part in the
+    null space of `A` for parabolas.
+
+    Returns the (N,2) eigenvalues, the (N,) constant terms and the (N,) norms
+    of the linear parts. The eigenvalues and constant terms at most
+    `tolerance` times the largest eigenvalue are set to zero, as well as the
+    linear parts at most `tolerance` times the other coefficients, and any
+    value at the level of the rounding errors.
+    """
+    eigenvalues, eigenvectors = np.linalg.eigh(conics[:, :2, :2])
+    scales = np.abs(eigenvalues).max(axis=1)
+    thresholds = np.maximum(tolerance * scales, _ROUNDING_ERROR_FACTOR)
+    eigenvalues = np.where(
+        np.abs(eigenvalues) > thresholds[:, np.newaxis],
+        eigenvalues,
+        0,
+    )
+    # The linear part and the constant term in the rotated coordinate system
+    # after the translation to the center.
+    linear = np.einsum("nji,nj->ni", eigenvectors, conics[:, :2, 2])
+    is_nonzero = eigenvalues != 0
+    center = -np.divide(
+        linear,
+        eigenvalues,
+        out=np.zeros_like(linear),
+        where=is_nonzero,
+    )
+    constants = conics[:, 2, 2] + _row_dot(linear, center)
+    linear_norms = np.linalg.norm(np.where(is_nonzero, 0, linear), axis=1)
+    linear_norms = np.where(
+        linear_norms
+        > np.maximum(
+            tolerance * np.maximum(scales, np.abs(constants)), _ROUNDING_ERROR_FACTOR
+        ),
+        linear_norms,
+        0,
+    )
+    constants = np.where(np.abs(constants) > thresholds, constants, 0)
+    return eigenvalues, constants, linear_norms
+
+
+def _adjugate(matrices: NDArray[np.inexact]) -> NDArray[np.inexact]:
+    """Computes the adjugates of an (N,3,3) stack of symmetric matrices."""
+    rows = matrices.transpose(1, 0, 2)
+    return np.stack(
+        [
+            np.cross(rows[1], rows[2]),
+            np.cross(rows[2], rows[0]),
+            np.cross(rows[0], rows[1]),
+        ],
+        axis=1,
+    )
+
+
+def _skew_matrices(vectors: NDArray[np.inexact]) -> NDArray[np.inexact]:
+    """Computes the cross product matrices of an (N,3) array of vectors."""
+    x, y, z = vectors.T
+    zeros = np.zeros_like(x)
+    elements = [zeros, -z, y, z, zeros, -x, -y, x, zeros]
+    return np.stack(elements, axis=1).reshape(-1, 3, 3)
+
+
+def _max_abs_index(values: NDArray[np.inexact]) -> NDArray[np.intp]:
+    """Finds the index of the largest-magnitude element in each row."""
+    return np.argmax(np.abs(values), axis=1)
+
+
+def _real_cubic_root(coefficients: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Finds a real root of many real cubic polynomials.
+
+    Takes an (N,4) array of `(c₃, c₂, c₁, c₀)` coefficients with `c₃ ≠ 0`.
+    Computes the roots with Cardano's formula in complex arithmetic, picks a
+    real one, and polishes it with Newton's method.
+    """
+    b, c, d = (coefficients[:, 1:] / coefficients[:, :1]).T
+    # Depressed cubic u³ + pu + q = 0 with t = u - b/3.
+    p = c - b * b / 3
+    q = 2 * b**3 / 27 - b * c / 3 + d
+    sqrt_discriminant = np.sqrt((q * q / 4 + p**3 / 27).astype(complex))
+    # Choosing the larger of -q/2 ± √Δ avoids cancellation.
+    w = np.where(q > 0, -q / 2 - sqrt_discriminant, -q / 2 + sqrt_discriminant)
+    cbrt = w ** (1 / 3)
+    omega = np.exp(2j * np.pi / 3)
+    candidates = cbrt[:, np.newaxis] * omega ** np.arange(3)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        candidates = np.where(
+            cbrt[:, np.newaxis] == 0,
+            0,
+            candidates - p[:, np.newaxis] / (3 * candidates),
+        )
+    roots = candidates - b[:, np.newaxis] / 3
+    # Cardano's formula loses half of the digits at multiple roots, and so does
+    # Newton's method. Prefer the simple real roots, i.e. the ones where the
+    # derivative is the largest.
+    is_real = np.abs(roots.imag) <= 1e-6 * np.maximum(1, np.abs(roots))
+    b_, c_ = b[:, np.newaxis], c[:, np.newaxis]
+    slopes = np.abs((3 * roots.real + 2 * b_) * roots.real + c_)
+    index = np.where(
+        is_real.any(axis=1),
+        np.argmax(np.where(is_real, slopes, -1), axis=1),
+        np.argmin(np.abs(roots.imag), axis=1),
+    )
+    t = roots[np.arange(len(roots)), index].real
+    for _ in range(2):
+        value = ((t + b) * t + c) * t + d
+        slope = (3 * t + 2 * b) * t + c
+        t = t - np.divide(value, slope, out=np.zeros_like(t), where=slope != 0)
+    return t
+
+
+def _split_to_lines(
+    degenerate: NDArray[np.float64],
+    *,
+    tolerance: float,
+) -> tuple[NDArray[np.complex128], NDArray[np.complex128]]:
+    """Splits an (N,3,3) stack of degenerate conics into two (N,3) arrays of
+    possibly complex lines.
+
+    Vectorized [SplitToLines](#degenerate_conic.SplitToLines), pivoting on the
+    largest elements. Treats the conics as double lines if their adjugates
+    vanish within `tolerance`.
+    """
+    n = len(degenerate)
+    rows = np.arange(n)
+    adj = _adjugate(degenerate)
+    diagonal = np.diagonal(adj, axis1=1, axis2=2)
+    pivot = _max_abs_index(diagonal)
+    beta = np.sqrt(-diagonal[rows, pivot].astype(complex))
+    is_double_line = (
+        np.abs(beta) ** 2
+        <= tolerance
+        * np.linalg.norm(
+            degenerate,
+            axis=(1, 2),
+        )
+        ** 2
+    )
+    beta[is_double_line] = 1
+    intersection = adj[rows, :, pivot] / beta[:, np.newaxis]
+    intersection[is_double_line] = 0
+    lines = degenerate + _skew_matrices(intersection)
+    k = _max_abs_index(lines.reshape(n, 9))
+    return lines[rows, k // 3, :], lines[rows, :, k % 3]
+
+
+def _line_discriminants(
+    adjugates: NDArray[np.float64],
+    lines: NDArray[np.inexact],
+) -> NDArray[np.inexact]:
+    """Computes `-lᵀ·adj(C)·l` for an (N,3) array of lines.
+
+    The adjugates are either a 3x3 matrix or an (N,3,3) stack. The result is
+    positive if the line intersects the conic at two real points, zero if it's
+    tangent, and negative if the intersections are complex.
+    """
+    return -(lines[:, np.newaxis, :] @ adjugates @ lines[:, :, np.newaxis])[:, 0, 0]
+
+
+def _conic_x_lines(
+    conics: NDArray[np.float64],
+    lines: NDArray[np.inexact],
+    discriminants: NDArray[np.inexact],
+    *,
+    tolerance: float,
+) -> NDArray[np.complex128]:
+    """Intersects conics with an (N,3) array of possibly complex lines.
+
+    The conics are either a 3x3 matrix or an (N,3,3) stack, the discriminants
+    come from `_line_discriminants`. Returns an
+    (N,2,3) array of homogeneous points, scaled so that their
+    largest-magnitude coordinate is 1. The points are `nan` if the line is
+    zero or lies on the conic within `tolerance`.
+
+    This is the algorithm of [conic_x_line](#intersection.conic_x_line),
+    except that `α² = -lᵀ·adj(C)·l` holds for every choice of the pivot, so
+    no pivot is needed.
+    """
+    n = len(lines)
+    rows = np.arange(n)
+    skew = _skew_matrices(lines)
+    m = skew.transpose(0, 2, 1) @ conics @ skew
+    alpha = np.sqrt(np.asarray(discriminants, dtype=complex))
+    intersections = m + alpha[:, np.newaxis, np.newaxis] * skew
+    k = _max_abs_index(intersections.reshape(n, 9))
+    points = np.stack(
+        [intersections[rows, :, k % 3], intersections[rows, k // 3, :]],
+        axis=1,
+    )
+    scale = np.linalg.norm(conics, axis=(-2, -1)) * _row_dot(lines, lines.conj()).real
+    is_undefined = ~(np.abs(intersections[rows, k // 3, k % 3]) > tolerance * scale)
+    points[is_undefined] = np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return points / np.take_along_axis(
+            points,
+            _max_abs_index(points.reshape(-1, 3)).reshape(n, 2, 1),
+            axis=2,
+        )
+
+
+class LineIntersectionType(Enum):
+    """The types of conic-line intersections.
+
+    See [conic_x_line](#batch.conic_x_line).
+    """
+
+    #: Two distinct real points.
+    REAL = 0
+
+    #: Two coincident real points, i.e. the line is tangent to the conic.
+    TANGENT = 1
+
+    #: Two complex conjugate points.
+    COMPLEX = 2
+
+    #: The line lies on the conic, or it's the zero vector, or the conic is
+    #: the zero matrix.
+    UNDEFINED = 3
+
+
+def conic_x_line(
+    conic: ArrayLike,
+    lines: ArrayLike,
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> tuple[NDArray[np.complex128], NDArray[np.int8]]:
+    """Intersects a conic with many lines.
+
+    Takes a 3x3 conic matrix and a 3-vector or an (N,3) array of lines.
+    Returns the intersection points as a (2,3) or an (N,2,3) array of complex
+    homogeneous coordinates, scaled so that the largest-magnitude coordinate
+    of each point is 1, together with a scalar or an (N,) array of
+    [LineIntersectionType](#batch.LineIntersectionType) codes. The points
+    have zero imaginary parts unless the intersection is complex.
+
+    The conic is scaled to unit Frobenius norm, and its adjugate is computed
+    only once. The type of each intersection follows from the sign of
+    `-lᵀ·adj(C)·l`, which counts as zero if its absolute value is at most
+    `tolerance·‖l‖²`. The points coincide for tangent lines.
+
+    *Exact counterpart*: [conic_x_line](#intersection.conic_x_line)
+    """
+    conic = np.asarray(conic, dtype=float)
+    if conic.shape != (3, 3):
+        raise ValueError("The conic must be a 3x3 matrix.")
+    lines = np.asarray(lines, dtype=float)
+    single = lines.ndim == 1
+    if single:
+        lines = lines[np.newaxis]
+    if lines.ndim != 2 or lines.shape[1] != 3:
+        raise ValueError("The lines must be a 3-vector or an (N,3) array.")
+
+    conic = _normalize_conics(conic[np.newaxis])[0]
+    adjugate = _adjugate(conic[np.newaxis])[0]
+    discriminants = _line_discriminants(adjugate, lines)
+    is_tangent = np.abs(discriminants) <= tolerance * _row_dot(lines, lines)
+    discriminants[is_tangent] = 0
+    points = _conic_x_lines(conic, lines, discriminants, tolerance=tolerance)
+    types = np.select(
+        [np.isnan(points).any(axis=(1, 2)), is_tangent, discriminants > 0],
+        [
+            LineIntersectionType.UNDEFINED.value,
+            LineIntersectionType.TANGENT.value,
+            LineIntersectionType.REAL.value,
+        ],
+        LineIntersectionType.COMPLEX.value,
+    ).astype(np.int8)
+    if single:
+        return points[0], types[0]
+    return points, types
+
+
+def conic_x_conic(
+    conics1: ArrayLike,
+    conics2: ArrayLike,
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> NDArray[np.complex128]:
+    """Intersects many pairs of conics.
+
+    Takes two 3x3 matrices or two (N,3,3) stacks of them. Returns the four
+    intersection points of each pair as a (4,3) or an (N,4,3) array of complex
+    homogeneous coordinates, scaled so that the largest-magnitude coordinate
+    of each point is 1. Real intersections have a zero imaginary part up to
+    rounding errors.
+
+    The conics are scaled to unit Frobenius norm, and the member of their
+    pencil with the larger determinant is used as the cubic's leading
+    coefficient. A real root of the cubic is computed in closed form, and the
+    corresponding degenerate conic is split to lines, which are intersected
+    with the other conic. The points are `nan` if the conics coincide or have
+    a common line component within `tolerance`.
+
+    *Exact counterpart*: [conic_x_conic](#intersection.conic_x_conic)
+    """
+    stack1, single = _as_conic_stack(conics1)
+    stack2, _ = _as_conic_stack(conics2)
+    if stack1.shape != stack2.shape:
+        raise ValueError("The conic stacks must have the same shape.")
+    stack1, stack2 = _normalize_conics(stack1), _normalize_conics(stack2)
+
+    # det(A + tB) = det(B)·t³ + tr(adj(B)·A)·t² + tr(adj(A)·B)·t + det(A).
+    # Let B be the conic with the larger determinant, so that the cubic is
+    # well-conditioned. If both are degenerate, A itself is split (t = 0).
+    swap = np.abs(np.linalg.det(stack1)) > np.abs(np.linalg.det(stack2))
+    a = np.where(swap[:, np.newaxis, np.newaxis], stack2, stack1)
+    b = np.where(swap[:, np.newaxis, np.newaxis], stack1, stack2)
+    adj_a, adj_b = _adjugate(a), _adjugate(b)
+    coefficients = np.stack(
+        [
+            np.linalg.det(b),
+            np.einsum("nij,nji->n", adj_b, a),
+            np.einsum("nij,nji->n", adj_a, b),
+            np.linalg.det(a),
+        ],
+        axis=1,
+    )
+    is_pencil_degenerate = np.abs(coefficients[:, 0]) <= tolerance
+    coefficients[is_pencil_degenerate] = (1, 0, 0, 0)
+    t = _real_cubic_root(coefficients)
+    degenerate = a + t[:, np.newaxis, np.newaxis] * b
+
+    line1, line2 = _split_to_lines(degenerate, tolerance=tolerance)
+    points = np.concatenate(
+        [
+            _conic_x_lines(
+                b,
+                line,
+                _line_discriminants(adj_b, line),
+                tolerance=tolerance,
+            )
+            for line in (line1, line2)
+        ],
+        axis=1,
+    )
+    # Coincident conics have a zero pencil member.
+    points[np.linalg.norm(degenerate, axis=(1, 2)) <= tolerance] = np.nan
+    return points[0] if single else points
+
+
+def conic_bounding_boxes(
+    conics: ArrayLike,
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> NDArray[np.float64]:
+    """Computes the axis-aligned bounding boxes of the real points of conics.
+
+    Takes a 3x3 matrix or an (N,3,3) stack of them, and returns a 4-vector or
+    an (N,4) array of `(x_min, y_min, x_max, y_max)` rows.
+
+    The boxes of ellipses touch their vertical and horizontal tangent lines:
+    their half-widths are `√(-F·c / (ac - b²))` and `√(-F·a / (ac - b²))`
+    around the center, where `F` is the value of the quadratic form at the
+    center. The boxes of parabolas are unbounded in the direction of their
+    axis, their finite sides follow from the tangency condition
+    `lᵀ·adj(C)·l = 0` of the vertical and horizontal lines. The boxes of
+    hyperbolas, line pairs and double lines are unbounded in both directions,
+    even if the lines are parallel to an axis. Imaginary ellipses, which have
+    no real points, get `nan` rows.
+
+    The matrices are scaled to unit Frobenius norm. Conics count as parabolas
+    if `|ac - b²| ≤ tolerance·(a² + 2b² + c²)`. Point conics get zero-size
+    boxes, because their `F` vanishes; it is only compared to its rounding
+    error when telling them apart from imaginary ellipses.
+    """
+    conic_stack, single = _as_conic_stack(conics)
+    conic_stack = _normalize_conics(conic_stack)
+    a, b, c = conic_stack[:, 0, 0], conic_stack[:, 0, 1], conic_stack[:, 1, 1]
+    d, e = conic_stack[:, 0, 2], conic_stack[:, 1, 2]
+    submatrix_det = a * c - b * b
+    is_central = np.abs(submatrix_det) > tolerance * (a * a + 2 * b * b + c * c)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        center = (
+            np.stack([b * e - c * d, b * d - a * e], axis=1)
+            / submatrix_det[
+                :,
+                np.newaxis,
+            ]
+        )
+        center_vectors = np.column_stack([center, np.ones(len(center))])
+        center_values = np.einsum(
+            "ni,nij,nj->n",
+            center_vectors,
+            conic_stack,
+            center_vectors,
+        )
+        # Bound the rounding error of the value by the magnitude of its terms.
+        is_point = np.abs(center_values) <= _ROUNDING_ERROR_FACTOR * np.einsum(
+            "ni,nij,nj->n",
+            np.abs(center_vectors),
+            np.abs(conic_stack),
+            np.abs(center_vectors),
+        )
+        squared_half_widths = (
+            -center_values[:, np.newaxis]
+            * np.stack([c, a], axis=1)
+            / submatrix_det[:, np.newaxis]
+        )
+        half_widths = np.sqrt(np.maximum(squared_half_widths, 0))
+
+        # For parabolas, -lᵀ·adj(C)·l ≥ 0 for the line x = s or y = s is the
+        # linear inequality 2·A₂ₖ·s ≥ Aₖₖ.
+        adjugates = _adjugate(conic_stack)
+        diagonal = adjugates[:, [0, 1], [0, 1]]
+        last_column = adjugates[:, :2, 2]
+        half_line_ends = diagonal / (2 * last_column)
+
+    is_elliptic = (is_central & (submatrix_det > 0))[:, np.newaxis]
+    is_half_line = ~is_central[:, np.newaxis] & (last_column != 0)
+    lower = np.select(
+        [is_elliptic, is_half_line & (last_column > 0)],
+        [center - half_widths, half_line_ends],
+        -np.inf,
+    )
+    upper = np.select(
+        [is_elliptic, is_half_line & (last_column < 0)],
+        [center + half_widths, half_line_ends],
+        np.inf,
+    )
+    boxes = np.concatenate([lower, upper], axis=1)
+    is_empty = (is_elliptic[:, 0] & ~is_point & (center_values * a > 0)) | (
+        ~is_central & ((last_column == 0) & (diagonal > 0)).any(axis=1)
+    )
+    boxes[is_empty] = np.nan
+    return boxes[0] if single else boxes
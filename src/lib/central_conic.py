@@ -7,6 +7,7 @@ from lib.conic_direction import (
     conjugate_axis_direction,
     focal_axis_direction,
 )
+from lib.invariants import conic_det, submatrix_det
 from lib.matrix import conic_matrix, max_eigenvalue, min_eigenvalue
 from lib.point import point_to_xy
 
@@ -110,9 +111,10 @@ def semi_axis_lengths(conic: Matrix) -> tuple[Expr, Expr]:
     [research/conic_properties/conic_radii.py](../src/research/conic_properties/conic_radii.py)
     """
     submatrix = conic[:2, :2]
+    det = conic_det(conic)
     return (
-        sqrt(-conic.det() / (min_eigenvalue(submatrix) * submatrix.det())),
-        sqrt(-conic.det() / (max_eigenvalue(submatrix) * submatrix.det())),
+        sqrt(-det / (min_eigenvalue(submatrix) * submatrix_det(conic))),
+        sqrt(-det / (max_eigenvalue(submatrix) * submatrix_det(conic))),
     )
 
 
@@ -125,7 +127,7 @@ def _selected_radius(conic: Matrix, eigenvalue_selector: Expr) -> Matrix:
     """
     a, _, _, b, c, _, _, _, _ = conic
     eigenvalue = (a + c + eigenvalue_selector * sqrt((a - c) ** 2 + 4 * b**2)) / 2
-    return sqrt(-conic.det() / (eigenvalue * (a * c - b * b)))
+    return sqrt(-conic_det(conic) / (eigenvalue * (a * c - b * b)))
 
 
 def primary_radius(conic: Matrix) -> Expr:
@@ -193,7 +195,7 @@ def radius_in_direction(
         sin_x = sin(angle)
 
     a, _, _, b, c, _, _, _, _ = conic
-    det = conic.det()
+    det = conic_det(conic)
     disc = a * c - b * b
 
     return sqrt(-det / (disc * (a * cos_x**2 + 2 * b * cos_x * sin_x + c * sin_x**2)))
@@ -219,7 +221,7 @@ def linear_eccentricity(conic: Matrix) -> Expr:
     """
     a, _, _, b, c, _, _, _, _ = conic
     eigenvalue_diff = sqrt((a - c) ** 2 + 4 * b**2)
-    return sqrt(Abs(conic.det()) * eigenvalue_diff) / Abs(a * c - b * b)
+    return sqrt(Abs(conic_det(conic)) * eigenvalue_diff) / Abs(a * c - b * b)
 
 
 def center_to_focus_vector(conic: Matrix) -> Matrix:
@@ -237,7 +239,7 @@ def center_to_focus_vector(conic: Matrix) -> Matrix:
     # Center-to-focus vector = [x, y] / √(x² + y²) * linear eccentricity
     # The √(x² + y²) = ∜((a-c)² + 4b²) factor vanishes.
     a, _, _, b, c, _, _, _, _ = conic
-    multiplier = sqrt(Abs(conic.det())) / (a * c - b * b)
+    multiplier = sqrt(Abs(conic_det(conic))) / (a * c - b * b)
     return Matrix([x * multiplier, y * multiplier])
 
 
@@ -326,4 +328,4 @@ def shrink_conic_to_zero(conic: Matrix) -> Matrix:
     [research/transformation/scale_conic_from_center.py](../src/research/transformation/scale_conic_from_center.py)
     """
     a, _, _, b, c, _, _, _, _ = conic
-    return conic - Matrix.diag([0, 0, conic.det() / (a * c - b * b)])
+    return conic - Matrix.diag([0, 0, conic_det(conic) / (a * c - b * b)])
@@ -2,6 +2,7 @@ from collections.abc import Sequence
 
 from sympy import Expr, Matrix, sqrt
 
+from lib.invariants import conic_adjugate, conic_det
 from lib.matrix import conic_matrix
 from lib.point import ORIGIN, point_to_xy
 
@@ -20,7 +21,7 @@ def circle_radius(circle: Matrix) -> Expr:
     [research/construction/director_circle.py](../src/research/construction/director_circle.py).
     """
     a, b, c = circle[0], circle[1], circle[4]
-    return sqrt(-circle.det() * (a + c) / 2) / (a * c - b * b)
+    return sqrt(-conic_det(circle) * (a + c) / 2) / (a * c - b * b)
 
 
 def director_circle(conic: Matrix) -> Matrix:
@@ -32,7 +33,7 @@ def director_circle(conic: Matrix) -> Matrix:
     *Formula*:
     [research/construction/director_circle.py](../src/research/construction/director_circle.py)
     """
-    a, _, _, _, c, _, d, e, f = conic.adjugate()
+    a, _, _, _, c, _, d, e, f = conic_adjugate(conic)
     return Matrix(
         [
             [-1, 0, d / f],
@@ -3,6 +3,7 @@ from collections.abc import Sequence
 from sympy import Expr, Function, Matrix, Poly, Symbol, abc, sqrt
 
 from lib.conic_direction import ConicNormFactor, focal_axis_direction
+from lib.invariants import conic_adjugate
 from lib.matrix import NonzeroCross
 from lib.point import point_to_vec3, point_to_xy
 
@@ -190,7 +191,7 @@ def pole_point(conic: Matrix, polar_line: Matrix) -> Matrix:
     *Pole / polar identity*: `conic * pole_point = polar_line`<br>
     *Source*: <https://en.wikipedia.org/wiki/Pole_and_polar#Calculating_the_pole_of_a_line>
     """
-    return conic.adjugate() * polar_line
+    return conic_adjugate(conic) * polar_line
 
 
 def polar_line(conic: Matrix, pole_point: Matrix | Sequence[Expr]) -> Matrix:
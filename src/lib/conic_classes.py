@@ -1,8 +1,10 @@
 from collections.abc import Callable
+from enum import Enum
 
 from sympy import Expr, Matrix, factor
 from sympy.core.logic import fuzzy_and, fuzzy_not, fuzzy_or
 
+from lib.invariants import conic_adjugate, conic_det, submatrix_det
 from lib.matrix import is_definite_matrix
 
 
@@ -20,7 +22,7 @@ def is_degenerate(
     determinant before it gets compared to zero. Returns `None` if the result
     is undecidable.
     """
-    return simplifier(conic.det()).is_zero
+    return simplifier(conic_det(conic)).is_zero
 
 
 def is_nondegenerate(
@@ -37,7 +39,7 @@ def is_nondegenerate(
     determinant before it gets compared to zero. Returns `None` if the result
     is undecidable.
     """
-    return simplifier(conic.det()).is_nonzero
+    return simplifier(conic_det(conic)).is_nonzero
 
 
 def is_central_conic(
@@ -51,7 +53,7 @@ def is_central_conic(
     conicness polynomial before it gets compared to zero. Returns `None` if
     the result is undecidable.
     """
-    return simplifier(conic[:2, :2].det()).is_nonzero
+    return simplifier(submatrix_det(conic)).is_nonzero
 
 
 def is_finite_conic(
@@ -65,7 +67,7 @@ def is_finite_conic(
     polynomial before it gets compared to zero. Returns `None` if the result
     is undecidable.
     """
-    return simplifier(conic[:2, :2].det()).is_positive
+    return simplifier(submatrix_det(conic)).is_positive
 
 
 def is_imaginary_ellipse(conic: Matrix) -> bool | None:
@@ -90,7 +92,7 @@ def is_ellipse(conic: Matrix) -> bool | None:
     return fuzzy_and(
         [
             is_nondegenerate(conic),
-            conic[:2, :2].det().is_positive,
+            submatrix_det(conic).is_positive,
             fuzzy_not(is_definite_matrix(conic)),
         ],
     )
@@ -106,7 +108,7 @@ def is_circle(conic: Matrix) -> bool | None:
         [
             (a - c).expand().is_zero,
             b.is_zero,
-            (a * conic.det()).is_negative,
+            (a * conic_det(conic)).is_negative,
         ],
     )
 
@@ -116,7 +118,7 @@ def is_parabola(conic: Matrix) -> bool | None:
 
     Returns `None` if undecidable.
     """
-    return fuzzy_and([is_nondegenerate(conic), conic[:2, :2].det().is_zero])
+    return fuzzy_and([is_nondegenerate(conic), submatrix_det(conic).is_zero])
 
 
 def is_hyperbola(conic: Matrix) -> bool | None:
@@ -124,7 +126,7 @@ def is_hyperbola(conic: Matrix) -> bool | None:
 
     Returns `None` if undecidable.
     """
-    return fuzzy_and([is_nondegenerate(conic), conic[:2, :2].det().is_negative])
+    return fuzzy_and([is_nondegenerate(conic), submatrix_det(conic).is_negative])
 
 
 def is_rectangular_hyperbola(conic: Matrix) -> bool | None:
@@ -187,7 +189,7 @@ def is_double_line(conic: Matrix) -> bool | None:
     # zero, or equivalently its adjugate is the zero matrix.
     return fuzzy_and(
         [
-            conic.adjugate().is_zero_matrix,
+            conic_adjugate(conic).is_zero_matrix,
             fuzzy_not(conic.is_zero_matrix),
         ],
     )
@@ -224,3 +226,88 @@ def is_finite_point_conic(conic: Matrix) -> bool | None:
     Returns `None` if undecidable.
     """
     return fuzzy_and([is_degenerate(conic), is_finite_conic(conic)])
+
+
+class ConicType(Enum):
+    """The mutually exclusive projective-Euclidean types of conics.
+
+    See [classify_conic](#conic_classes.classify_conic).
+    """
+
+    #: Real ellipse, including circles.
+    ELLIPSE = 0
+
+    #: Ellipse without real points.
+    IMAGINARY_ELLIPSE = 1
+
+    #: Parabola.
+    PARABOLA = 2
+
+    #: Hyperbola.
+    HYPERBOLA = 3
+
+    #: Two distinct real lines, including parallel lines and the ideal line.
+    LINE_PAIR = 4
+
+    #: Two complex conjugate lines meeting at a single real point.
+    POINT_CONIC = 5
+
+    #: Two coincident lines.
+    DOUBLE_LINE = 6
+
+    #: The zero matrix.
+    ZERO_MATRIX = 7
+
+
+def _classify_nondegenerate_conic(conic: Matrix) -> ConicType | None:
+    is_definite = is_definite_matrix(conic)
+    if is_definite:
+        return ConicType.IMAGINARY_ELLIPSE
+    submatrix_determinant = submatrix_det(conic)
+    if submatrix_determinant.is_zero:
+        return ConicType.PARABOLA
+    if submatrix_determinant.is_negative:
+        return ConicType.HYPERBOLA
+    if submatrix_determinant.is_positive and is_definite is False:
+        return ConicType.ELLIPSE
+    return None
+
+
+def _classify_degenerate_conic(conic: Matrix) -> ConicType | None:
+    # The diagonal of the adjugate is (cf - e², af - d², ac - b²). If any of
+    # them is positive, the conic splits to complex lines (see is_point_conic).
+    adjugate = conic_adjugate(conic)
+    adjugate_diagonal = [el.factor() for el in adjugate.diagonal()]
+    if any(el.is_positive for el in adjugate_diagonal):
+        return ConicType.POINT_CONIC
+
+    # The conic matrix has rank ≤ 1 iff its adjugate is the zero matrix.
+    is_rank_at_most_one = adjugate.is_zero_matrix
+    if is_rank_at_most_one is False:
+        if all(el.is_nonpositive for el in adjugate_diagonal):
+            return ConicType.LINE_PAIR
+        return None
+    if is_rank_at_most_one:
+        is_zero = conic.is_zero_matrix
+        if is_zero is not None:
+            return ConicType.ZERO_MATRIX if is_zero else ConicType.DOUBLE_LINE
+    return None
+
+
+def classify_conic(conic: Matrix) -> ConicType | None:
+    """Determines the type of a conic in a single pass.
+
+    Equivalent to evaluating the `is_*` predicates of this module one after
+    another, but computes the shared quantities (determinant, definiteness,
+    adjugate) only once. Note that unlike
+    [is_line_pair](#conic_classes.is_line_pair), which also accepts double
+    lines, `LINE_PAIR` only denotes distinct lines.
+
+    Returns `None` if the type of a symbolic conic is undecidable.
+    """
+    det = conic_det(conic)
+    if det.is_nonzero:
+        return _classify_nondegenerate_conic(conic)
+    if det.is_zero:
+        return _classify_degenerate_conic(conic)
+    return None
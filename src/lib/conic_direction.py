@@ -3,6 +3,7 @@ from typing import override
 from sympy import Expr, Function, I, Integer, Matrix, Piecewise, S, sign, sqrt
 
 from lib.conic_classes import is_point_conic
+from lib.invariants import conic_det
 
 
 class ConicNormFactor(Function):
@@ -29,7 +30,7 @@ class ConicNormFactor(Function):
     @classmethod
     def eval(cls, conic: Matrix) -> int | None:  # noqa: PLR0911
         """Internal implementation. Call `ConicNormFactor(conic)` directly."""
-        det = conic.det().factor()
+        det = conic_det(conic).factor()
         if det.is_positive:
             return 1
         if det.is_negative:
@@ -2,6 +2,7 @@ from collections.abc import Sequence
 
 from sympy import Expr, Function, Matrix, sqrt
 
+from lib.invariants import conic_adjugate
 from lib.matrix import NonzeroCross, conic_matrix, skew_matrix
 from lib.point import point_to_vec3
 
@@ -66,7 +67,7 @@ class SplitToLines(Function):
     @classmethod
     def eval(cls, conic: Matrix) -> tuple[Matrix, Matrix] | None:
         """Internal implementation. Call `SplitToLines(conic)` directly."""
-        adj = conic.adjugate()
+        adj = conic_adjugate(conic)
         a, c, f = adj.diagonal()
 
         # Lemma: If a symmetric 3x3 matrix is singular, the diagonal elements
@@ -109,7 +110,7 @@ class ExtractPoint(Function):
     @classmethod
     def eval(cls, degenerate_conic: Matrix) -> Matrix | None:
         """Internal implementation. Call `ExtractPoint(conic)` directly."""
-        adj = degenerate_conic.adjugate()
+        adj = conic_adjugate(degenerate_conic)
         if adj.is_zero_matrix:
             return Matrix.zeros(3, 1)
         for i in range(3):
@@ -0,0 +1,254 @@
+"""Robust detection of conics in noisy point clouds with RANSAC.
+
+[ConicDetector](#detection.ConicDetector) generates many conic hypotheses from
+random minimal samples of the points, keeps the one with the most inliers,
+refines it with a least-squares fit, then removes its inliers and repeats.
+"""
+
+import time
+from collections.abc import Collection
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from sympy import Matrix
+
+from lib.batch import classify_conic, conic_through_points, sampson_distances
+from lib.conic_classes import ConicType
+from lib.fitting import ConicFitter
+
+#: The approximate number of conic-point pairs scored in one vectorized step.
+_SCORING_CHUNK_ELEMENTS = 1 << 18
+
+
+class DetectedConic(NamedTuple):
+    """A conic found by [ConicDetector](#detection.ConicDetector)."""
+
+    #: The refined conic matrix.
+    conic: Matrix
+
+    #: The indices of the inlier points in the input array.
+    inliers: NDArray[np.intp]
+
+
+def _count_inliers(
+    conics: NDArray[np.float64],
+    points: NDArray[np.float64],
+    threshold: float,
+) -> NDArray[np.intp]:
+    """Counts the points within `threshold` of each conic of a stack."""
+    # Limit the size of the temporary (chunk size, 2, M) arrays.
+    chunk_size = max(1, _SCORING_CHUNK_ELEMENTS // max(1, len(points)))
+    return np.concatenate(
+        [
+            np.count_nonzero(
+                sampson_distances(conics[i : i + chunk_size], points) <= threshold,
+                axis=1,
+            )
+            for i in range(0, len(conics), chunk_size)
+        ],
+    )
+
+
+def _circles_through_points(
+    triples: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    """Computes the circles through an (N,3,2) array of point triples.
+
+    Returns an (N,3,3) array of circle matrices, and a mask of the collinear
+    triples, for which the matrices are unspecified.
+    """
+    x, y = triples[..., 0], triples[..., 1]
+    # x² + y² + 2dx + 2ey + f = 0 is linear in (d, e, f).
+    system = np.stack([2 * x, 2 * y, np.ones_like(x)], axis=-1)
+    det = np.linalg.det(system)
+    scale = np.ptp(triples, axis=1).max(axis=1) ** 2
+    is_collinear = np.abs(det) <= 1e-12 * np.maximum(scale, 1e-300)
+    system[is_collinear] = np.eye(3)
+    d, e, f = np.linalg.solve(system, -(x * x + y * y)[..., np.newaxis])[..., 0].T
+    ones, zeros = np.ones_like(d), np.zeros_like(d)
+    circles = np.stack([ones, zeros, d, zeros, ones, e, d, e, f], axis=1)
+    return circles.reshape(-1, 3, 3), is_collinear
+
+
+class ConicDetector:
+    """Finds conics in a point cloud with Random Sample Consensus (RANSAC).
+
+    For each conic to be detected, the detector
+
+    1. draws `hypotheses` random samples of 5 points, or 3 points if
+       `circles_only` is set, and constructs the conics through them with
+       [conic_through_points](#batch.conic_through_points);
+    2. drops the ambiguous conics, and the ones whose
+       [classify_conic](#batch.classify_conic) type is not in `conic_types`;
+    3. counts the points within `threshold`
+       [Sampson distance](#batch.sampson_distances) of each hypothesis;
+    4. refits the best hypothesis to its inliers with a
+       [ConicFitter](#fitting.ConicFitter), using an ellipse or a circle fit
+       when only those are allowed, and recomputes the inliers;
+    5. removes the inliers from the cloud, unless there are fewer than
+       `min_inliers` of them, in which case the detection stops.
+
+    If `processes` is greater than 1, the hypotheses are scored in a process
+    pool. The random samples are always drawn in the calling process, so the
+    results only depend on `seed`.
+
+    After each [detect](#detection.ConicDetector.detect) call,
+    `hypothesis_count` and `scoring_seconds` tell how many hypotheses were
+    scored and how long it took.
+    """
+
+    def __init__(  # noqa: PLR0913 (too-many-arguments)
+        self,
+        *,
+        threshold: float,
+        hypotheses: int = 1000,
+        min_inliers: int = 10,
+        conic_types: Collection[ConicType] | None = None,
+        circles_only: bool = False,
+        processes: int = 1,
+        seed: int | None = None,
+    ) -> None:
+        """Configures the detector."""
+        if threshold <= 0:
+            raise ValueError("The threshold must be positive.")
+        if hypotheses < 1:
+            raise ValueError("At least one hypothesis is required.")
+        self.threshold = threshold
+        self.hypotheses = hypotheses
+        self.min_inliers = min_inliers
+        self.conic_types = None if conic_types is None else frozenset(conic_types)
+        self.circles_only = circles_only
+        self.processes = processes
+        self._random = np.random.default_rng(seed)
+        #: The number of hypotheses scored during the last detection.
+        self.hypothesis_count = 0
+        #: The time spent on scoring hypotheses during the last detection.
+        self.scoring_seconds = 0.0
+
+    @property
+    def hypotheses_per_second(self) -> float:
+        """The scoring throughput of the last detection."""
+        if self.scoring_seconds == 0:
+            return 0.0
+        return self.hypothesis_count / self.scoring_seconds
+
+    def detect(self, points: ArrayLike, max_conics: int = 1) -> list[DetectedConic]:
+        """Detects up to `max_conics` conics in an (M,2) array of points.
+
+        Returns the conics in the order of detection, i.e. roughly by
+        decreasing number of inliers.
+        """
+        points = np.asarray(points, dtype=float)
+        if points.ndim != 2 or points.shape[1] != 2:
+            raise ValueError("The points must be an (M,2) array.")
+        self.hypothesis_count = 0
+        self.scoring_seconds = 0.0
+        remaining = np.arange(len(points))
+        detected = []
+        pool = ProcessPoolExecutor(self.processes) if self.processes > 1 else None
+        with pool or nullcontext():
+            while len(detected) < max_conics and len(remaining) >= self.min_inliers:
+                result = self._detect_one(points[remaining], pool)
+                if result is None:
+                    break
+                conic, inlier_mask = result
+                detected.append(DetectedConic(conic, remaining[inlier_mask]))
+                remaining = remaining[~inlier_mask]
+        return detected
+
+    def _detect_one(
+        self,
+        points: NDArray[np.float64],
+        pool: ProcessPoolExecutor | None,
+    ) -> tuple[Matrix, NDArray[np.bool_]] | None:
+        hypotheses = self._generate_hypotheses(points)
+        if len(hypotheses) == 0:
+            return None
+        counts = self._score(hypotheses, points, pool)
+        best = hypotheses[np.argmax(counts)]
+        inlier_mask = sampson_distances(best, points) <= self.threshold
+        if np.count_nonzero(inlier_mask) < self.min_inliers:
+            return None
+        conic = self._refine(points[inlier_mask])
+        if conic is None:
+            conic = Matrix(best)
+        else:
+            refined_mask = (
+                sampson_distances(np.array(conic, dtype=float), points)
+                <= self.threshold
+            )
+            if np.count_nonzero(refined_mask) >= np.count_nonzero(inlier_mask):
+                inlier_mask = refined_mask
+            else:
+                conic = Matrix(best)
+        return conic, inlier_mask
+
+    def _generate_hypotheses(
+        self,
+        points: NDArray[np.float64],
+    ) -> NDArray[np.float64]:
+        sample_size = 3 if self.circles_only else 5
+        if len(points) < sample_size:
+            return np.empty((0, 3, 3))
+        # Samples with repeated points are dropped below as ambiguous.
+        indices = self._random.integers(
+            len(points),
+            size=(self.hypotheses, sample_size),
+        )
+        if self.circles_only:
+            conics, is_invalid = _circles_through_points(points[indices])
+        else:
+            conics, is_invalid = conic_through_points(points[indices])
+        conics = conics[~is_invalid]
+        if self.conic_types is not None and len(conics) > 0:
+            allowed_codes = [conic_type.value for conic_type in self.conic_types]
+            conics = conics[np.isin(classify_conic(conics), allowed_codes)]
+        return conics
+
+    def _score(
+        self,
+        hypotheses: NDArray[np.float64],
+        points: NDArray[np.float64],
+        pool: ProcessPoolExecutor | None,
+    ) -> NDArray[np.intp]:
+        start = time.perf_counter()
+        if pool is None:
+            counts = _count_inliers(hypotheses, points, self.threshold)
+        else:
+            chunks = np.array_split(hypotheses, self.processes)
+            counts = np.concatenate(
+                list(
+                    pool.map(
+                        _count_inliers,
+                        chunks,
+                        [points] * len(chunks),
+                        [self.threshold] * len(chunks),
+                    ),
+                ),
+            )
+        self.scoring_seconds += time.perf_counter() - start
+        self.hypothesis_count += len(hypotheses)
+        return counts
+
+    def _refine(self, inliers: NDArray[np.float64]) -> Matrix | None:
+        """Fits a conic of an allowed type to the inliers, if possible."""
+        center = inliers.mean(axis=0)
+        scale = float(np.abs(inliers - center).max()) or 1.0
+        fitter = ConicFitter(center=center, scale=scale)
+        fitter.add_points(inliers)
+        try:
+            if self.circles_only:
+                return fitter.fit_circle()
+            if self.conic_types == {ConicType.ELLIPSE}:
+                return fitter.fit_ellipse()
+            conic = fitter.fit_conic()
+        except (ValueError, np.linalg.LinAlgError):
+            return None
+        if self.conic_types is not None:
+            conic_type = ConicType(int(classify_conic(np.array(conic, dtype=float))))
+            if conic_type not in self.conic_types:
+                return None
+        return conic
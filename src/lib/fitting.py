@@ -0,0 +1,205 @@
+"""Least-squares conic fitting to arbitrarily many noisy points.
+
+[ConicFitter](#fitting.ConicFitter) accumulates the 6x6 scatter matrix of the
+points' quadratic monomials, so it processes the points in a single pass in
+constant memory, and can return the best-fitting conic at any time.
+"""
+
+from typing import Literal
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from sympy import Matrix
+
+from lib.circle import circle
+from lib.matrix import conic_matrix
+
+#: Maps the `(a, d, e, f)` coefficients of the circle equation
+#: `a(x² + y²) + dx + ey + f = 0` to the general conic coefficients.
+_CIRCLE_BASIS = np.array(
+    [
+        [1, 0, 0, 0],
+        [0, 0, 0, 0],
+        [1, 0, 0, 0],
+        [0, 1, 0, 0],
+        [0, 0, 1, 0],
+        [0, 0, 0, 1],
+    ],
+    dtype=float,
+)
+
+#: The quadratic form of the ellipse constraint `4ac - b² = 1` on the
+#: quadratic coefficients `(a, b, c)`.
+_ELLIPSE_CONSTRAINT = np.array([[0, 0, 2], [0, -1, 0], [2, 0, 0]], dtype=float)
+
+#: The quadratic form of Pratt's constraint `d² + e² - 4af = 1` on the circle
+#: coefficients `(a, d, e, f)`.
+_PRATT_CONSTRAINT = np.array(
+    [[0, 0, 0, -2], [0, 1, 0, 0], [0, 0, 1, 0], [-2, 0, 0, 0]],
+    dtype=float,
+)
+
+#: The circle fit treats the points as collinear if the quadratic coefficient
+#: `a` is this small relative to the coefficient vector `(a, d, e, f)`, i.e.
+#: if the local radius or center distance exceeds about its reciprocal, or if
+#: Kåsa's normal matrix has a relative singular value this small.
+_COLLINEARITY_TOLERANCE = 1e-10
+
+
+class ConicFitter:
+    """Fits conics to a stream of points in the algebraic least-squares sense.
+
+    The conic equation `ax² + bxy + cy² + dx + ey + f = 0` is linear in the
+    coefficients, so the sum of its squared residuals is the quadratic form of
+    the scatter matrix `Σ vvᵀ` of the monomial vectors
+    `v = (x², xy, y², x, y, 1)`. The fitter accumulates this matrix, and
+    minimizes the quadratic form under different constraints:
+
+    - [fit_conic](#fitting.ConicFitter.fit_conic): the coefficient vector has
+      unit length;
+    - [fit_ellipse](#fitting.ConicFitter.fit_ellipse): `4ac - b² = 1`, which
+      guarantees an ellipse (Fitzgibbon, Pilu & Fisher 1999, in the
+      numerically stable formulation of Halíř & Flusser 1998);
+    - [fit_circle](#fitting.ConicFitter.fit_circle): `b = 0` and `a = c`, with
+      Pratt's (1987) or Kåsa's (1976) normalization.
+
+    The scatter matrix is badly conditioned if the points are far from the
+    origin or span many orders of magnitude. Passing the approximate `center`
+    and `scale` (e.g. the radius) of the data makes the fitter work in the
+    coordinate system `(p - center) / scale`, and transform the results back.
+    """
+
+    def __init__(
+        self,
+        *,
+        center: ArrayLike = (0, 0),
+        scale: float = 1,
+    ) -> None:
+        """Creates a fitter without any points."""
+        if scale <= 0:
+            raise ValueError("The scale must be positive.")
+        cx, cy = np.asarray(center, dtype=float)
+        self._to_local = np.array(
+            [[1 / scale, 0, -cx / scale], [0, 1 / scale, -cy / scale], [0, 0, 1]],
+        )
+        #: The number of points added so far.
+        self.point_count = 0
+        #: The 6x6 scatter matrix of the points in the local coordinate system.
+        self.scatter_matrix: NDArray[np.float64] = np.zeros((6, 6))
+
+    def add_points(self, points: ArrayLike) -> None:
+        """Adds a point or a chunk of points to the fit.
+
+        Takes the Euclidean or homogeneous coordinates of a single point, or an
+        (M,2) or (M,3) array of them.
+        """
+        points = np.asarray(points, dtype=float)
+        if points.ndim == 1:
+            points = points[np.newaxis]
+        if points.ndim != 2 or points.shape[1] not in (2, 3):
+            raise ValueError("The points must be an (M,2) or (M,3) array.")
+        if points.shape[1] == 2:
+            points = np.column_stack([points, np.ones(len(points))])
+        x, y, z = (points @ self._to_local.T).T
+        monomials = np.stack([x * x, x * y, y * y, x * z, y * z, z * z], axis=1)
+        self.scatter_matrix += monomials.T @ monomials
+        self.point_count += len(points)
+
+    def fit_conic(self) -> Matrix:
+        """Returns the conic matrix minimizing the algebraic error.
+
+        Requires at least 5 points. The result may be any conic type, including
+        degenerate ones.
+        """
+        self._require_points(5)
+        _, eigenvectors = np.linalg.eigh(self.scatter_matrix)
+        return self._to_conic_matrix(eigenvectors[:, 0])
+
+    def fit_ellipse(self) -> Matrix:
+        """Returns the ellipse minimizing the algebraic error.
+
+        Requires at least 5 points, not all on a line. Raises `ValueError` if
+        the fit is numerically unstable.
+        """
+        self._require_points(5)
+        quadratic = self.scatter_matrix[:3, :3]
+        mixed = self.scatter_matrix[:3, 3:]
+        linear = self.scatter_matrix[3:, 3:]
+        try:
+            # The optimal linear part for the given quadratic part.
+            linear_solver = -np.linalg.solve(linear, mixed.T)
+        except np.linalg.LinAlgError as error:
+            raise ValueError("The points are collinear.") from error
+        reduced = quadratic + mixed @ linear_solver
+        _, eigenvectors = np.linalg.eig(np.linalg.solve(_ELLIPSE_CONSTRAINT, reduced))
+        eigenvectors = eigenvectors.real
+        a, b, c = eigenvectors
+        candidates = np.flatnonzero(4 * a * c - b * b > 0)
+        if len(candidates) != 1:
+            raise ValueError("The ellipse fit is numerically unstable.")
+        quadratic_part = eigenvectors[:, candidates[0]]
+        linear_part = linear_solver @ quadratic_part
+        return self._to_conic_matrix(np.concatenate([quadratic_part, linear_part]))
+
+    def fit_circle(self, *, method: Literal["pratt", "kasa"] = "pratt") -> Matrix:
+        """Returns the circle minimizing the algebraic error.
+
+        Requires at least 3 points, not all on a line. Kåsa's method is slightly
+        faster, but biased towards smaller circles if the points only cover a
+        short arc.
+        """
+        self._require_points(3)
+        scatter = _CIRCLE_BASIS.T @ self.scatter_matrix @ _CIRCLE_BASIS
+        if method == "kasa":
+            # Fix a = 1, and solve the linear least-squares problem for d, e, f.
+            # The normal matrix is singular if and only if the points are
+            # collinear, but rounding errors rarely make it exactly singular.
+            try:
+                (d, e, f), _, rank, _ = np.linalg.lstsq(
+                    scatter[1:, 1:],
+                    -scatter[1:, 0],
+                    rcond=_COLLINEARITY_TOLERANCE,
+                )
+            except np.linalg.LinAlgError as error:
+                raise ValueError("The points are collinear.") from error
+            if rank < 3:
+                raise ValueError("The points are collinear.")
+            a = 1
+        elif method == "pratt":
+            eigenvalues, eigenvectors = np.linalg.eig(
+                np.linalg.solve(_PRATT_CONSTRAINT, scatter),
+            )
+            eigenvalues = eigenvalues.real
+            # The solution belongs to the smallest non-negative eigenvalue.
+            tolerance = 1e-12 * np.abs(eigenvalues).max()
+            index = np.argmin(np.where(eigenvalues > -tolerance, eigenvalues, np.inf))
+            a, d, e, f = eigenvectors[:, index].real
+        else:
+            msg = f"Unknown method: {method}"
+            raise ValueError(msg)
+        if abs(a) <= _COLLINEARITY_TOLERANCE * np.linalg.norm([a, d, e, f]):
+            raise ValueError("The points are collinear.")
+        local_center = np.array([-d / (2 * a), -e / (2 * a), 1])
+        local_radius = np.sqrt(d * d + e * e - 4 * a * f) / abs(2 * a)
+        cx, cy, _ = np.linalg.solve(self._to_local, local_center)
+        radius = local_radius / self._to_local[0, 0]
+        return circle((float(cx), float(cy)), float(radius))
+
+    def _require_points(self, count: int) -> None:
+        if self.point_count < count:
+            msg = f"At least {count} points are required."
+            raise ValueError(msg)
+
+    def _to_conic_matrix(self, coefficients: NDArray[np.float64]) -> Matrix:
+        """Converts local `(a, b, c, d, e, f)` coefficients to a conic matrix
+        in the original coordinate system.
+        """
+        a, b, c, d, e, f = coefficients
+        local_conic = np.array(
+            [[a, b / 2, d / 2], [b / 2, c, e / 2], [d / 2, e / 2, f]],
+        )
+        conic = self._to_local.T @ local_conic @ self._to_local
+        conic /= np.linalg.norm(conic)
+        return conic_matrix(
+            *(float(el) for el in conic[[0, 0, 1, 0, 1, 2], [0, 1, 1, 2, 2, 2]]),
+        )
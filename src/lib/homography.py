@@ -0,0 +1,273 @@
+"""Numeric homography estimation from many noisy point correspondences.
+
+[fit_homography](#homography.fit_homography) solves the normalized Direct
+Linear Transformation in the least-squares sense, and
+[ransac_homography](#homography.ransac_homography) makes it robust against
+outliers. Use [homography_from_samples](#transform.homography_from_samples) for
+the exact transformation of 4 symbolic correspondences.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from sympy import Matrix
+
+#: The approximate number of homography-point pairs scored in one vectorized
+#: step.
+_SCORING_CHUNK_ELEMENTS = 1 << 18
+
+#: The relative size of the triangle determinants below which 3 of 4 normalized
+#: points are considered collinear.
+_COLLINEARITY_TOLERANCE = 1e-9
+
+
+class EstimatedHomography(NamedTuple):
+    """A homography found by [ransac_homography](#homography.ransac_homography)."""
+
+    #: The refined 3x3 transformation matrix.
+    matrix: Matrix
+
+    #: The indices of the inlier correspondences.
+    inliers: NDArray[np.intp]
+
+
+def _euclidean_points(points: ArrayLike, name: str) -> NDArray[np.float64]:
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2 or points.shape[1] != 2:
+        msg = f"The {name} points must be an (M,2) array."
+        raise ValueError(msg)
+    return points
+
+
+def _correspondences(
+    source_points: ArrayLike,
+    target_points: ArrayLike,
+    min_count: int = 4,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    source = _euclidean_points(source_points, "source")
+    target = _euclidean_points(target_points, "target")
+    if len(source) != len(target):
+        raise ValueError("The source and target points must have the same length.")
+    if len(source) < min_count:
+        msg = f"At least {min_count} correspondences are required."
+        raise ValueError(msg)
+    return source, target
+
+
+def _normalization(points: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Returns Hartley's similarity moving the centroid of the points to the
+    origin and their mean distance from it to `√2`.
+    """
+    center = points.mean(axis=0)
+    mean_distance = np.hypot(*(points - center).T).mean()
+    factor = np.sqrt(2) / mean_distance if mean_distance > 0 else 1.0
+    return np.array(
+        [
+            [factor, 0, -factor * center[0]],
+            [0, factor, -factor * center[1]],
+            [0, 0, 1],
+        ],
+    )
+
+
+def _apply(
+    homographies: NDArray[np.float64],
+    points: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Maps (M,2) Euclidean points with a 3x3 or (N,3,3) stack of matrices to
+    (M,3) or (N,M,3) homogeneous points.
+    """
+    translations = homographies[..., np.newaxis, :, 2]
+    return points @ np.swapaxes(homographies[..., :2], -1, -2) + translations
+
+
+def _to_matrix(homography: NDArray[np.float64]) -> Matrix:
+    return Matrix((homography / np.linalg.norm(homography)).tolist())
+
+
+def transfer_distances(
+    homographies: ArrayLike,
+    source_points: ArrayLike,
+    target_points: ArrayLike,
+) -> NDArray[np.float64]:
+    """Computes the distances between the mapped source and the target points.
+
+    Takes a 3x3 matrix or an (N,3,3) stack of homographies, and two (M,2)
+    arrays of corresponding Euclidean points. Returns an (M,) or (N,M) array of
+    the distances `‖target - H(source)‖`, which are infinite for the source
+    points mapped to ideal points.
+    """
+    homographies = np.asarray(homographies, dtype=float)
+    source, target = _correspondences(source_points, target_points, min_count=0)
+    mapped = _apply(homographies, source)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distances = np.hypot(
+            mapped[..., 0] / mapped[..., 2] - target[:, 0],
+            mapped[..., 1] / mapped[..., 2] - target[:, 1],
+        )
+    return np.where(mapped[..., 2] == 0, np.inf, distances)
+
+
+def fit_homography(source_points: ArrayLike, target_points: ArrayLike) -> Matrix:
+    """Returns the homography minimizing the algebraic transfer error.
+
+    Takes two (M,2) arrays of at least 4 corresponding Euclidean points. Both
+    point sets are normalized with Hartley's similarity, which makes the
+    least-squares problem well conditioned, then the Direct Linear
+    Transformation equations `target × H·source = 0` are solved with a singular
+    value decomposition. Returns a 3x3 matrix of unit Frobenius norm.
+
+    With exactly 4 points in general position, the result is the exact
+    [homography_from_samples](#transform.homography_from_samples) up to
+    rounding errors and scaling.
+    """
+    source, target = _correspondences(source_points, target_points)
+    return _to_matrix(_fit(source, target))
+
+
+def _fit(
+    source: NDArray[np.float64],
+    target: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    source_normalization = _normalization(source)
+    target_normalization = _normalization(target)
+    s = _apply(source_normalization, source)
+    x, y = _apply(target_normalization, target)[:, :2].T
+    zeros = np.zeros_like(s)
+    # Two independent rows of the cross product per correspondence, linear in
+    # the row-major elements of H.
+    equations = np.concatenate(
+        [
+            np.hstack([zeros, -s, y[:, np.newaxis] * s]),
+            np.hstack([s, zeros, -x[:, np.newaxis] * s]),
+        ],
+    )
+    # With 4 correspondences, the null vector is only in the full V matrix.
+    _, _, vh = np.linalg.svd(equations, full_matrices=len(equations) < 9)
+    normalized = vh[-1].reshape(3, 3)
+    return np.linalg.solve(target_normalization, normalized @ source_normalization)
+
+
+def _homographies_from_samples(
+    source: NDArray[np.float64],
+    target: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    """Computes the homographies of an (N,4,2) array of source and target point
+    quadruples.
+
+    Returns an (N,3,3) array of matrices, and a mask of the samples with 3
+    collinear source or target points, for which the matrices are unspecified.
+    """
+    ones = np.ones((*source.shape[:-1], 1))
+    # (N,3,4) matrices of the homogeneous points, as in homography_from_samples.
+    s = np.swapaxes(np.concatenate([source, ones], axis=-1), -1, -2)
+    t = np.swapaxes(np.concatenate([target, ones], axis=-1), -1, -2)
+    columns = [[j for j in range(4) if j != i] for i in range(4)]
+    s_dets = np.stack([np.linalg.det(s[..., cols]) for cols in columns], axis=-1)
+    t_dets = np.stack([np.linalg.det(t[..., cols]) for cols in columns], axis=-1)
+    is_degenerate = (
+        np.abs(s_dets).min(axis=-1)
+        <= _COLLINEARITY_TOLERANCE * np.abs(s_dets).max(axis=-1)
+    ) | (
+        np.abs(t_dets).min(axis=-1)
+        <= _COLLINEARITY_TOLERANCE * np.abs(t_dets).max(axis=-1)
+    )
+    # T₃·diag(t₀/s₀, t₁/s₁, t₂/s₂)·S₃⁻¹, multiplied by s₀s₁s₂s₃ to avoid the
+    # divisions. The rows of the adjugate of S₃ are the cross products of its
+    # column pairs.
+    s0, s1, s2, _ = np.moveaxis(s_dets, -1, 0)
+    t0, t1, t2, _ = np.moveaxis(t_dets, -1, 0)
+    weights = np.stack([t0 * s1 * s2, t1 * s0 * s2, t2 * s0 * s1], axis=-1)
+    adjugate = np.stack(
+        [
+            np.cross(s[..., 1], s[..., 2]),
+            np.cross(s[..., 2], s[..., 0]),
+            np.cross(s[..., 0], s[..., 1]),
+        ],
+        axis=-2,
+    )
+    homographies = (t[..., :3] * weights[..., np.newaxis, :]) @ adjugate
+    homographies[is_degenerate] = np.eye(3)
+    return homographies, is_degenerate
+
+
+def _count_inliers(
+    homographies: NDArray[np.float64],
+    source: NDArray[np.float64],
+    target: NDArray[np.float64],
+    threshold: float,
+) -> NDArray[np.intp]:
+    """Counts the correspondences within `threshold` of each homography."""
+    # Limit the size of the temporary (chunk size, M, 3) arrays.
+    chunk_size = max(1, _SCORING_CHUNK_ELEMENTS // len(source))
+    return np.concatenate(
+        [
+            np.count_nonzero(
+                transfer_distances(homographies[i : i + chunk_size], source, target)
+                <= threshold,
+                axis=1,
+            )
+            for i in range(0, len(homographies), chunk_size)
+        ],
+    )
+
+
+def ransac_homography(  # noqa: PLR0913 (too-many-arguments)
+    source_points: ArrayLike,
+    target_points: ArrayLike,
+    *,
+    threshold: float,
+    hypotheses: int = 1000,
+    min_inliers: int = 4,
+    seed: int | None = None,
+) -> EstimatedHomography | None:
+    """Estimates a homography from correspondences with outliers.
+
+    Draws `hypotheses` random samples of 4 correspondences, computes their
+    exact homographies in a vectorized way, and keeps the one with the most
+    correspondences within `threshold`
+    [transfer distance](#homography.transfer_distances). Then refits it to its
+    inliers with [fit_homography](#homography.fit_homography), and recomputes
+    the inliers.
+
+    Returns `None` if no sample is in general position, or the best hypothesis
+    has fewer than `min_inliers` inliers. The result only depends on `seed`.
+    """
+    if threshold <= 0:
+        raise ValueError("The threshold must be positive.")
+    if hypotheses < 1:
+        raise ValueError("At least one hypothesis is required.")
+    source, target = _correspondences(source_points, target_points)
+    random = np.random.default_rng(seed)
+    # Samples with repeated points are dropped as degenerate.
+    indices = random.integers(len(source), size=(hypotheses, 4))
+    source_normalization = _normalization(source)
+    target_normalization = _normalization(target)
+    normalized_source = _apply(source_normalization, source)[:, :2]
+    normalized_target = _apply(target_normalization, target)[:, :2]
+    samples, is_degenerate = _homographies_from_samples(
+        normalized_source[indices],
+        normalized_target[indices],
+    )
+    samples = samples[~is_degenerate]
+    if len(samples) == 0:
+        return None
+    counts = _count_inliers(
+        np.linalg.solve(target_normalization, samples @ source_normalization),
+        source,
+        target,
+        threshold,
+    )
+    best = np.linalg.solve(
+        target_normalization,
+        samples[np.argmax(counts)] @ source_normalization,
+    )
+    inlier_mask = transfer_distances(best, source, target) <= threshold
+    if np.count_nonzero(inlier_mask) < max(min_inliers, 4):
+        return None
+    refined = _fit(source[inlier_mask], target[inlier_mask])
+    refined_mask = transfer_distances(refined, source, target) <= threshold
+    if np.count_nonzero(refined_mask) >= np.count_nonzero(inlier_mask):
+        best, inlier_mask = refined, refined_mask
+    return EstimatedHomography(_to_matrix(best), np.flatnonzero(inlier_mask))
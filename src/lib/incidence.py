@@ -1,9 +1,23 @@
-from collections.abc import Callable, Sequence
-
-from sympy import Expr, Matrix, expand
-from sympy.core.logic import fuzzy_not
-
-from lib.matrix import is_full_rank, quadratic_form, skew_matrix
+from collections.abc import Callable, Iterable, Sequence
+from fractions import Fraction
+from itertools import combinations
+from math import lcm
+
+import numpy as np
+from sympy import (
+    Expr,
+    Matrix,
+    Poly,
+    cancel,
+    expand,
+    fraction,
+    lcm_list,
+    parallel_poly_from_expr,
+    together,
+)
+
+from lib.batch import DEFAULT_TOLERANCE
+from lib.matrix import quadratic_form, skew_matrix
 from lib.point import point_to_vec3
 
 
@@ -83,7 +97,10 @@ def are_collinear(
     """Tells whether n points are collinear.
 
     Takes an optional `simplifier` callback that simplifies the collinearity
-    polynomial before it gets compared to zero. Returns `None` if undecidable.
+    polynomials before they get compared to zero. Returns `None` if
+    undecidable.
+
+    See [are_concurrent](#incidence.are_concurrent) for the algorithm.
     """
     if len(points) <= 2:
         return True
@@ -92,6 +109,30 @@ def are_collinear(
     return are_concurrent(lines, simplifier=simplifier)
 
 
+def _integer_vector(vector: Matrix) -> list[int] | None:
+    """Scales a vector of rational elements to integers, or returns `None` if
+    it has other elements.
+    """
+    if not all(el.is_Rational for el in vector):
+        return None
+    denominator = lcm(*(int(el.q) for el in vector))
+    return [int(el.p) * (denominator // int(el.q)) for el in vector]
+
+
+def _are_integer_lines_concurrent(lines: list[list[int]]) -> bool:
+    nonzero_lines = [line for line in lines if any(line)]
+    if not nonzero_lines:
+        return True
+    (a, b, c), *others = nonzero_lines
+    for index, (d, e, f) in enumerate(others):
+        # The intersection of the first nonzero line and this one.
+        x, y, z = b * f - c * e, c * d - a * f, a * e - b * d
+        if x or y or z:
+            return all(x * g + y * h + z * i == 0 for g, h, i in others[index + 1 :])
+    # All lines are multiples of the same line.
+    return True
+
+
 def are_concurrent(
     lines: Sequence[Matrix],
     *,
@@ -99,8 +140,16 @@ def are_concurrent(
 ) -> bool | None:
     """Tells whether n lines are concurrent, i.e. go through the same point.
 
-    Takes an optional callback that simplifies the concurrence polynomial
-    before it gets compared to zero. Returns `None` if undecidable.
+    Takes an optional callback that simplifies the concurrence polynomials
+    before they get compared to zero. Returns `None` if undecidable.
+
+    The lines are concurrent if all 3x3 determinants of their coordinates
+    vanish. It is enough to check the determinants with a fixed pivot pair:
+    the first nonzero line and the first other line whose cross product with it
+    doesn't vanish. The lines skipped in between are multiples of the first
+    one, so they go through any point on it. The check stops at the first line
+    that doesn't go through their intersection, so it takes `O(n)`
+    determinants. Rational lines are checked in integer arithmetic.
 
     Leverages the projective point-line duality, and uses the collinearity
     formula described at
@@ -108,29 +157,60 @@ def are_concurrent(
     """
     if len(lines) <= 2:
         return True
-    lines_as_matrix = Matrix.hstack(*lines)
-    if len(lines) == 3:
-        return lines_as_matrix.det().is_zero
-    return simplifier((lines_as_matrix * lines_as_matrix.T).det()).is_zero
+    integer_lines = [_integer_vector(line) for line in lines]
+    if None not in integer_lines:
+        return _are_integer_lines_concurrent(integer_lines)
+    # Skip the leading zero lines, which would make every cross product vanish.
+    start = next(
+        (
+            index
+            for index, line in enumerate(lines)
+            if not line.applyfunc(simplifier).is_zero_matrix
+        ),
+        None,
+    )
+    if start is None:
+        return True
+    first, *others = lines[start:]
+    for index, other in enumerate(others):
+        intersection = first.cross(other)
+        if intersection.applyfunc(simplifier).is_zero_matrix:
+            continue
+        is_undecided = False
+        for line in others[index + 1 :]:
+            is_zero = simplifier(intersection.dot(line)).is_zero
+            if is_zero is False:
+                return False
+            is_undecided |= is_zero is None
+        return None if is_undecided else True
+    # All lines are multiples of the same line.
+    return True
 
 
 def are_on_same_conic(
     points: Sequence[Matrix],
     *,
     simplifier: Callable[[Expr], Expr] = expand,
+    tolerance: float = DEFAULT_TOLERANCE,
 ) -> bool | None:
-    """Tells whether up to 6 points lie on the same conic section.
+    """Tells whether n points lie on the same conic section.
 
     Takes an optional `simplifier` callback that simplifies the incidence
     polynomial before it gets compared to zero. Returns `None` if undecidable.
 
+    Six points are checked with a single polynomial. More points are streamed
+    into a [ConconicityChecker](#incidence.ConconicityChecker), which uses
+    `tolerance` if they have floating-point coordinates.
+
     *Formula*: Jürgen Richter-Gebert, Perspectives on Projective Geometry,
     section 10.2 (Conics and Cross-Ratios)
     """
     if len(points) < 6:
         return True
     if len(points) > 6:
-        raise NotImplementedError
+        checker = ConconicityChecker(simplifier=simplifier, tolerance=tolerance)
+        checker.add_points(points)
+        return checker.result()
     points = [point_to_vec3(p) for p in points]
     d = []
     for p in points[0:2]:
@@ -141,8 +221,281 @@ def are_on_same_conic(
     return simplifier(incidence_poly).is_zero
 
 
+#: An element of the fraction-free echelon form: an integer, or a polynomial
+#: whose generators are the symbols and other non-rational subexpressions of
+#: the point coordinates.
+_EchelonElement = int | Poly
+
+
+def _exact_quotient(
+    dividend: _EchelonElement,
+    divisor: _EchelonElement,
+) -> _EchelonElement:
+    if isinstance(dividend, int) and isinstance(divisor, int):
+        return dividend // divisor
+    if isinstance(dividend, int):
+        dividend = Poly(dividend, *divisor.gens)
+    return dividend.exquo(divisor)
+
+
+class ConconicityChecker:
+    """Tells whether a stream of points lie on the same conic section.
+
+    The points `(x, y, z)` lie on a common conic if and only if the rows
+    `(x², xy, y², xz, yz, z²)` of their Veronese matrix have rank at most 5,
+    see [research/incidence/conconicity.py](../src/research/incidence/conconicity.py).
+    The checker maintains a row echelon form of this matrix, which is updated
+    with each new point instead of being recomputed:
+
+    - Points with rational coordinates are scaled to integers, and reduced
+      with Bareiss' fraction-free elimination in integer arithmetic.
+    - Symbolic points are multiplied by the common denominator of their
+      coordinates, and reduced the same way with exact polynomial division.
+      A reduced element whose generators are all symbols can be
+      used as a pivot if it is a nonzero polynomial, otherwise the checker
+      asks `simplifier` if it vanishes. If no pivot can be found, the result
+      becomes undecidable. The last pivot, a 6x6 minor, must be provably
+      nonzero, as in [are_on_same_conic](#incidence.are_on_same_conic).
+    - Once a point has floating-point coordinates, the checker switches to
+      the triangular factor of the QR decomposition of the Veronese matrix of
+      the normalized points. The points are on a conic if the smallest
+      singular value of this factor with unit column norms is at most
+      `tolerance` times the largest one. The coordinate system is translated
+      to the first finite floating-point point, because the monomials of
+      points far from the origin are nearly linearly dependent, and the
+      column scaling makes the result independent of the scale of the points.
+      The earlier exact rows are translated in rational arithmetic.
+
+    The floating-point mode still loses resolution if the first
+    floating-point point is an ideal point or far from the others, e.g. an
+    outlier, since then the translation doesn't center the points.
+
+    The exact modes stop reducing the points once 6 independent rows are
+    found.
+    """
+
+    def __init__(
+        self,
+        *,
+        simplifier: Callable[[Expr], Expr] = expand,
+        tolerance: float = DEFAULT_TOLERANCE,
+    ) -> None:
+        """Creates a checker without any points."""
+        self.simplifier = simplifier
+        self.tolerance = tolerance
+        #: The number of points added so far.
+        self.point_count = 0
+        self._echelon_rows: list[list[_EchelonElement]] = []
+        self._pivot_columns: list[int] = []
+        self._is_undecided = False
+        self._triangular = None
+        self._origin = (0.0, 0.0)
+
+    @property
+    def rank(self) -> int:
+        """The rank of the Veronese matrix of the points added so far.
+
+        It is a lower bound if the result is undecidable.
+        """
+        if self._triangular is None:
+            return len(self._echelon_rows)
+        # Scaling the columns doesn't change the rank, but it balances the
+        # monomials of points far from the origin, e.g. x² and z².
+        column_norms = np.linalg.norm(self._triangular, axis=0)
+        scaled = self._triangular / np.where(column_norms > 0, column_norms, 1)
+        singular_values = np.linalg.svd(scaled, compute_uv=False)
+        return int(
+            np.count_nonzero(
+                singular_values > self.tolerance * singular_values.max(initial=0),
+            ),
+        )
+
+    def add_point(self, point: Matrix | Sequence[Expr]) -> None:
+        """Adds the Euclidean or homogeneous coordinates of a point."""
+        self.point_count += 1
+        point = point_to_vec3(point)
+        if self._triangular is None and any(el.is_Float for el in point):
+            self._switch_to_floats(point)
+        if self._triangular is not None:
+            self._add_float_point(point)
+        elif len(self._echelon_rows) < 6:
+            self._add_exact_point(point)
+
+    def add_points(self, points: Iterable[Matrix | Sequence[Expr]]) -> None:
+        """Adds the points of an iterable, e.g. a generator."""
+        for point in points:
+            self.add_point(point)
+
+    def result(self) -> bool | None:
+        """Tells whether the points added so far lie on the same conic.
+
+        Returns `None` if undecidable.
+        """
+        if self.rank == 6:
+            return False
+        return None if self._is_undecided else True
+
+    def _add_exact_point(self, point: Matrix) -> None:
+        row = self._reduce(self._veronese_row(point))
+        if len(self._echelon_rows) == 5:
+            # Only the 6x6 minor in the last column is left.
+            (column,) = set(range(6)) - set(self._pivot_columns)
+            is_zero = self._is_zero(row[column])
+            if is_zero is False:
+                self._add_echelon_row(row, column)
+            self._is_undecided |= is_zero is None
+            return
+        undecided_column = None
+        for column, value in enumerate(row):
+            is_zero = self._is_zero_function(value)
+            if is_zero is False:
+                self._add_echelon_row(row, column)
+                return
+            if is_zero is None and undecided_column is None:
+                undecided_column = column
+        if undecided_column is not None:
+            self._add_echelon_row(row, undecided_column)
+            self._is_undecided = True
+
+    @staticmethod
+    def _veronese_row(point: Matrix) -> list[_EchelonElement]:
+        coordinates = _integer_vector(point)
+        if coordinates is None:
+            # Clear the denominators, so that they don't become generators.
+            numerators, denominators = zip(
+                *(fraction(together(el)) for el in point),
+                strict=True,
+            )
+            common_denominator = lcm_list(denominators)
+            coordinates, _ = parallel_poly_from_expr(
+                [
+                    numerator * cancel(common_denominator / denominator)
+                    for numerator, denominator in zip(
+                        numerators,
+                        denominators,
+                        strict=True,
+                    )
+                ],
+            )
+        x, y, z = coordinates
+        return [x * x, x * y, y * y, x * z, y * z, z * z]
+
+    def _reduce(self, row: list[_EchelonElement]) -> list[_EchelonElement]:
+        previous_pivot = 1
+        for echelon_row, column in zip(
+            self._echelon_rows,
+            self._pivot_columns,
+            strict=True,
+        ):
+            pivot, factor = echelon_row[column], row[column]
+            row = [
+                _exact_quotient(pivot * a - factor * b, previous_pivot)
+                for a, b in zip(row, echelon_row, strict=True)
+            ]
+            previous_pivot = pivot
+        return row
+
+    def _add_echelon_row(self, row: list[_EchelonElement], column: int) -> None:
+        self._echelon_rows.append(row)
+        self._pivot_columns.append(column)
+
+    def _is_zero(self, value: _EchelonElement) -> bool | None:
+        """Tells whether a reduced element is zero for all values of the
+        symbols.
+        """
+        if isinstance(value, int) or value.is_zero:
+            return value == 0
+        return self.simplifier(value.as_expr()).is_zero
+
+    def _is_zero_function(self, value: _EchelonElement) -> bool | None:
+        """Tells whether a reduced element vanishes identically, i.e. it can't
+        be a pivot.
+        """
+        if isinstance(value, int) or value.is_zero:
+            return value == 0
+        if all(gen.is_Symbol for gen in value.gens):
+            return False
+        return self.simplifier(value.as_expr()).is_zero
+
+    def _switch_to_floats(self, point: Matrix) -> None:
+        if (
+            self._is_undecided
+            or any(isinstance(el, Poly) for row in self._echelon_rows for el in row)
+            or any(not el.is_Number for el in point)
+        ):
+            raise ValueError("Floating-point and symbolic points can't be mixed.")
+        x, y, z = (float(el) for el in point)
+        if z != 0:
+            self._origin = (x / z, y / z)
+        ox, oy = (Fraction(el) for el in self._origin)
+        rows = [_translate_veronese_row(row, ox, oy) for row in self._echelon_rows]
+        rows = [[float(el / max(abs(el) for el in row)) for el in row] for row in rows]
+        self._triangular = np.linalg.qr(np.array(rows).reshape(-1, 6), mode="r")
+
+    def _add_float_point(self, point: Matrix) -> None:
+        if any(not el.is_Number for el in point):
+            raise ValueError("Floating-point and symbolic points can't be mixed.")
+        x, y, z = np.array(point, dtype=float).ravel()
+        ox, oy = self._origin
+        coordinates = np.array([x - ox * z, y - oy * z, z])
+        x, y, z = coordinates / np.linalg.norm(coordinates)
+        row = [x * x, x * y, y * y, x * z, y * z, z * z]
+        self._triangular = np.linalg.qr(
+            np.vstack([self._triangular, row]),
+            mode="r",
+        )
+
+
+def _translate_veronese_row(
+    row: list[int],
+    ox: Fraction,
+    oy: Fraction,
+) -> list[Fraction]:
+    """Transforms a linear combination of Veronese rows `(x², xy, y², xz, yz,
+    z²)` to the coordinate system whose origin is at `(ox, oy)`.
+    """
+    xx, xy, yy, xz, yz, zz = row
+    return [
+        xx - 2 * ox * xz + ox * ox * zz,
+        xy - oy * xz - ox * yz + ox * oy * zz,
+        yy - 2 * oy * yz + oy * oy * zz,
+        xz - ox * zz,
+        yz - oy * zz,
+        Fraction(zz),
+    ]
+
+
+def _may_be_independent(
+    rows: list[list[int | Expr]],
+    simplifier: Callable[[Expr], Expr],
+) -> bool:
+    """Tells whether the rows of a kx4 matrix may be linearly independent,
+    i.e. not all of its maximal minors are provably zero.
+    """
+    matrix = Matrix(rows)
+    minors = Matrix(
+        [
+            matrix[:, list(columns)].det()
+            for columns in combinations(range(4), len(rows))
+        ],
+    )
+    return minors.applyfunc(simplifier).is_zero_matrix is not True
+
+
+def _cocircularity_normal(references: list[list[int | Expr]]) -> list[int | Expr]:
+    """Returns the vector whose dot product with a row of the cocircularity
+    matrix is the 4x4 determinant of the row and the 3 reference rows.
+    """
+    matrix = Matrix(references)
+    normal = [
+        (-1) ** (column + 1) * matrix[:, [c for c in range(4) if c != column]].det()
+        for column in range(4)
+    ]
+    return [int(el) if el.is_Integer else el for el in normal]
+
+
 def are_cocircular(
-    points: Sequence[Matrix],
+    points: Iterable[Matrix | Sequence[Expr]],
     *,
     simplifier: Callable[[Expr], Expr] = expand,
 ) -> bool | None:
@@ -151,22 +504,42 @@ def are_cocircular(
     Note that four collinear points, as well as three collinear points and an
     arbitrary ideal point are also considered cocircular.
 
+    The points are cocircular if the rows `(xz, yz, x² + y², z²)` of their
+    cocircularity matrix have rank at most 3. The first 3 points with
+    independent rows are the reference points, and each further point is
+    checked with the 4x4 determinant of its row and the reference rows. The
+    points are consumed one by one, so they can come from a generator, and
+    the check stops at the first point that is provably not on the circle of
+    the reference points. Rational points are checked in integer arithmetic.
+
     Takes an optional `simplifier` callback that simplifies the cocircularity
-    determinant before it gets compared to zero. Returns `None` if undecidable.
+    determinants before they get compared to zero. Returns `None` if
+    undecidable.
 
     *Formula*: [Measuring cocircularity in a point set](
     https://upcommons.upc.edu/entities/publication/2001f976-4a50-4415-a706-79bbb2ca40bc)<br>
     *Own research*:
     [research/incidence/cocircularity.py](../src/research/incidence/cocircularity.py)
     """
-    if len(points) < 4:
-        return True
-
-    cc_matrix_elements = []
-    for p in points:
-        x, y, z = point_to_vec3(p)
-        cc_matrix_elements.append([x * z, y * z, x**2 + y**2, z**2])
-
-    cocircularity_matrix = Matrix(cc_matrix_elements)
-
-    return fuzzy_not(is_full_rank(cocircularity_matrix, simplifier=simplifier))
+    references = []
+    normal = None
+    is_undecided = False
+    for point in points:
+        vector = point_to_vec3(point)
+        x, y, z = _integer_vector(vector) or vector
+        row = [x * z, y * z, x * x + y * y, z * z]
+        if normal is None:
+            if _may_be_independent([*references, row], simplifier):
+                references.append(row)
+                if len(references) == 3:
+                    normal = _cocircularity_normal(references)
+            continue
+        determinant = sum(a * b for a, b in zip(normal, row, strict=True))
+        if isinstance(determinant, int):
+            is_zero = determinant == 0
+        else:
+            is_zero = simplifier(determinant).is_zero
+        if is_zero is False:
+            return False
+        is_undecided |= is_zero is None
+    return None if is_undecided else True
@@ -1,8 +1,23 @@
 from collections.abc import Sequence
 
-from sympy import Expr, Matrix, Piecewise, nan, sqrt
+from sympy import (
+    Dummy,
+    Expr,
+    Function,
+    Matrix,
+    Piecewise,
+    Poly,
+    Rational,
+    count_ops,
+    nan,
+    real_roots,
+    roots,
+    sqrt,
+)
 from sympy.core.numbers import NaN
 
+from lib.degenerate_conic import SplitToLines
+from lib.invariants import conic_det
 from lib.matrix import NonzeroCross, skew_matrix
 
 
@@ -28,9 +43,22 @@ def conic_x_line(
      - Returns an unevaluated `sympy.Function` for symbolic conics.
      - Returns `None` if the conic contains the entire line.
 
+    If all elements of the conic and the line are rational numbers, the
+    nonzero line coordinate and matrix element are found with plain
+    comparisons instead of a `Piecewise` expression and assumption queries.
+
     *Algorithm*: Jürgen Richter-Gebert, Perspectives on Projective Geometry,
     section 11.3
     """
+    if all(isinstance(el, Rational) for el in (*conic, *line)):
+        return _rational_conic_x_line(conic, line)
+    return _symbolic_conic_x_line(conic, line)
+
+
+def _symbolic_conic_x_line(
+    conic: Matrix,
+    line: Matrix,
+) -> tuple[Matrix | Sequence[Expr], Matrix | Sequence[Expr]] | NaN:
     skew_mat = skew_matrix(line)
     m = skew_mat.T * conic * skew_mat
     a, b, c = line
@@ -46,3 +74,109 @@ def conic_x_line(
     if isinstance(points, (NonzeroCross, NaN)):
         return points
     return (points[0], points[1].T)
+
+
+def _rational_conic_x_line(
+    conic: Matrix,
+    line: Matrix,
+) -> tuple[Matrix, Matrix] | NaN:
+    """Same as `_symbolic_conic_x_line` for rational inputs, picking the same
+    pivots. Works with nested lists, because indexing sympy matrices is slow.
+    """
+    a, b, c = line
+    pivot = next((i for i, coord in enumerate((a, b, c)) if coord != 0), None)
+    if pivot is None:
+        return nan
+    skew_mat = [[0, -c, b], [c, 0, -a], [-b, a, 0]]
+    rows = [list(conic.row(i)) for i in range(3)]
+    # m = skew_matᵀ * conic * skew_mat
+    cs = [
+        [sum(r[k] * skew_mat[k][j] for k in range(3)) for j in range(3)] for r in rows
+    ]
+    m = [
+        [sum(skew_mat[k][i] * cs[k][j] for k in range(3)) for j in range(3)]
+        for i in range(3)
+    ]
+    i, j = (k for k in range(3) if k != pivot)
+    alpha = sqrt(m[i][j] * m[j][i] - m[i][i] * m[j][j]) / line[pivot]
+
+    def is_nonzero(row: int, col: int) -> bool:
+        if alpha.is_Rational:
+            return m[row][col] + alpha * skew_mat[row][col] != 0
+        # An irrational or imaginary multiple of a nonzero rational number
+        # doesn't cancel out.
+        return m[row][col] != 0 or skew_mat[row][col] != 0
+
+    k = next((k for k in range(9) if is_nonzero(k // 3, k % 3)), None)
+    if k is None:
+        return nan
+    row, col = divmod(k, 3)
+    return (
+        Matrix([m[r][col] + alpha * skew_mat[r][col] for r in range(3)]),
+        Matrix([m[row][c] + alpha * skew_mat[row][c] for c in range(3)]),
+    )
+
+
+def _pencil_root(conic1: Matrix, conic2: Matrix) -> Expr:
+    """Finds a `t` for which `conic1 + t * conic2` is degenerate.
+
+    Prefers rational, then real, then the simplest roots of the cubic
+    `det(conic1 + t * conic2) = 0`.
+    """
+    t = Dummy("t")
+    pencil_det = Poly((conic1 + t * conic2).det(), t)
+    if pencil_det.domain.is_ZZ or pencil_det.domain.is_QQ:
+        candidates = real_roots(pencil_det)
+    else:
+        candidates = roots(pencil_det, multiple=True)
+    return min(
+        candidates,
+        key=lambda r: (r.is_rational is not True, r.is_real is not True, count_ops(r)),
+    )
+
+
+def conic_x_conic(
+    conic1: Matrix,
+    conic2: Matrix,
+) -> tuple[Matrix, Matrix, Matrix, Matrix] | NaN | Function:
+    """Intersects two conics. Returns four points.
+
+    Special cases:
+     - Some of the points coincide if the conics touch each other.
+     - The points are complex if the conics don't intersect at real points.
+     - Returns `nan` if the conics coincide or have a common line component.
+     - Returns an unevaluated `sympy.Function` if the degenerate member of the
+       conic pencil can't be split to lines symbolically, which is typical for
+       symbolic conics.
+
+    *Algorithm*: Every conic through the intersection points is a member of
+    the pencil `conic1 + t * conic2`. The roots of the cubic
+    `det(conic1 + t * conic2) = 0` give its degenerate members, i.e. line
+    pairs through the four points. The function splits one of them with
+    [SplitToLines](#degenerate_conic.SplitToLines), and intersects the lines
+    with the other conic using [conic_x_line](#intersection.conic_x_line).
+    """
+    if conic_det(conic2) == 0:
+        degenerate, other = conic2, conic1
+    elif conic_det(conic1) == 0:
+        degenerate, other = conic1, conic2
+    else:
+        root = _pencil_root(conic1, conic2)
+        degenerate = conic1 + root * conic2
+        other = conic2
+        # Splitting a conic with radicals of symbolic expressions is slow and
+        # rarely succeeds.
+        if root.free_symbols and not root.is_rational_function():
+            return SplitToLines(degenerate, evaluate=False)
+    if degenerate.is_zero_matrix:
+        return nan
+    lines = SplitToLines(degenerate)
+    if isinstance(lines, SplitToLines):
+        return lines
+    points = []
+    for line in lines:
+        line_points = conic_x_line(other, line)
+        if not isinstance(line_points, tuple):
+            return line_points
+        points.extend(line_points)
+    return tuple(points)
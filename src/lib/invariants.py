@@ -0,0 +1,63 @@
+"""Memoized conic invariants.
+
+Many conic properties depend on the same few derived quantities: the
+determinant, the adjugate and the determinant of the upper-left 2x2 submatrix
+of the conic matrix. Computing them for symbolic conics is expensive, so this
+module caches them in a bounded LRU cache keyed on the immutable version of the
+conic matrix.
+"""
+
+from functools import lru_cache
+
+from sympy import Expr, ImmutableMatrix, Matrix
+
+#: The maximum number of conics whose invariants are kept in memory.
+INVARIANT_CACHE_SIZE: int = 1024
+
+
+@lru_cache(maxsize=INVARIANT_CACHE_SIZE)
+def _det(matrix: ImmutableMatrix) -> Expr:
+    return matrix.det()
+
+
+@lru_cache(maxsize=INVARIANT_CACHE_SIZE)
+def _adjugate(matrix: ImmutableMatrix) -> ImmutableMatrix:
+    return matrix.adjugate()
+
+
+@lru_cache(maxsize=INVARIANT_CACHE_SIZE)
+def _submatrix_det(matrix: ImmutableMatrix) -> Expr:
+    return matrix[:2, :2].det()
+
+
+def conic_det(conic: Matrix) -> Expr:
+    """Returns the determinant of a conic matrix.
+
+    Equivalent to `conic.det()`, but the result is memoized.
+    """
+    return _det(ImmutableMatrix(conic))
+
+
+def conic_adjugate(conic: Matrix) -> Matrix:
+    """Returns the adjugate of a conic matrix.
+
+    Equivalent to `conic.adjugate()`, but the result is memoized.
+    """
+    return _adjugate(ImmutableMatrix(conic)).as_mutable()
+
+
+def submatrix_det(conic: Matrix) -> Expr:
+    """Returns the determinant of the upper-left 2x2 submatrix of a conic
+    matrix.
+
+    For a conic `ax² + 2bxy + cy² + 2dx + 2ey + f = 0` it equals `ac - b²`.
+    Equivalent to `conic[:2, :2].det()`, but the result is memoized.
+    """
+    return _submatrix_det(ImmutableMatrix(conic))
+
+
+def clear_invariant_cache() -> None:
+    """Empties the memoized invariant cache."""
+    _det.cache_clear()
+    _adjugate.cache_clear()
+    _submatrix_det.cache_clear()
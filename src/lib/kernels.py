@@ -0,0 +1,366 @@
+# fmt: off
+"""Vectorized NumPy kernels of closed-form conic formulas.
+
+*Generated by scripts/generate_kernels.py. Do not edit.*
+
+Each kernel takes the elements `a, b, c, d, e, f` of conic matrices (see
+[conic_matrix](#matrix.conic_matrix)) as NumPy arrays of the same or
+broadcastable shapes, and evaluates the formula of its symbolic counterpart
+with common subexpressions computed once. Use
+[conic_coefficients](#kernels.conic_coefficients) to split an (N,3,3) conic
+stack into these arrays.
+
+Kernels returning a scalar per conic return an array of the broadcast shape,
+the others append the shape of their symbolic result, e.g. `(N,2)` for 2D
+vectors or `(N,3,3)` for matrices. Results that are complex for real inputs
+evaluate to `nan`, unless the inputs are complex arrays.
+"""
+
+import numpy  # noqa: ICN001 (the sympy printer emits numpy.*)
+from numpy.typing import ArrayLike, NDArray
+
+
+def conic_coefficients(conics: ArrayLike) -> tuple[NDArray[numpy.float64], ...]:
+    """Splits a stack of conic matrices into the arrays `a, b, c, d, e, f`.
+
+    Takes a 3x3 matrix or an (...,3,3) array, and returns six arrays of shape
+    `(...)`.
+    """
+    conics = numpy.asarray(conics, dtype=float)
+    if conics.shape[-2:] != (3, 3):
+        raise ValueError("The conics must be an (...,3,3) array.")
+    return (
+        conics[..., 0, 0],
+        conics[..., 0, 1],
+        conics[..., 1, 1],
+        conics[..., 0, 2],
+        conics[..., 1, 2],
+        conics[..., 2, 2],
+    )
+
+
+def _stack(elements: list[ArrayLike], shape: tuple[int, ...]) -> NDArray:
+    """Stacks broadcast element arrays along new trailing axes of `shape`."""
+    arrays = numpy.broadcast_arrays(*elements)
+    return numpy.stack(arrays, axis=-1).reshape(arrays[0].shape + shape)
+
+
+def _conic_norm_factor(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [ConicNormFactor](#conic_direction.ConicNormFactor)."""
+    det = a * (c * f - e * e) - b * (b * f - d * e) + d * (b * e - c * d)
+    # Some 2x2 principal minor of a point conic's matrix is positive.
+    is_point_conic = (det == 0) & (
+        (c * f - e * e > 0) | (a * f - d * d > 0) | (a * c - b * b > 0)
+    )
+    has_positive_diagonal = (a > 0) | (c > 0) | (f > 0)
+    degenerate_factor = numpy.where(is_point_conic & has_positive_diagonal, -1, 1)
+    return numpy.where(det == 0, degenerate_factor, numpy.sign(det))
+
+
+def conic_center(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [conic_center](#central_conic.conic_center)."""
+    x0 = (a*c - b**2)**(-1.0)
+    return _stack([x0*(b*e - c*d), x0*(-a*e + b*d)], (2,))
+
+
+def semi_axis_lengths(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [semi_axis_lengths](#central_conic.semi_axis_lengths)."""
+    x0 = b**2
+    x1 = (1/2)*numpy.sqrt(4*x0 + (a - c)**2)
+    x2 = (1/2)*a + (1/2)*c
+    x3 = a*c
+    x4 = (a*e**2 - 2*b*d*e + c*d**2 + f*x0 - f*x3)/(-x0 + x3)
+    return _stack([numpy.sqrt(x4/(-x1 + x2)), numpy.sqrt(x4/(x1 + x2))], (2,))
+
+
+def primary_radius(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [primary_radius](#central_conic.primary_radius)."""
+    norm_sign = _conic_norm_factor(a, b, c, d, e, f)
+    x0 = a*c
+    x1 = b**2
+    return numpy.sqrt((a*e**2 - 2*b*d*e + c*d**2 - f*x0 + f*x1)/((x0 - x1)*((1/2)*a + (1/2)*c + (1/2)*norm_sign*numpy.sqrt(4*x1 + (a - c)**2))))
+
+
+def secondary_radius(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [secondary_radius](#central_conic.secondary_radius)."""
+    norm_sign = _conic_norm_factor(a, b, c, d, e, f)
+    x0 = a*c
+    x1 = b**2
+    return numpy.sqrt((a*e**2 - 2*b*d*e + c*d**2 - f*x0 + f*x1)/((x0 - x1)*((1/2)*a + (1/2)*c - 1/2*norm_sign*numpy.sqrt(4*x1 + (a - c)**2))))
+
+
+def linear_eccentricity(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [linear_eccentricity](#central_conic.linear_eccentricity)."""
+    x0 = a*c
+    x1 = b**2
+    return (4*x1 + (a - c)**2)**(1/4)*numpy.sqrt(abs(a*e**2 - 2*b*d*e + c*d**2 - f*x0 + f*x1))/abs(x0 - x1)
+
+
+def center_to_focus_vector(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [center_to_focus_vector](#central_conic.center_to_focus_vector)."""
+    norm_sign = _conic_norm_factor(a, b, c, d, e, f)
+    x0 = a - c
+    x1 = (1/2)*norm_sign*x0
+    x2 = b**2
+    x3 = numpy.sqrt(x0**2 + 4*x2)
+    x4 = a*c
+    x5 = numpy.sqrt(abs(a*e**2 - 2*b*d*e + c*d**2 + f*x2 - f*x4))/(-x2 + x4)
+    return _stack([x5*numpy.sqrt(x1 + (1/2)*x3), x5*numpy.sqrt(-x1 + (1/2)*x3)*numpy.select([numpy.greater_equal(b*norm_sign, 0),True], [1,-1], default=numpy.nan)], (2,))
+
+
+def center_to_vertex_vector(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [center_to_vertex_vector](#central_conic.center_to_vertex_vector)."""
+    norm_sign = _conic_norm_factor(a, b, c, d, e, f)
+    x0 = a - c
+    x1 = (1/2)*norm_sign*x0
+    x2 = b**2
+    x3 = x0**2 + 4*x2
+    x4 = numpy.sqrt(x3)
+    x5 = (1/2)*x4
+    x6 = a*c
+    x7 = numpy.sqrt((a*e**2 - 2*b*d*e + c*d**2 + f*x2 - f*x6)/((-x2 + x6)*((1/2)*a + (1/2)*c + norm_sign*x5)))/x3**(1/4)
+    return _stack([x7*numpy.sqrt(x1 + x5), x7*numpy.sqrt(-x1 + (1/2)*x4)*numpy.select([numpy.greater_equal(b*norm_sign, 0),True], [1,-1], default=numpy.nan)], (2,))
+
+
+def center_to_covertex_vector(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [center_to_covertex_vector](#central_conic.center_to_covertex_vector)."""
+    norm_sign = _conic_norm_factor(a, b, c, d, e, f)
+    x0 = a - c
+    x1 = (1/2)*norm_sign*x0
+    x2 = b**2
+    x3 = x0**2 + 4*x2
+    x4 = numpy.sqrt(x3)
+    x5 = a*c
+    x6 = (1/2)*x4
+    x7 = numpy.sqrt((a*e**2 - 2*b*d*e + c*d**2 + f*x2 - f*x5)/((-x2 + x5)*((1/2)*a + (1/2)*c - norm_sign*x6)))/x3**(1/4)
+    return _stack([-x7*numpy.sqrt(-x1 + (1/2)*x4)*numpy.select([numpy.greater_equal(b*norm_sign, 0),True], [1,-1], default=numpy.nan), x7*numpy.sqrt(x1 + x6)], (2,))
+
+
+def shrink_conic_to_zero(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [shrink_conic_to_zero](#central_conic.shrink_conic_to_zero)."""
+    x0 = b**2
+    return _stack([a, b, d, b, c, e, d, e, f - (a*c*f - a*e**2 + 2*b*d*e - c*d**2 - f*x0)/(a*c - x0)], (3, 3))
+
+
+def circle_radius(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [circle_radius](#circle.circle_radius)."""
+    x0 = a*c
+    x1 = b**2
+    return (1/2)*numpy.sqrt(2)*numpy.sqrt((a + c)*(a*e**2 - 2*b*d*e + c*d**2 - f*x0 + f*x1))/(x0 - x1)
+
+
+def director_circle(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [director_circle](#circle.director_circle)."""
+    x0 = (a*c - b**2)**(-1.0)
+    x1 = x0*(b*e - c*d)
+    x2 = x0*(-a*e + b*d)
+    return _stack([-1, 0, x1, 0, -1, x2, x1, x2, x0*(-a*f - c*f + d**2 + e**2)], (3, 3))
+
+
+def parabola_directrix(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [parabola_directrix](#parabola.parabola_directrix)."""
+    x0 = (1/2)*f
+    return _stack([b*e - c*d, -a*e + b*d, -a*x0 - c*x0 + (1/2)*d**2 + (1/2)*e**2], (3,))
+
+
+def parabola_focus(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [parabola_focus](#parabola.parabola_focus)."""
+    x0 = -a*e + b*d
+    x1 = -b*f + d*e
+    x2 = b*e - c*d
+    x3 = c*f
+    x4 = e**2
+    x5 = a*f
+    x6 = d**2
+    x7 = -1/2*x3 + (1/2)*x4 - 1/2*x5 + (1/2)*x6
+    return _stack([x0*x1 + x2*x7 + x2*(x3 - x4), x0*x7 + x0*(x5 - x6) + x1*x2, x0**2 + x2**2 + x7*(a*c - b**2)], (3,))
+
+
+def parabola_vertex(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [parabola_vertex](#parabola.parabola_vertex)."""
+    x0 = b*e - c*d
+    x1 = (1/2)/(a + c)**2
+    x2 = -a*e + b*d
+    x3 = a*f
+    x4 = c*f
+    x5 = d**2
+    x6 = e**2
+    x7 = -1/2*x3 - 1/2*x4 + (1/2)*x5 + (1/2)*x6
+    x8 = (x0**2 + x2**2 + x7*(a*c - b**2))**(-1.0)
+    x9 = -b*f + d*e
+    return _stack([-x0*x1 + x8*(x0*x7 + x0*(x4 - x6) + x2*x9), -x1*x2 + x8*(x0*x9 + x2*x7 + x2*(x3 - x5))], (2,))
+
+
+def parabola_direction(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [parabola_direction](#parabola.parabola_direction)."""
+    return _stack([b*e - c*d, -a*e + b*d, 0], (3,))
+
+
+def parabola_axis(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [parabola_axis](#parabola.parabola_axis)."""
+    x0 = a*e - b*d
+    x1 = b*e - c*d
+    return _stack([a*x0 + b*x1, b*x0 + c*x1, d*x0 + e*x1], (3,))
+
+
+def parabola_focal_parameter(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [parabola_focal_parameter](#parabola.parabola_focal_parameter)."""
+    return numpy.sqrt((-a*c*f + a*e**2 + b**2*f - 2*b*d*e + c*d**2)/(a + c)**3)
+
+
+def focal_axis_direction(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [focal_axis_direction](#conic_direction.focal_axis_direction)."""
+    norm_sign = _conic_norm_factor(a, b, c, d, e, f)
+    x0 = a - c
+    x1 = (1/2)*norm_sign*x0
+    x2 = numpy.sqrt(4*b**2 + x0**2)
+    return _stack([numpy.sqrt(x1 + (1/2)*x2), numpy.sqrt(-x1 + (1/2)*x2)*numpy.select([numpy.greater_equal(b*norm_sign, 0),True], [1,-1], default=numpy.nan), 0], (3,))
+
+
+def conjugate_axis_direction(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    d: ArrayLike,
+    e: ArrayLike,
+    f: ArrayLike,
+) -> NDArray:
+    """Vectorized [conjugate_axis_direction](#conic_direction.conjugate_axis_direction)."""
+    norm_sign = _conic_norm_factor(a, b, c, d, e, f)
+    x0 = a - c
+    x1 = (1/2)*norm_sign*x0
+    x2 = numpy.sqrt(4*b**2 + x0**2)
+    return _stack([-numpy.sqrt(-x1 + (1/2)*x2)*numpy.select([numpy.greater_equal(b*norm_sign, 0),True], [1,-1], default=numpy.nan), numpy.sqrt(x1 + (1/2)*x2), 0], (3,))
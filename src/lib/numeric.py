@@ -0,0 +1,307 @@
+"""Floating-point fast paths of frequently used functions.
+
+Each function in this module takes the same arguments as its exact counterpart.
+If all of them are plain numbers (Python `int`s and `float`s, NumPy scalars,
+sequences or NumPy arrays of them), it evaluates the same formula in
+floating-point arithmetic, which is about two orders of magnitude faster than
+building sympy objects. Otherwise, or if `exact=True` is specified, it calls
+the exact counterpart.
+
+The fast paths return points and lines as tuples of floats, conics as 3x3 NumPy
+arrays, and scalars as Python floats. Complex results are returned as complex
+numbers, division by zero yields infinities or `nan`.
+"""
+
+import cmath
+import math
+from collections.abc import Callable, Sequence
+from functools import wraps
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from sympy import Matrix
+
+import lib.batch
+import lib.central_conic
+import lib.circle
+import lib.conic
+import lib.distance
+import lib.intersection
+import lib.line
+
+#: The types of scalars eligible for the floating-point fast path.
+_NUMBER_TYPES = (int, float, np.integer, np.floating)
+
+
+def _is_numeric(value: object) -> bool:
+    """Tells whether a value is a number or a nested sequence of numbers."""
+    if isinstance(value, _NUMBER_TYPES):
+        return True
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind in "iuf"
+    if isinstance(value, (tuple, list)):
+        return all(_is_numeric(item) for item in value)
+    return False
+
+
+def _to_sympy(value: object) -> object:
+    """Converts numeric sequences and arrays to sympy matrices."""
+    if isinstance(value, (tuple, list, np.ndarray)) and _is_numeric(value):
+        return Matrix(value)
+    return value
+
+
+def _float_fast_path(
+    exact_function: Callable[..., Any],
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Dispatches the decorated float implementation or `exact_function`.
+
+    The decorated function gets an extra keyword-only `exact` argument, which
+    forces the exact implementation when `True`. The other arguments can be
+    passed by position or by keyword to either implementation. Numeric
+    sequences and arrays are converted to sympy matrices before passing them to
+    `exact_function`.
+    """
+
+    def decorator(float_function: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(float_function)
+        def dispatch(*args: object, exact: bool = False, **kwargs: object) -> object:
+            if exact or not all(_is_numeric(arg) for arg in (*args, *kwargs.values())):
+                return exact_function(
+                    *map(_to_sympy, args),
+                    **{name: _to_sympy(value) for name, value in kwargs.items()},
+                )
+            return float_function(*args, **kwargs)
+
+        return dispatch
+
+    return decorator
+
+
+def _flat(value: ArrayLike) -> list[float]:
+    """Flattens a number sequence or array to a list of floats."""
+    return np.asarray(value, dtype=float).ravel().tolist()
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """Divides two floats, returning ±∞ or `nan` instead of raising."""
+    if denominator != 0:
+        return numerator / denominator
+    if numerator == 0:
+        return math.nan
+    return math.copysign(math.inf, numerator)
+
+
+def _sqrt(value: float) -> float | complex:
+    """Returns the principal square root, which is complex for negatives."""
+    if value == 0:
+        return 0.0
+    return math.sqrt(value) if value > 0 else cmath.sqrt(value)
+
+
+def _vec3(point: ArrayLike) -> tuple[float, float, float]:
+    """Converts Euclidean or homogeneous point coordinates to a 3-tuple."""
+    coords = _flat(point)
+    if len(coords) == 2:
+        return (coords[0], coords[1], 1.0)
+    if len(coords) != 3:
+        raise ValueError("The point must have 2 or 3 coordinates.")
+    return (coords[0], coords[1], coords[2])
+
+
+def _xy(point: ArrayLike) -> tuple[float, float]:
+    """Converts Euclidean or homogeneous point coordinates to a 2-tuple."""
+    x, y, z = _vec3(point)
+    return (_divide(x, z), _divide(y, z))
+
+
+def _cross(
+    u: Sequence[float],
+    v: Sequence[float],
+) -> tuple[float, float, float]:
+    return (
+        u[1] * v[2] - u[2] * v[1],
+        u[2] * v[0] - u[0] * v[2],
+        u[0] * v[1] - u[1] * v[0],
+    )
+
+
+def _conic_elements(conic: ArrayLike) -> list[float]:
+    """Flattens a 3x3 conic matrix to a row-major list of 9 floats."""
+    elements = _flat(conic)
+    if len(elements) != 9:
+        raise ValueError("The conic must be a 3x3 matrix.")
+    return elements
+
+
+def _det3(m: Sequence[float]) -> float:
+    """Computes the determinant of a row-major 3x3 matrix."""
+    return (
+        m[0] * (m[4] * m[8] - m[5] * m[7])
+        - m[1] * (m[3] * m[8] - m[5] * m[6])
+        + m[2] * (m[3] * m[7] - m[4] * m[6])
+    )
+
+
+def _conic_norm_factor(m: Sequence[float]) -> int:
+    """Float counterpart of [ConicNormFactor](#conic_direction.ConicNormFactor)."""
+    det = _det3(m)
+    if det != 0:
+        return 1 if det > 0 else -1
+    # Some 2x2 principal minor of a point conic's matrix is positive.
+    is_point_conic = (
+        m[4] * m[8] - m[5] * m[5] > 0
+        or m[0] * m[8] - m[2] * m[2] > 0
+        or m[0] * m[4] - m[1] * m[1] > 0
+    )
+    if is_point_conic:
+        diagonal = (m[0], m[4], m[8])
+        if any(el > 0 for el in diagonal):
+            return -1
+    return 1
+
+
+@_float_fast_path(lib.line.line_between)
+def line_between(point1: ArrayLike, point2: ArrayLike) -> tuple[float, ...]:
+    """Connects two projective points with a line.
+
+    *Exact counterpart*: [line_between](#line.line_between)
+    """
+    return _cross(_vec3(point1), _vec3(point2))
+
+
+@_float_fast_path(lib.line.parallel_line)
+def parallel_line(with_line: ArrayLike, through_point: ArrayLike) -> tuple[float, ...]:
+    """Constructs a line through a point parallel to a line.
+
+    *Exact counterpart*: [parallel_line](#line.parallel_line)
+    """
+    x, y = _xy(through_point)
+    a, b, _ = _flat(with_line)
+    return (a, b, -a * x - b * y)
+
+
+@_float_fast_path(lib.line.perpendicular_line)
+def perpendicular_line(
+    to_line: ArrayLike,
+    through_point: ArrayLike,
+) -> tuple[float, ...]:
+    """Constructs a line through a point perpendicular to a line.
+
+    *Exact counterpart*: [perpendicular_line](#line.perpendicular_line)
+    """
+    x, y = _xy(through_point)
+    a, b, _ = _flat(to_line)
+    return (-b, a, -b * x + a * y)
+
+
+@_float_fast_path(lib.circle.circle)
+def circle(center: ArrayLike, radius: float) -> NDArray[np.float64]:
+    """Creates a circle from its center and radius.
+
+    *Exact counterpart*: [circle](#circle.circle)
+    """
+    x, y = _xy(center)
+    radius = float(radius)
+    return np.array(
+        [[-1.0, 0.0, x], [0.0, -1.0, y], [x, y, radius * radius - x * x - y * y]],
+    )
+
+
+@_float_fast_path(lib.central_conic.conic_center)
+def conic_center(conic: ArrayLike) -> tuple[float, float]:
+    """Computes the center point of a conic.
+
+    *Exact counterpart*: [conic_center](#central_conic.conic_center)
+    """
+    m = _conic_elements(conic)
+    x, y, z = _cross(m[0::3], m[1::3])
+    return (_divide(x, z), _divide(y, z))
+
+
+@_float_fast_path(lib.conic.eccentricity)
+def eccentricity(conic: ArrayLike) -> float | complex:
+    """Computes the eccentricity of a conic section.
+
+    *Exact counterpart*: [eccentricity](#conic.eccentricity)
+    """
+    m = _conic_elements(conic)
+    a, b, c = m[0], m[1], m[4]
+    s = math.hypot(a - c, 2 * b)
+    norm_sign = _conic_norm_factor(m)
+    return _sqrt(_divide(2 * s, s - norm_sign * (a + c)))
+
+
+@_float_fast_path(lib.intersection.conic_x_line)
+def conic_x_line(
+    conic: ArrayLike,
+    line: ArrayLike,
+) -> tuple[NDArray[np.inexact], NDArray[np.inexact]] | float:
+    """Intersects a conic with a line. Returns two homogeneous points.
+
+    Unlike the exact counterpart, uses the line coordinate with the largest
+    magnitude as the pivot for numerical stability. The points are complex if
+    the line doesn't intersect the conic at a real point. Returns `nan` if the
+    line is the zero vector or lies entirely on the conic.
+
+    *Exact counterpart*: [conic_x_line](#intersection.conic_x_line)
+    """
+    conic = np.asarray(conic, dtype=float).reshape(3, 3)
+    a, b, c = line = _flat(line)
+    skew = np.array([[0, -c, b], [c, 0, -a], [-b, a, 0]])
+    m = skew.T @ conic @ skew
+    pivot = max(range(3), key=lambda i: abs(line[i]))
+    if line[pivot] == 0:
+        return math.nan
+    # The 2x2 minor complementary to the pivot coordinate.
+    i, j = [k for k in range(3) if k != pivot]
+    alpha = _sqrt(m[i, j] * m[j, i] - m[i, i] * m[j, j]) / line[pivot]
+    intersections = m + alpha * skew
+    k = int(np.argmax(np.abs(intersections)))
+    if intersections.flat[k] == 0:
+        return math.nan
+    return (intersections[:, k % 3], intersections[k // 3, :])
+
+
+@_float_fast_path(lib.intersection.conic_x_conic)
+def conic_x_conic(
+    conic1: ArrayLike,
+    conic2: ArrayLike,
+) -> tuple[NDArray[np.complex128], ...] | float:
+    """Intersects two conics. Returns four homogeneous points.
+
+    Solves the cubic equation of the degenerate pencil members in closed form,
+    see [conic_x_conic](#batch.conic_x_conic) for the details. The points are
+    complex NumPy arrays, whose imaginary parts are zero up to rounding errors
+    for real intersections. Returns `nan` if the conics coincide or share a
+    line component.
+
+    *Exact counterpart*: [conic_x_conic](#intersection.conic_x_conic)
+    """
+    points = lib.batch.conic_x_conic(conic1, conic2)
+    if np.isnan(points).any():
+        return math.nan
+    return tuple(points)
+
+
+@_float_fast_path(lib.distance.point_point_distance)
+def point_point_distance(point1: ArrayLike, point2: ArrayLike) -> float:
+    """Computes the distance between two points.
+
+    *Exact counterpart*: [point_point_distance](#distance.point_point_distance)
+    """
+    x1, y1, z1 = _vec3(point1)
+    x2, y2, z2 = _vec3(point2)
+    return _divide(math.hypot(x2 * z1 - x1 * z2, y2 * z1 - y1 * z2), z1 * z2)
+
+
+@_float_fast_path(lib.distance.point_line_distance)
+def point_line_distance(point: ArrayLike, line: ArrayLike) -> float:
+    """Computes the signed distance between a point and a line.
+
+    *Exact counterpart*: [point_line_distance](#distance.point_line_distance)
+    """
+    x, y = _xy(point)
+    a, b, c = _flat(line)
+    return _divide(a * x + b * y + c, math.hypot(a, b))
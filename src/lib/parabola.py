@@ -1,6 +1,7 @@
 from sympy import Expr, Matrix, sqrt
 
 from lib.conic_classes import is_parabola
+from lib.invariants import conic_adjugate, conic_det
 from lib.point import point_to_xy
 
 
@@ -30,7 +31,7 @@ def parabola_directrix(parabola: Matrix) -> Matrix:
     *Formula*:
     [research/conic_properties/focus_directrix_eccentricity.py](../src/research/conic_properties/focus_directrix_eccentricity.py)
     """
-    return _parabola_directrix_from_adjugate(parabola.adjugate())
+    return _parabola_directrix_from_adjugate(conic_adjugate(parabola))
 
 
 def _parabola_focus_from_adjugate(parabola_adjugate: Matrix) -> Matrix:
@@ -56,7 +57,7 @@ def parabola_focus(parabola: Matrix) -> Matrix:
     *Formula*:
     [research/conic_properties/focus_directrix_eccentricity.py](../src/research/conic_properties/focus_directrix_eccentricity.py)
     """
-    return _parabola_focus_from_adjugate(parabola.adjugate())
+    return _parabola_focus_from_adjugate(conic_adjugate(parabola))
 
 
 def parabola_vertex(parabola: Matrix) -> Matrix:
@@ -116,4 +117,4 @@ def parabola_focal_parameter(parabola: Matrix) -> Expr:
     [research/conic_properties/focal_parameter.py](../src/research/conic_properties/focal_parameter.py)
     """
     a, c, _ = parabola.diagonal()
-    return sqrt(-parabola.det() / (a + c) ** 3)
+    return sqrt(-conic_det(parabola) / (a + c) ** 3)
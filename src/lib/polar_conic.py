@@ -19,6 +19,7 @@ from sympy import Expr, I, Matrix, atan2, cos, sign, sin, sqrt
 from lib.central_conic import conic_center, primary_radius, secondary_radius
 from lib.circle import UNIT_CIRCLE
 from lib.conic_direction import focal_axis_direction
+from lib.invariants import conic_det
 from lib.point import point_to_vec3
 
 #: The circle at the origin with radius 1, in polar matrix form.
@@ -119,7 +120,7 @@ def ellipse_to_polar_matrix(
     cy = (b * d - a * e) / disc
 
     if start == PolarOrigin.HORIZONTAL:
-        det = ellipse.det()
+        det = conic_det(ellipse)
         t = sqrt(-det / a)
         return Matrix(
             [
@@ -130,7 +131,7 @@ def ellipse_to_polar_matrix(
         )
 
     if start == PolarOrigin.VERTICAL:
-        det = ellipse.det()
+        det = conic_det(ellipse)
         t = sqrt(-det / c)
         return Matrix(
             [
@@ -0,0 +1,436 @@
+"""Alternative `simplifier` callbacks for the fuzzy predicates.
+
+Predicates such as [conic_contains_point](#incidence.conic_contains_point) or
+[is_degenerate](#conic_classes.is_degenerate) take a `simplifier` callback,
+apply it to a polynomial, and decide its zero-ness or sign from the result.
+The callables in this module can be passed in place of `expand`, `factor` or
+`simplify`.
+"""
+
+import random
+import signal
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from fractions import Fraction
+
+from sympy import (
+    Add,
+    Dummy,
+    Expr,
+    Matrix,
+    Mul,
+    Pow,
+    S,
+    Symbol,
+    cancel,
+    count_ops,
+    expand,
+    factor,
+    simplify,
+)
+from sympy.matrices import MatrixBase
+
+#: A Mersenne prime. Random evaluations of a nonzero polynomial of degree `d`
+#: vanish modulo this prime with probability at most `d / MERSENNE_PRIME_61`.
+MERSENNE_PRIME_61: int = 2**61 - 1
+
+
+#: How many times to resample the random points when hitting a pole.
+_MAX_SAMPLING_ATTEMPTS = 3
+
+#: The delay in seconds an expired enclosing timer is resumed with.
+_MIN_TIMER_DELAY = 1e-6
+
+
+class _UnsupportedExpressionError(ValueError):
+    """Raised when an expression is not a rational function of its symbols."""
+
+
+def _evaluate_modular(
+    expr: Expr,
+    values: dict[Symbol, list[int]],
+    modulus: int,
+    cache: dict[Expr, list[int]],
+) -> list[int]:
+    """Evaluates a rational function modulo a prime at several points at once.
+
+    `values` maps each symbol to its values at the evaluation points; `cache`
+    memoizes the values of the already visited subexpressions. Raises
+    `ZeroDivisionError` if a denominator vanishes at any of the points.
+    """
+    if expr in cache:
+        return cache[expr]
+    if expr.is_Symbol:
+        result = values[expr]
+    elif expr.is_Rational:
+        if expr.q % modulus == 0:
+            raise _UnsupportedExpressionError
+        value = expr.p * pow(expr.q, -1, modulus) % modulus
+        result = [value] * len(cache[S.One])
+    elif isinstance(expr, (Add, Mul)):
+        args = [_evaluate_modular(arg, values, modulus, cache) for arg in expr.args]
+        result = args[0]
+        for arg in args[1:]:
+            if isinstance(expr, Add):
+                result = [(a + b) % modulus for a, b in zip(result, arg, strict=True)]
+            else:
+                result = [a * b % modulus for a, b in zip(result, arg, strict=True)]
+    elif isinstance(expr, Pow) and expr.exp.is_Integer:
+        base = _evaluate_modular(expr.base, values, modulus, cache)
+        exponent = int(expr.exp)
+        if exponent < 0 and 0 in base:
+            raise ZeroDivisionError
+        result = [pow(b, exponent, modulus) for b in base]
+    else:
+        raise _UnsupportedExpressionError
+    cache[expr] = result
+    return result
+
+
+def _evaluate_rational(
+    expr: Expr,
+    values: dict[Symbol, Fraction],
+    cache: dict[Expr, Fraction],
+) -> Fraction:
+    """Evaluates a rational function exactly at a rational point.
+
+    Raises `ZeroDivisionError` if a denominator vanishes at the point.
+    """
+    if expr in cache:
+        return cache[expr]
+    if expr.is_Symbol:
+        result = values[expr]
+    elif expr.is_Rational:
+        result = Fraction(expr.p, expr.q)
+    elif isinstance(expr, Add):
+        result = sum(
+            (_evaluate_rational(arg, values, cache) for arg in expr.args),
+            Fraction(0),
+        )
+    elif isinstance(expr, Mul):
+        result = Fraction(1)
+        for arg in expr.args:
+            result *= _evaluate_rational(arg, values, cache)
+    elif isinstance(expr, Pow) and expr.exp.is_Integer:
+        result = _evaluate_rational(expr.base, values, cache) ** int(expr.exp)
+    else:
+        raise _UnsupportedExpressionError
+    cache[expr] = result
+    return result
+
+
+class ProbabilisticZeroTest:
+    """Decides the zero-ness of rational functions by random evaluation.
+
+    By the Schwartz–Zippel lemma a nonzero polynomial rarely vanishes at a
+    random point. This simplifier evaluates the expression at `trials`
+    independent random points, either modulo a large prime (the default) or
+    exactly at random rationals (`modulus=None`).
+
+    - If any evaluation is nonzero, the expression is proven to be not
+      identically zero. It is returned unchanged if its assumptions already
+      tell that, otherwise replaced with a nonzero placeholder symbol that
+      inherits the expression's realness.
+    - If all evaluations vanish, the expression is zero with high probability.
+      The simplifier returns `0`, or if an exact `fallback` simplifier is
+      specified, the result of the fallback for certainty.
+    - Expressions that are not rational functions of their symbols (e.g. ones
+      containing radicals, floats or function calls) go to the `fallback`, or
+      are returned unchanged if there is none.
+
+    Matrices are processed element by element. Pass a `seed` for reproducible
+    results.
+    """
+
+    def __init__(
+        self,
+        trials: int = 8,
+        *,
+        modulus: int | None = MERSENNE_PRIME_61,
+        fallback: Callable[[Expr], Expr] | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Configures the number of trials, the arithmetic and the fallback."""
+        if trials < 1:
+            raise ValueError("At least one trial is required.")
+        self.trials = trials
+        self.modulus = modulus
+        self.fallback = fallback
+        self._random = random.Random(seed)  # noqa: S311
+
+    def __call__(self, expr: Expr | Matrix) -> Expr | Matrix:
+        """Simplifies an expression or the elements of a matrix."""
+        if isinstance(expr, MatrixBase):
+            return expr.applyfunc(self)
+        expr = S(expr)
+        if expr.is_Rational:
+            return expr
+        try:
+            is_probably_zero = self.is_probably_zero(expr)
+        except _UnsupportedExpressionError:
+            return self.fallback(expr) if self.fallback else expr
+        if not is_probably_zero:
+            if expr.is_zero is False:
+                return expr
+            return Dummy(zero=False, real=expr.is_real)
+        return self.fallback(expr) if self.fallback else S.Zero
+
+    def is_probably_zero(self, expr: Expr) -> bool:
+        """Tells whether an expression vanishes at all random points.
+
+        Raises `ValueError` for expressions that are not rational functions of
+        their symbols, or keep hitting poles at the random points.
+        """
+        for _ in range(_MAX_SAMPLING_ATTEMPTS):
+            try:
+                if self.modulus is None:
+                    return self._vanishes_at_random_rationals(expr)
+                return self._vanishes_modulo_prime(expr)
+            except ZeroDivisionError:  # noqa: PERF203
+                # Hit a pole of the rational function; sample new points.
+                continue
+        raise _UnsupportedExpressionError
+
+    def _vanishes_modulo_prime(self, expr: Expr) -> bool:
+        values = {
+            symbol: [self._random.randrange(self.modulus) for _ in range(self.trials)]
+            for symbol in expr.free_symbols
+        }
+        cache = {S.One: [1] * self.trials}
+        return not any(_evaluate_modular(expr, values, self.modulus, cache))
+
+    def _vanishes_at_random_rationals(self, expr: Expr) -> bool:
+        for _ in range(self.trials):
+            values = {
+                symbol: Fraction(
+                    self._random.randint(-(2**31), 2**31),
+                    self._random.randint(1, 2**16),
+                )
+                for symbol in expr.free_symbols
+            }
+            if _evaluate_rational(expr, values, {}) != 0:
+                return False
+        return True
+
+
+class _BudgetExceededError(Exception):
+    """Raised when a simplification runs out of its time budget."""
+
+
+class _AlarmError(Exception):
+    """Raised by the `SIGALRM` handler of a single timed call."""
+
+
+def _call_with_alarm(
+    func: Callable[[Expr], Expr],
+    arg: Expr | Matrix,
+    seconds: float,
+) -> Expr | Matrix:
+    """Calls `func(arg)` in the main thread, interrupting it with `SIGALRM`
+    after `seconds`.
+
+    An enclosing timer is suspended during the call and resumed with its
+    remaining time afterwards. If it expires first, its own handler runs, so
+    the interruption propagates to the enclosing budget instead of being
+    mistaken for a timeout of this call.
+    """
+    expired = _AlarmError()
+    start = time.monotonic()
+    previous_delay, previous_interval = signal.setitimer(signal.ITIMER_REAL, 0)
+    is_enclosing_first = 0 < previous_delay < seconds
+
+    def handle_alarm(signum: int, frame: object) -> None:
+        if is_enclosing_first and callable(previous_handler):
+            previous_handler(signum, frame)
+        raise expired
+
+    previous_handler = signal.signal(signal.SIGALRM, handle_alarm)
+    signal.setitimer(
+        signal.ITIMER_REAL,
+        previous_delay if is_enclosing_first else seconds,
+    )
+    try:
+        try:
+            return func(arg)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+            if previous_delay > 0:
+                # A zero delay would disarm the timer instead of firing it.
+                remaining = previous_delay - (time.monotonic() - start)
+                signal.setitimer(
+                    signal.ITIMER_REAL,
+                    max(remaining, _MIN_TIMER_DELAY),
+                    previous_interval,
+                )
+    except _AlarmError as error:
+        if error is not expired:
+            raise
+        raise _BudgetExceededError from None
+
+
+def _call_with_timeout(
+    func: Callable[[Expr], Expr],
+    arg: Expr | Matrix,
+    seconds: float,
+) -> Expr | Matrix:
+    """Calls `func(arg)`, raising `_BudgetExceededError` after `seconds`.
+
+    In the main thread the call is interrupted with `SIGALRM`, which also
+    works inside an enclosing budget. Elsewhere it runs in a daemon thread,
+    which is abandoned on timeout. Python threads can't be interrupted, so an
+    abandoned call keeps using CPU until it finishes, but it doesn't delay the
+    exit of the interpreter.
+    """
+    if (
+        hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    ):
+        return _call_with_alarm(func, arg, seconds)
+
+    outcome: dict[str, Expr | Matrix | BaseException] = {}
+
+    def run() -> None:
+        try:
+            outcome["result"] = func(arg)
+        except BaseException as error:  # noqa: BLE001 (re-raised by the caller)
+            outcome["error"] = error
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(seconds)
+    if thread.is_alive():
+        raise _BudgetExceededError
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+class BudgetedSimplifier:
+    """Caps the time and expression size a simplifier may spend on a decision.
+
+    Wraps another `simplifier`. If the expression to simplify has more than
+    `max_ops` operations (as counted by `sympy.count_ops`), or the simplifier
+    runs longer than `max_seconds`, the result is replaced with a fresh symbol
+    without assumptions, so that the calling predicate returns `None`
+    (undecidable). Either limit can be disabled with `None`.
+
+    Matrices count as a single decision; on a budget trip each of their
+    elements is replaced with a different symbol.
+
+    The `calls`, `timeouts` and `size_limit_hits` counters record how often the
+    budgets trip. Only the simplifier call is budgeted, not the computation of
+    its input inside the predicate.
+    """
+
+    def __init__(
+        self,
+        simplifier: Callable[[Expr], Expr] = simplify,
+        *,
+        max_seconds: float | None = 1.0,
+        max_ops: int | None = None,
+    ) -> None:
+        """Configures the wrapped simplifier and its budgets."""
+        self.simplifier = simplifier
+        self.max_seconds = max_seconds
+        self.max_ops = max_ops
+        self.reset_counters()
+
+    def reset_counters(self) -> None:
+        """Sets the call and budget trip counters to zero."""
+        #: The number of simplifier calls.
+        self.calls = 0
+        #: The number of calls that ran out of the time budget.
+        self.timeouts = 0
+        #: The number of calls whose input exceeded the size budget.
+        self.size_limit_hits = 0
+
+    def __call__(self, expr: Expr | Matrix) -> Expr | Matrix:
+        """Simplifies an expression or matrix within the budgets."""
+        self.calls += 1
+        if self.max_ops is not None and count_ops(expr) > self.max_ops:
+            self.size_limit_hits += 1
+            return self._undecidable(expr)
+        if self.max_seconds is None:
+            return self.simplifier(expr)
+        try:
+            return _call_with_timeout(self.simplifier, expr, self.max_seconds)
+        except _BudgetExceededError:
+            self.timeouts += 1
+            return self._undecidable(expr)
+
+    @staticmethod
+    def _undecidable(expr: Expr | Matrix) -> Expr | Matrix:
+        if isinstance(expr, MatrixBase):
+            return expr.applyfunc(lambda _: Dummy())
+        return Dummy()
+
+
+def _identity(expr: Expr) -> Expr:
+    return expr
+
+
+def _tier_name(tier: Callable[[Expr], Expr]) -> str:
+    name = getattr(tier, "__name__", type(tier).__name__)
+    return "identity" if tier is _identity else name
+
+
+def _has_decided_zeroness(expr: Expr) -> bool:
+    return expr.is_zero is not None
+
+
+#: The default tiers of [TieredSimplifier](#simplifier.TieredSimplifier),
+#: from the cheapest to the most expensive.
+DEFAULT_TIERS: tuple[Callable[[Expr], Expr], ...] = (
+    _identity,
+    expand,
+    cancel,
+    factor,
+    simplify,
+)
+
+
+class TieredSimplifier:
+    """Tries increasingly expensive simplifiers until the answer is decided.
+
+    Applies the `tiers` one after another to the original expression, and
+    returns the first result for which `is_decided` holds, or the result of the
+    last tier. By default the tiers are the expression as is, `expand`,
+    `cancel`, `factor` and `simplify`, and an expression counts as decided if
+    its `is_zero` property is not `None`. Predicates deciding a sign need
+    `is_decided=lambda expr: expr.is_positive is not None` or similar.
+
+    Matrices are simplified element by element, each element escalating
+    independently.
+
+    `tier_counts` maps the names of the tiers to the number of calls they
+    resolved, with the key `"unresolved"` for undecided expressions.
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[Callable[[Expr], Expr]] = DEFAULT_TIERS,
+        *,
+        is_decided: Callable[[Expr], bool | None] = _has_decided_zeroness,
+    ) -> None:
+        """Configures the tiers and the stopping condition."""
+        if not tiers:
+            raise ValueError("At least one tier is required.")
+        self.tiers = tuple(tiers)
+        self.is_decided = is_decided
+        #: The number of calls resolved by each tier.
+        self.tier_counts: Counter[str] = Counter()
+
+    def __call__(self, expr: Expr | Matrix) -> Expr | Matrix:
+        """Simplifies an expression or the elements of a matrix."""
+        if isinstance(expr, MatrixBase):
+            return expr.applyfunc(self)
+        for tier in self.tiers:
+            result = tier(expr)
+            if self.is_decided(result):
+                self.tier_counts[_tier_name(tier)] += 1
+                return result
+        self.tier_counts["unresolved"] += 1
+        return result
@@ -0,0 +1,193 @@
+"""Spatial index answering which of many conics pass through or near a point.
+
+[ConicIndex](#spatial_index.ConicIndex) stores the
+[bounding boxes](#batch.conic_bounding_boxes) of the conics in a static R-tree,
+so point and rectangle queries only visit the boxes around the query, and
+confirms the candidates with the vectorized predicates.
+"""
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from lib.batch import (
+    DEFAULT_TOLERANCE,
+    conic_bounding_boxes,
+    conic_contains_point,
+    sampson_distances,
+)
+
+#: The relative amount the bounding boxes are padded with, so that rounding
+#: errors don't exclude points on their edges.
+_BOX_PADDING = 1e-9
+
+
+def _sort_tile_recursive(
+    boxes: NDArray[np.float64],
+    capacity: int,
+) -> NDArray[np.intp]:
+    """Groups boxes into R-tree nodes of up to `capacity` children.
+
+    Sorts the boxes by the x coordinates of their centers, cuts them into
+    vertical slices, then sorts each slice by the y coordinates and cuts it
+    into nodes (Leutenegger, Edgington & López 1997). Returns a
+    (nodes, capacity) array of box indices, padded with -1.
+    """
+    count = len(boxes)
+    slice_size = capacity * int(np.ceil(np.sqrt(-(-count // capacity))))
+    centers = (boxes[:, :2] + boxes[:, 2:]) / 2
+    by_x = np.argsort(centers[:, 0], kind="stable")
+    nodes = []
+    for group in np.split(by_x, range(slice_size, count, slice_size)):
+        # Each slice starts a new node, so pad the slices to whole nodes.
+        padded = np.full(-(-len(group) // capacity) * capacity, -1)
+        padded[: len(group)] = group[np.argsort(centers[group, 1], kind="stable")]
+        nodes.append(padded.reshape(-1, capacity))
+    return np.concatenate(nodes)
+
+
+def _enclosing_boxes(
+    boxes: NDArray[np.float64],
+    groups: NDArray[np.intp],
+) -> NDArray[np.float64]:
+    """Computes the bounding boxes of the groups of boxes."""
+    members = boxes[groups]
+    is_padding = (groups < 0)[..., np.newaxis]
+    lower = np.where(is_padding, np.inf, members[..., :2]).min(axis=1)
+    upper = np.where(is_padding, -np.inf, members[..., 2:]).max(axis=1)
+    return np.concatenate([lower, upper], axis=1)
+
+
+def _intersect(
+    boxes: NDArray[np.float64],
+    rectangle: NDArray[np.float64],
+) -> NDArray[np.bool_]:
+    return (
+        (boxes[:, 0] <= rectangle[2])
+        & (boxes[:, 1] <= rectangle[3])
+        & (boxes[:, 2] >= rectangle[0])
+        & (boxes[:, 3] >= rectangle[1])
+    )
+
+
+class ConicIndex:
+    """Answers point and rectangle queries on a fixed set of numeric conics.
+
+    The index computes the axis-aligned bounding boxes of the real points of
+    the conics with [conic_bounding_boxes](#batch.conic_bounding_boxes), and
+    packs the finite ones into a static R-tree of `node_capacity` children per
+    node with the Sort-Tile-Recursive algorithm. A query descends the tree
+    level by level, keeping only the nodes whose boxes intersect the query
+    rectangle, so it visits `O(log N)` nodes plus the ones around the matches.
+
+    Parabolas, hyperbolas and degenerate conics have unbounded boxes, which
+    would make every node of the tree unbounded. They are kept in a separate
+    list instead, and their half-infinite boxes are checked one by one. Conics
+    without real points are never returned.
+    """
+
+    def __init__(self, conics: ArrayLike, *, node_capacity: int = 16) -> None:
+        """Builds the index of an (N,3,3) stack of conics."""
+        if node_capacity < 2:
+            raise ValueError("The node capacity must be at least 2.")
+        conics = np.asarray(conics, dtype=float)
+        if conics.ndim != 3 or conics.shape[1:] != (3, 3):
+            raise ValueError("The conics must be an (N,3,3) array.")
+        #: The (N,3,3) stack of the indexed conics.
+        self.conics = conics
+        #: The (N,4) array of the `(x_min, y_min, x_max, y_max)` bounding boxes
+        #: of the conics, see [conic_bounding_boxes](#batch.conic_bounding_boxes).
+        self.bounds = conic_bounding_boxes(conics) if len(conics) else np.empty((0, 4))
+
+        magnitudes = np.where(np.isfinite(self.bounds), np.abs(self.bounds), 0)
+        padding = _BOX_PADDING * magnitudes.max(axis=1, initial=0)
+        boxes = self.bounds + np.outer(padding, [-1, -1, 1, 1])
+        is_finite = np.isfinite(boxes).all(axis=1)
+        is_unbounded = ~is_finite & ~np.isnan(boxes).any(axis=1)
+        self._boxes = boxes
+        self._unbounded = np.flatnonzero(is_unbounded)
+        self._unbounded_boxes = boxes[is_unbounded]
+
+        # The tree levels from the root down to the leaves, as pairs of node
+        # boxes and child indices into the level below (or the conic indices).
+        self._levels: list[tuple[NDArray[np.float64], NDArray[np.intp]]] = []
+        indices = np.flatnonzero(is_finite)
+        level_boxes = boxes[is_finite]
+        while len(level_boxes) > 0:
+            groups = _sort_tile_recursive(level_boxes, node_capacity)
+            children = np.where(groups < 0, -1, indices[groups])
+            level_boxes = _enclosing_boxes(level_boxes, groups)
+            self._levels.insert(0, (level_boxes, children))
+            indices = np.arange(len(level_boxes))
+            if len(level_boxes) == 1:
+                break
+
+    def __len__(self) -> int:
+        """Returns the number of indexed conics."""
+        return len(self.conics)
+
+    def intersecting(
+        self,
+        min_corner: ArrayLike,
+        max_corner: ArrayLike,
+    ) -> NDArray[np.intp]:
+        """Finds the conics whose bounding boxes intersect a rectangle.
+
+        Takes the `(x, y)` corners of an axis-aligned rectangle, and returns the
+        sorted indices of the conics. The result is a superset of the conics
+        passing through the rectangle.
+        """
+        rectangle = np.concatenate(
+            [np.asarray(min_corner, dtype=float), np.asarray(max_corner, dtype=float)],
+        )
+        if rectangle.shape != (4,):
+            raise ValueError("The corners must be (x, y) pairs.")
+        matches = [self._unbounded[_intersect(self._unbounded_boxes, rectangle)]]
+        nodes = np.zeros(1, dtype=np.intp)
+        for level_boxes, children in self._levels:
+            nodes = nodes[_intersect(level_boxes[nodes], rectangle)]
+            nodes = children[nodes].ravel()
+            nodes = nodes[nodes >= 0]
+        if self._levels:
+            matches.append(nodes[_intersect(self._boxes[nodes], rectangle)])
+        return np.sort(np.concatenate(matches))
+
+    def containing(
+        self,
+        point: ArrayLike,
+        *,
+        tolerance: float = DEFAULT_TOLERANCE,
+    ) -> NDArray[np.intp]:
+        """Finds the conics passing through a Euclidean point.
+
+        The candidates from the bounding box query are confirmed with
+        [conic_contains_point](#batch.conic_contains_point) with the given
+        `tolerance`. Returns the sorted indices of the conics.
+        """
+        point = np.asarray(point, dtype=float)
+        candidates = self.intersecting(point, point)
+        is_on_conic = conic_contains_point(
+            self.conics[candidates],
+            point[np.newaxis],
+            tolerance=tolerance,
+        )
+        return candidates[is_on_conic[:, 0]]
+
+    def near(self, point: ArrayLike, distance: float) -> NDArray[np.intp]:
+        """Finds the conics passing approximately within `distance` of a
+        Euclidean point.
+
+        The candidates are the conics whose bounding boxes intersect the square
+        of side `2·distance` around the point, which is exact. They are
+        confirmed with their [Sampson distances](#batch.sampson_distances),
+        which approximate the geometric distances to first order. The result
+        is exact for lines, and accurate if `distance` is small compared to the
+        curvature radii of the conics, but otherwise it may include or miss
+        conics whose geometric distance is close to `distance`. Returns the
+        sorted indices of the conics.
+        """
+        if distance < 0:
+            raise ValueError("The distance must be non-negative.")
+        point = np.asarray(point, dtype=float)
+        candidates = self.intersecting(point - distance, point + distance)
+        distances = sampson_distances(self.conics[candidates], point[np.newaxis])
+        return candidates[distances[:, 0] <= distance]
@@ -1,6 +1,9 @@
 from collections.abc import Sequence
+from typing import Self
 
-from sympy import Expr, Matrix, cos, sin
+import numpy as np
+from numpy.typing import NDArray
+from sympy import Expr, ImmutableMatrix, Matrix, MatrixBase, cos, expand, sin
 
 from lib.point import ORIGIN, point_to_vec3, point_to_xy
 
@@ -23,8 +26,67 @@ def transform_line(line: Matrix, transformation: Matrix) -> Matrix:
 
 
 def transform_conic(conic: Matrix, transformation: Matrix) -> Matrix:
-    """Applies a projective transformation to a conic."""
-    return transformation.adjugate().T * conic * transformation.adjugate()
+    """Applies a projective transformation to a conic.
+
+    Computes `adj(T)ᵀ·C·adj(T)`. If the last row of `T` is structurally
+    `(0, 0, w)`, i.e. the transformation is affine, and the conic matrix is
+    symmetric, it evaluates the six distinct elements of the result with
+    2x2 block formulas instead, which is several times faster and yields
+    smaller symbolic expressions.
+    """
+    if _has_affine_structure(transformation) and conic.is_symmetric(simplify=False):
+        return _transform_conic_affine(conic, _affine_factors(transformation))
+    adjugate = transformation.adjugate()
+    return adjugate.T * conic * adjugate
+
+
+def _has_affine_structure(transformation: Matrix) -> bool:
+    """Tells whether the last row of a matrix is structurally `(0, 0, w)`."""
+    return transformation[2, 0] == 0 and transformation[2, 1] == 0
+
+
+def _affine_factors(transformation: Matrix) -> tuple[Expr, ...]:
+    """Precomputes the factors of the adjugate of an affine transformation.
+
+    For `T = [[A, t], [0, w]]`, `adj(T) = [[w·P, u], [0, det A]]`, where
+    `P = adj(A) = [[d, -b], [-c, a]]` and `u = -P·t`. Returns
+    `(a, b, c, d, w, u₁, u₂, det A)`.
+    """
+    (a, b, tx), (c, d, ty), (_, _, w) = transformation.tolist()
+    u1 = expand(b * ty - d * tx)
+    u2 = expand(c * tx - a * ty)
+    return (a, b, c, d, w, u1, u2, expand(a * d - b * c))
+
+
+def _transform_conic_affine(conic: Matrix, factors: tuple[Expr, ...]) -> Matrix:
+    """Computes `adj(T)ᵀ·C·adj(T)` for an affine `T` and a symmetric `C`.
+
+    Takes the `_affine_factors` of `T`. With
+    `C = [[Q, p], [pᵀ, f]]` the result is
+
+        [[w²·PᵀQP,              w·(PᵀQ·u + det A·Pᵀp)          ],
+         [w·(PᵀQ·u + det A·Pᵀp)ᵀ, (Qu + det A·p)ᵀu + det A·(pᵀu + det A·f)]]
+    """
+    a, b, c, d, w, u1, u2, det = factors
+    q11, q12, r1 = conic[0, 0], conic[0, 1], conic[0, 2]
+    q22, r2, f = conic[1, 1], conic[1, 2], conic[2, 2]
+    # The rows of Pᵀ·Q and Pᵀ·p
+    s11 = d * q11 - c * q12
+    s12 = d * q12 - c * q22
+    s21 = a * q12 - b * q11
+    s22 = a * q22 - b * q12
+    v1 = d * r1 - c * r2
+    v2 = a * r2 - b * r1
+    w2 = w * w
+    e11 = w2 * (s11 * d - s12 * c)
+    e12 = w2 * (s12 * a - s11 * b)
+    e22 = w2 * (s22 * a - s21 * b)
+    e13 = w * (s11 * u1 + s12 * u2 + v1 * det)
+    e23 = w * (s21 * u1 + s22 * u2 + v2 * det)
+    h1 = q11 * u1 + q12 * u2 + r1 * det
+    h2 = q12 * u1 + q22 * u2 + r2 * det
+    e33 = h1 * u1 + h2 * u2 + (r1 * u1 + r2 * u2 + f * det) * det
+    return Matrix([[e11, e12, e13], [e12, e22, e23], [e13, e23, e33]])
 
 
 def transform_polar_conic(polar_conic: Matrix, transformation: Matrix) -> Matrix:
@@ -39,7 +101,12 @@ def translate(by: Matrix | Sequence[Expr]) -> Matrix:
 
 
 def rotate(angle_radians: Expr, around: Matrix | Sequence[Expr] = ORIGIN) -> Matrix:
-    """Computes the transformation matrix for a rotation around a point."""
+    """Computes the transformation matrix for a rotation around a point.
+
+    For symbolic angles, consider
+    [rotate_by_tangent](#transform.rotate_by_tangent), which results in
+    polynomial matrices instead of trigonometric ones.
+    """
     x0, y0 = point_to_xy(around)
     cos_angle = cos(angle_radians)
     sin_angle = sin(angle_radians)
@@ -53,6 +120,51 @@ def rotate(angle_radians: Expr, around: Matrix | Sequence[Expr] = ORIGIN) -> Mat
     )
 
 
+def rotate_by_half_angle_direction(
+    half_angle_direction: Matrix | Sequence[Expr],
+    around: Matrix | Sequence[Expr] = ORIGIN,
+) -> Matrix:
+    """Computes a polynomial matrix rotating around a point by twice the angle
+    of a direction vector.
+
+    The `(u, v)` direction doesn't need to be a unit vector, and the matrix is
+    free of trigonometric functions. Since
+    `cos(θ) = (u² - v²) / (u² + v²)` and `sin(θ) = 2uv / (u² + v²)`, the
+    matrix is [rotate](#transform.rotate) multiplied by `u² + v²`. It is
+    polynomial in the coordinates, so rational inputs result in rational
+    matrices, and the transformed conics stay free of trigonometric
+    expressions.
+    """
+    u, v = half_angle_direction
+    x0, y0 = point_to_xy(around)
+    norm = u**2 + v**2
+    cos_part = u**2 - v**2
+    sin_part = 2 * u * v
+
+    return Matrix(
+        [
+            [cos_part, -sin_part, 2 * v**2 * x0 + y0 * sin_part],
+            [sin_part, cos_part, 2 * v**2 * y0 - x0 * sin_part],
+            [0, 0, norm],
+        ],
+    )
+
+
+def rotate_by_tangent(
+    half_angle_tangent: Expr,
+    around: Matrix | Sequence[Expr] = ORIGIN,
+) -> Matrix:
+    """Computes a polynomial transformation matrix for a rotation by the angle
+    `θ = 2·atan(t)` around a point.
+
+    Equivalent to
+    [rotate_by_half_angle_direction](#transform.rotate_by_half_angle_direction)
+    with the direction `(1, t)`, i.e. [rotate](#transform.rotate) multiplied by
+    `1 + t²`. Every rotation except the one by `π` has a finite `t`.
+    """
+    return rotate_by_half_angle_direction((1, half_angle_tangent), around)
+
+
 def reflect_to_line(axis: Matrix) -> Matrix:
     """Computes the transformation matrix for a reflection to a line.
 
@@ -106,6 +218,10 @@ def homography_from_samples(
     and the target quadrilaterals must be non-degenerate. Returns a 3x3
     projective transformation matrix.
 
+    Use [fit_homography](#homography.fit_homography) or
+    [ransac_homography](#homography.ransac_homography) to estimate a
+    homography from more than 4 noisy numeric correspondences.
+
     *Research*:
     [research/transformation/homography_from_samples.py](../src/research/transformation/homography_from_samples.py)
     """
@@ -126,3 +242,259 @@ def homography_from_samples(
     # The intermediade points could be anything, but this specific selection
     # results in very simple transformation matrices for both steps.
     return t[:, :3] * Matrix.diag([t0 / s0, t1 / s1, t2 / s2]) * s[:, :3].inv()
+
+
+#: Marks the derived matrices that haven't been computed yet.
+_UNSET = object()
+
+
+def _is_batch(items: object) -> bool:
+    """Tells whether a list or tuple holds several entities rather than the
+    coordinates of a single point or line.
+    """
+    return (
+        isinstance(items, (list, tuple))
+        and len(items) > 0
+        and all(isinstance(item, (MatrixBase, Sequence, np.ndarray)) for item in items)
+    )
+
+
+class Transform:
+    """A projective transformation composed of a chain of simpler ones.
+
+    `Transform` objects are immutable. The methods named after the
+    transformation matrix constructors of this module, e.g.
+    [translate](#transform.Transform.translate) or
+    [rotate](#transform.Transform.rotate), return a new object that applies
+    one more transformation after the existing ones:
+
+        Transform().translate((1, 2)).rotate(pi / 2).scale(3)
+
+    The chain is multiplied into a single matrix on first use, and the matrix,
+    its adjugate and their floating-point versions are computed at most once
+    per object, so the transformation can be applied to many entities
+    cheaply. Whether the transformation is affine is also decided only once,
+    see [transform_conic](#transform.transform_conic).
+
+    The `transform_*` methods take either a single entity, a list of them, or
+    a NumPy array:
+
+    - Single sympy entities and lists of them are transformed exactly, like
+      the module-level functions do, returning a `Matrix` or a list.
+    - NumPy arrays are transformed in floating-point arithmetic: an (N,2) or
+      (N,3) array of points, an (N,3) array of lines, or an (N,3,3) stack of
+      conics or polar conics. A single point, line or matrix is accepted too.
+    """
+
+    __slots__ = (
+        "_adjugate",
+        "_affine_factors",
+        "_float_adjugate",
+        "_float_matrix",
+        "_matrix",
+        "_steps",
+    )
+
+    def __init__(self, *matrices: Matrix) -> None:
+        """Creates a transformation that applies the given 3x3 transformation
+        matrices in order, or the identity transformation if there are none.
+        """
+        self._steps = tuple(ImmutableMatrix(matrix) for matrix in matrices)
+        if any(step.shape != (3, 3) for step in self._steps):
+            raise ValueError("The transformations must be 3x3 matrices.")
+        self._matrix = _UNSET
+        self._adjugate = _UNSET
+        self._affine_factors = _UNSET
+        self._float_matrix = _UNSET
+        self._float_adjugate = _UNSET
+
+    @property
+    def steps(self) -> tuple[ImmutableMatrix, ...]:
+        """The matrices of the chain in the order of application."""
+        return self._steps
+
+    def then(self, transformation: Matrix | Self) -> Self:
+        """Returns a transform that applies `transformation` after this one."""
+        if isinstance(transformation, Transform):
+            return type(self)(*self._steps, *transformation.steps)
+        return type(self)(*self._steps, transformation)
+
+    def translate(self, by: Matrix | Sequence[Expr]) -> Self:
+        """Appends a [translation](#transform.translate) to the chain."""
+        return self.then(translate(by))
+
+    def rotate(
+        self,
+        angle_radians: Expr,
+        around: Matrix | Sequence[Expr] = ORIGIN,
+    ) -> Self:
+        """Appends a [rotation](#transform.rotate) to the chain."""
+        return self.then(rotate(angle_radians, around))
+
+    def rotate_by_half_angle_direction(
+        self,
+        half_angle_direction: Matrix | Sequence[Expr],
+        around: Matrix | Sequence[Expr] = ORIGIN,
+    ) -> Self:
+        """Appends a rotation by twice the angle of a direction vector to the
+        chain, see
+        [rotate_by_half_angle_direction](#transform.rotate_by_half_angle_direction).
+        """
+        return self.then(rotate_by_half_angle_direction(half_angle_direction, around))
+
+    def rotate_by_tangent(
+        self,
+        half_angle_tangent: Expr,
+        around: Matrix | Sequence[Expr] = ORIGIN,
+    ) -> Self:
+        """Appends a [polynomial rotation](#transform.rotate_by_tangent) to the
+        chain.
+        """
+        return self.then(rotate_by_tangent(half_angle_tangent, around))
+
+    def reflect(self, axis: Matrix) -> Self:
+        """Appends a [reflection](#transform.reflect_to_line) to the chain."""
+        return self.then(reflect_to_line(axis))
+
+    def scale(self, factor: Expr, center: Sequence[Expr] | Matrix = ORIGIN) -> Self:
+        """Appends a uniform [scaling](#transform.scale) to the chain."""
+        return self.then(scale(factor, center))
+
+    def scale_xy(
+        self,
+        scale_x: Expr,
+        scale_y: Expr,
+        center: Sequence[Expr] | Matrix = ORIGIN,
+    ) -> Self:
+        """Appends a [scaling](#transform.scale_xy) along the axes to the
+        chain.
+        """
+        return self.then(scale_xy(scale_x, scale_y, center))
+
+    def homography(
+        self,
+        source_points: Sequence[Matrix | Sequence[Expr]],
+        target_points: Sequence[Matrix | Sequence[Expr]],
+    ) -> Self:
+        """Appends the [homography](#transform.homography_from_samples) mapping
+        4 source points to 4 target points to the chain.
+        """
+        return self.then(homography_from_samples(source_points, target_points))
+
+    def inverse(self) -> Self:
+        """Returns the inverse transformation.
+
+        Its matrix is the adjugate of this transformation's matrix, which
+        differs from the inverse matrix only by a scalar factor.
+        """
+        return type(self)(self.adjugate)
+
+    @property
+    def matrix(self) -> ImmutableMatrix:
+        """The product of the matrices in the chain."""
+        if self._matrix is _UNSET:
+            matrix = ImmutableMatrix.eye(3)
+            for step in self._steps:
+                matrix = step * matrix
+            self._matrix = matrix
+        return self._matrix
+
+    @property
+    def adjugate(self) -> ImmutableMatrix:
+        """The adjugate of the transformation matrix."""
+        if self._adjugate is _UNSET:
+            self._adjugate = self.matrix.adjugate()
+        return self._adjugate
+
+    def transform_point(
+        self,
+        points: Matrix | Sequence[Expr] | Sequence[Matrix | Sequence[Expr]] | NDArray,
+    ) -> Matrix | list[Matrix] | NDArray[np.float64]:
+        """Applies the transformation to one or more points.
+
+        Returns 3D column vectors even if the input points are specified with
+        only two coordinates. See [transform_point](#transform.transform_point).
+        """
+        if isinstance(points, np.ndarray):
+            points = np.asarray(points, dtype=float)
+            if points.shape[-1] == 2:
+                points = np.concatenate(
+                    [points, np.ones((*points.shape[:-1], 1))],
+                    axis=-1,
+                )
+            return points @ self._float_matrix_value().T
+        if _is_batch(points):
+            return [self._apply_to_point(point) for point in points]
+        return self._apply_to_point(points)
+
+    def transform_line(
+        self,
+        lines: Matrix | Sequence[Matrix] | NDArray,
+    ) -> Matrix | list[Matrix] | NDArray[np.float64]:
+        """Applies the transformation to one or more lines.
+
+        See [transform_line](#transform.transform_line).
+        """
+        if isinstance(lines, np.ndarray):
+            return np.asarray(lines, dtype=float) @ self._float_adjugate_value()
+        if _is_batch(lines):
+            return [self._apply_to_line(line) for line in lines]
+        return self._apply_to_line(lines)
+
+    def transform_conic(
+        self,
+        conics: Matrix | Sequence[Matrix] | NDArray,
+    ) -> Matrix | list[Matrix] | NDArray[np.float64]:
+        """Applies the transformation to one or more conics.
+
+        See [transform_conic](#transform.transform_conic).
+        """
+        if isinstance(conics, np.ndarray):
+            adjugate = self._float_adjugate_value()
+            return adjugate.T @ np.asarray(conics, dtype=float) @ adjugate
+        if isinstance(conics, MatrixBase):
+            return self._apply_to_conic(conics)
+        return [self._apply_to_conic(conic) for conic in conics]
+
+    def transform_polar_conic(
+        self,
+        polar_conics: Matrix | Sequence[Matrix] | NDArray,
+    ) -> Matrix | list[Matrix] | NDArray[np.float64]:
+        """Applies the transformation to one or more conics in polar form.
+
+        See [transform_polar_conic](#transform.transform_polar_conic).
+        """
+        if isinstance(polar_conics, np.ndarray):
+            return self._float_matrix_value() @ np.asarray(polar_conics, dtype=float)
+        if isinstance(polar_conics, MatrixBase):
+            return (self.matrix * polar_conics).as_mutable()
+        return [
+            (self.matrix * polar_conic).as_mutable() for polar_conic in polar_conics
+        ]
+
+    def _apply_to_point(self, point: Matrix | Sequence[Expr]) -> Matrix:
+        return (self.matrix * point_to_vec3(point)).as_mutable()
+
+    def _apply_to_line(self, line: Matrix) -> Matrix:
+        return (self.adjugate.T * line).as_mutable()
+
+    def _apply_to_conic(self, conic: Matrix) -> Matrix:
+        if self._affine_factors is _UNSET:
+            self._affine_factors = (
+                _affine_factors(self.matrix)
+                if _has_affine_structure(self.matrix)
+                else None
+            )
+        if self._affine_factors is not None and conic.is_symmetric(simplify=False):
+            return _transform_conic_affine(conic, self._affine_factors)
+        return (self.adjugate.T * conic * self.adjugate).as_mutable()
+
+    def _float_matrix_value(self) -> NDArray[np.float64]:
+        if self._float_matrix is _UNSET:
+            self._float_matrix = np.array(self.matrix, dtype=float)
+        return self._float_matrix
+
+    def _float_adjugate_value(self) -> NDArray[np.float64]:
+        if self._float_adjugate is _UNSET:
+            self._float_adjugate = np.array(self.adjugate, dtype=float)
+        return self._float_adjugate
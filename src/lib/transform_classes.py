@@ -1,13 +1,126 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from fractions import Fraction
 
-from sympy import Expr, Matrix, simplify
-from sympy.core.logic import fuzzy_and
+import numpy as np
+from numpy.typing import NDArray
+from sympy import Expr, Matrix, Rational, expand
+from sympy.core.logic import fuzzy_and, fuzzy_not
+
+from lib.batch import DEFAULT_TOLERANCE
+from lib.simplifier import TieredSimplifier
+
+#: The transformation classes from the most general to the most specific, each
+#: adding conditions to the previous one.
+_HOMOGRAPHY, _AFFINE_TRANSFORM, _SIMILARITY, _CONGRUENCE = range(4)
+
+
+def _elements(transformation: Matrix | NDArray[np.float64]) -> list:
+    """Returns the elements of a 3x3 matrix in row-major order.
+
+    The elements of numeric matrices are converted to exact fractions if all of
+    them are rational, or to floats otherwise. Symbolic elements are returned
+    as sympy expressions.
+    """
+    if isinstance(transformation, np.ndarray):
+        if np.issubdtype(transformation.dtype, np.integer):
+            return [Fraction(int(el)) for el in transformation.flat]
+        if np.issubdtype(transformation.dtype, np.floating):
+            return [float(el) for el in transformation.flat]
+        transformation = Matrix(transformation)
+    if all(isinstance(el, Rational) for el in transformation):
+        return [Fraction(el.p, el.q) for el in transformation]
+    if all(el.is_Number and el.is_finite for el in transformation):
+        return [float(el) for el in transformation]
+    return list(transformation)
+
+
+def _zero_test(
+    elements: Sequence[Fraction | float | Expr],
+    simplifier: Callable[[Expr], Expr],
+    tolerance: float,
+) -> Callable[[object, int], bool | None]:
+    """Returns a function deciding whether a homogeneous polynomial of the
+    given degree in the matrix elements vanishes.
+
+    Exact values are compared to zero, floats up to `tolerance` relative to the
+    matching power of the Frobenius norm of the matrix, and symbolic
+    expressions after simplification.
+    """
+    if isinstance(elements[0], float):
+        norm = float(np.linalg.norm(elements))
+        return lambda value, degree: abs(value) <= tolerance * norm**degree
+    if isinstance(elements[0], Fraction):
+        return lambda value, _: value == 0
+    return lambda expr, _: simplifier(expand(expr)).is_zero
+
+
+def _is_transform_class(
+    elements: Sequence[Fraction | float | Expr],
+    is_zero: Callable[[object, int], bool | None],
+    transform_class: int,
+) -> bool | None:
+    """Decides the conditions of a transformation class and all of the more
+    general ones in a single pass.
+
+    The conditions are evaluated from the cheapest to the most expensive, and
+    the evaluation stops at the first failing one.
+    """
+    a, b, c, d, e, f, g, h, i = elements
+    minor = a * e - b * d
+
+    # (polynomial, degree, whether it must vanish) triples
+    conditions: list[tuple[object, int, bool]] = []
+    if transform_class >= _AFFINE_TRANSFORM:
+        conditions.extend([(g, 1, True), (h, 1, True), (i, 1, False)])
+    if transform_class >= _SIMILARITY:
+        conditions.extend(
+            [
+                (a * a - e * e, 2, True),
+                (b * b - d * d, 2, True),
+                (a * b + d * e, 2, True),
+            ],
+        )
+    if transform_class >= _CONGRUENCE:
+        conditions.append((a * a + b * b - i * i, 2, True))
+
+    results = []
+    for polynomial, degree, must_vanish in conditions:
+        vanishes = is_zero(polynomial, degree)
+        result = vanishes if must_vanish else fuzzy_not(vanishes)
+        if result is False:
+            return False
+        results.append(result)
+
+    # For affine matrices the determinant is i·(ae - bd), and i ≠ 0 is already
+    # required above.
+    if transform_class >= _AFFINE_TRANSFORM and results[:2] == [True, True]:
+        is_singular = is_zero(minor, 2)
+    else:
+        is_singular = is_zero(g * (b * f - c * e) - h * (a * f - c * d) + i * minor, 3)
+    results.append(fuzzy_not(is_singular))
+    return fuzzy_and(results)
+
+
+def _decide_transform_class(
+    transformation: Matrix | NDArray[np.float64],
+    transform_class: int,
+    simplifier: Callable[[Expr], Expr] | None,
+    tolerance: float,
+) -> bool | None:
+    if transformation.shape != (3, 3):
+        return False
+    elements = _elements(transformation)
+    if simplifier is None:
+        simplifier = TieredSimplifier()
+    is_zero = _zero_test(elements, simplifier, tolerance)
+    return _is_transform_class(elements, is_zero, transform_class)
 
 
 def is_homography(
-    transformation: Matrix,
+    transformation: Matrix | NDArray[np.float64],
     *,
-    simplifier: Callable[[Expr], Expr] = simplify,
+    simplifier: Callable[[Expr], Expr] | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
 ) -> bool | None:
     """Checks whether a transformation matrix represents a homography.
 
@@ -16,18 +129,25 @@ def is_homography(
 
     The optional `simplifier` is applied to the determinant before comparing it
     to zero. If the determinant cannot be decided to be zero or non-zero after
-    simplification, the function returns `None`.
+    simplification, the function returns `None`. The default simplifier is a
+    new [TieredSimplifier](#simplifier.TieredSimplifier) for each call, which
+    escalates to `simplify` only when cheaper steps leave the answer
+    undecided. Its tier counts are only kept on instances passed by the
+    caller.
+
+    Matrices of rational numbers are checked in exact arithmetic without
+    simplification. Floating-point matrices, including NumPy arrays, are
+    checked in floating-point arithmetic, treating values up to `tolerance`
+    times the matching power of the matrix's Frobenius norm as zero.
     """
-    if transformation.shape != (3, 3):
-        return False
-
-    return simplifier(transformation.det()).is_nonzero
+    return _decide_transform_class(transformation, _HOMOGRAPHY, simplifier, tolerance)
 
 
 def is_affine_transform(
-    transformation: Matrix,
+    transformation: Matrix | NDArray[np.float64],
     *,
-    simplifier: Callable[[Expr], Expr] = simplify,
+    simplifier: Callable[[Expr], Expr] | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
 ) -> bool | None:
     """Checks whether a matrix represents an affine transformation.
 
@@ -38,86 +158,96 @@ def is_affine_transform(
 
     The optional `simplifier` is applied to the affinity checking polynomials
     before comparing them to zero. If the polynomials cannot be decided to be
-    zero or non-zero after simplification, the function returns `None`.
+    zero or non-zero after simplification, the function returns `None`. The
+    default simplifier is a new
+    [TieredSimplifier](#simplifier.TieredSimplifier) for each call. Numeric
+    matrices are checked like in
+    [is_homography](#transform_classes.is_homography).
     """
-    if transformation.shape != (3, 3):
-        return False
-
-    row2 = transformation.row(2)
-    return fuzzy_and(
-        [
-            is_homography(transformation, simplifier=simplifier),
-            simplifier(row2[0]).is_zero,
-            simplifier(row2[1]).is_zero,
-            simplifier(row2[2]).is_nonzero,
-        ],
+    return _decide_transform_class(
+        transformation,
+        _AFFINE_TRANSFORM,
+        simplifier,
+        tolerance,
     )
 
 
 def is_similarity(
-    transformation: Matrix,
+    transformation: Matrix | NDArray[np.float64],
     *,
-    simplifier: Callable[[Expr], Expr] = simplify,
+    simplifier: Callable[[Expr], Expr] | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
 ) -> bool | None:
     """Checks whether a matrix represents a similarity transformation.
 
     The optional `simplifier` is applied to the similarity checking polynomials
     before comparing them to zero. If the polynomials cannot be decided to be
-    zero or non-zero after simplification, the function returns `None`.
+    zero or non-zero after simplification, the function returns `None`. The
+    default simplifier is a new
+    [TieredSimplifier](#simplifier.TieredSimplifier) for each call. Numeric
+    matrices are checked like in
+    [is_homography](#transform_classes.is_homography).
     """
-    if transformation.shape != (3, 3):
-        return False
-
-    a, b, c, d = transformation[:2, :2]
-
-    return fuzzy_and(
-        [
-            is_affine_transform(transformation, simplifier=simplifier),
-            simplifier(a * a - d * d).is_zero,
-            simplifier(b * b - c * c).is_zero,
-            simplifier(a * b + c * d).is_zero,
-        ],
-    )
+    return _decide_transform_class(transformation, _SIMILARITY, simplifier, tolerance)
 
 
 def is_congruence(
-    transformation: Matrix,
+    transformation: Matrix | NDArray[np.float64],
     *,
-    simplifier: Callable[[Expr], Expr] = simplify,
+    simplifier: Callable[[Expr], Expr] | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
 ) -> bool | None:
     """Checks whether a matrix represents a congruence transformation.
 
     The optional `simplifier` is applied to the congruence checking polynomials
     before comparing them to zero. If the polynomials cannot be decided to be
-    zero or non-zero after simplification, the function returns `None`.
+    zero or non-zero after simplification, the function returns `None`. The
+    default simplifier is a new
+    [TieredSimplifier](#simplifier.TieredSimplifier) for each call. Numeric
+    matrices are checked like in
+    [is_homography](#transform_classes.is_homography).
     """
-    if transformation.shape != (3, 3):
-        return False
-
-    a, b, *_, i = transformation
-
-    return fuzzy_and(
-        [
-            is_similarity(transformation, simplifier=simplifier),
-            simplifier(a * a + b * b - i * i).is_zero,
-        ],
-    )
+    return _decide_transform_class(transformation, _CONGRUENCE, simplifier, tolerance)
 
 
 def is_involution(
-    transformation: Matrix,
+    transformation: Matrix | NDArray[np.float64],
     *,
-    simplifier: Callable[[Expr], Expr] = simplify,
+    simplifier: Callable[[Expr], Expr] | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
 ) -> bool | None:
     """Checks whether applying the transformation twice is the identity.
 
-    The optional `simplifier` is applied to the matrix elements before
-    comparing them to zero. If they cannot be decided to be zero or non-zero
-    after simplification, the function returns `None`.
+    The transformation is an involution if its square is a non-zero multiple
+    of the identity matrix. The optional `simplifier` is applied to the
+    off-diagonal elements and the differences of the diagonal elements of the
+    square before comparing them to zero. If they cannot be decided to be zero
+    or non-zero after simplification, the function returns `None`. The default
+    simplifier is a new [TieredSimplifier](#simplifier.TieredSimplifier) for
+    each call. Numeric matrices are checked like in
+    [is_homography](#transform_classes.is_homography).
     """
     if transformation.shape != (3, 3):
         return False
-
-    double_transformation = simplifier(transformation * transformation)
-    double_transformation /= double_transformation[0, 0]
-    return (double_transformation - Matrix.eye(3)).is_zero_matrix
+    if simplifier is None:
+        simplifier = TieredSimplifier()
+    elements = _elements(transformation)
+    rows = [elements[i : i + 3] for i in range(0, 9, 3)]
+    square = [
+        [sum(rows[i][k] * rows[k][j] for k in range(3)) for j in range(3)]
+        for i in range(3)
+    ]
+    polynomials = [
+        *(square[i][j] for i in range(3) for j in range(3) if i != j),
+        square[1][1] - square[0][0],
+        square[2][2] - square[0][0],
+        square[0][0],
+    ]
+    if isinstance(elements[0], Expr):
+        # A single simplifier call decides all of them, like for a matrix.
+        simplified = simplifier(Matrix(polynomials).applyfunc(expand))
+        vanishes = [el.is_zero for el in simplified]
+    else:
+        is_zero = _zero_test(elements, simplifier, tolerance)
+        vanishes = [is_zero(polynomial, 2) for polynomial in polynomials]
+    return fuzzy_and([*vanishes[:-1], fuzzy_not(vanishes[-1])])
@@ -0,0 +1,228 @@
+"""Immutable, hashable point, line and conic value types.
+
+The rest of the library works with mutable `sympy.Matrix` objects, which cannot
+be dictionary keys or memoized. The classes in this module wrap an
+`ImmutableMatrix`, validate its shape once, and compute derived quantities such
+as the determinant or the center of a conic lazily, at most once per object.
+
+They interoperate with the existing functions:
+
+- `Point` and `Line` behave as 3-element sequences and sympify to their
+  homogeneous coordinate vectors, so they can be passed wherever a point or a
+  line is expected.
+- `Conic.matrix` is the `ImmutableMatrix` representation, accepted by all
+  functions taking a conic matrix.
+- The constructors accept the matrices returned by the existing functions.
+"""
+
+from collections.abc import Iterator, Sequence
+from typing import override
+
+from sympy import Expr, ImmutableMatrix, Matrix, sqrt
+
+from lib.central_conic import conic_center
+from lib.conic_classes import ConicType, classify_conic
+from lib.conic_direction import ConicNormFactor
+from lib.invariants import conic_adjugate, conic_det, submatrix_det
+from lib.point import point_to_vec3, point_to_xy
+
+#: Marks the derived quantities that haven't been computed yet.
+_UNSET = object()
+
+
+class _Vector3:
+    """Common base of the homogeneous 3-vector value types."""
+
+    __slots__ = ("_hash", "_vec")
+
+    def __init__(self, coords: Matrix | Sequence[Expr]) -> None:
+        self._vec = ImmutableMatrix(coords)
+        if self._vec.shape != (3, 1):
+            raise ValueError("The coordinates must form a 3D column vector.")
+        self._hash = hash((type(self).__name__, self._vec))
+
+    @property
+    def vec(self) -> ImmutableMatrix:
+        """The homogeneous coordinates as a 3D column vector."""
+        return self._vec
+
+    def as_mutable(self) -> Matrix:
+        """Returns the homogeneous coordinates as a mutable `Matrix`."""
+        return self._vec.as_mutable()
+
+    def _sympy_(self) -> ImmutableMatrix:
+        return self._vec
+
+    def __iter__(self) -> Iterator[Expr]:
+        return iter(self._vec)
+
+    def __len__(self) -> int:
+        return 3
+
+    def __getitem__(self, index: int) -> Expr:
+        return self._vec[index]
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._vec == other._vec
+
+    @override
+    def __hash__(self) -> int:
+        return self._hash
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._vec)})"
+
+
+class Point(_Vector3):
+    """A projective point.
+
+    Takes the Euclidean or homogeneous coordinates of the point. Equality and
+    hashing consider the exact coordinates, so `Point([1, 2])` equals
+    `Point([1, 2, 1])`, but not `Point([2, 4, 2])`.
+    """
+
+    __slots__ = ("_xy",)
+
+    def __init__(self, coords: Matrix | Sequence[Expr]) -> None:
+        """Creates a point from its 2 or 3 coordinates."""
+        super().__init__(point_to_vec3(coords))
+        self._xy = _UNSET
+
+    @property
+    def xy(self) -> ImmutableMatrix:
+        """The Euclidean coordinates as a 2D column vector. Cached."""
+        if self._xy is _UNSET:
+            self._xy = ImmutableMatrix(point_to_xy(self._vec))
+        return self._xy
+
+
+class Line(_Vector3):
+    """A projective line given by the coefficients of `ax + by + c = 0`."""
+
+    __slots__ = ("_normalized",)
+
+    def __init__(self, coords: Matrix | Sequence[Expr]) -> None:
+        """Creates a line from its 3 homogeneous coordinates."""
+        super().__init__(coords)
+        self._normalized = _UNSET
+
+    @property
+    def normalized(self) -> ImmutableMatrix:
+        """The line scaled such that `a² + b² = 1`. Cached.
+
+        The ideal line has no such form; its coordinates are divided by zero.
+        """
+        if self._normalized is _UNSET:
+            a, b, _ = self._vec
+            self._normalized = self._vec / sqrt(a * a + b * b)
+        return self._normalized
+
+
+class Conic:
+    """A conic given by its symmetric 3x3 matrix.
+
+    Equality and hashing consider the exact matrix elements. The derived
+    quantities are computed on first access and kept for the lifetime of the
+    object.
+    """
+
+    __slots__ = (
+        "_adjugate",
+        "_center",
+        "_conic_type",
+        "_det",
+        "_hash",
+        "_matrix",
+        "_normalized",
+        "_submatrix_det",
+    )
+
+    def __init__(self, matrix: Matrix | Sequence[Sequence[Expr]]) -> None:
+        """Creates a conic from its 3x3 matrix."""
+        self._matrix = ImmutableMatrix(matrix)
+        if self._matrix.shape != (3, 3):
+            raise ValueError("The conic must be a 3x3 matrix.")
+        self._hash = hash((type(self).__name__, self._matrix))
+        self._det = _UNSET
+        self._adjugate = _UNSET
+        self._submatrix_det = _UNSET
+        self._center = _UNSET
+        self._normalized = _UNSET
+        self._conic_type = _UNSET
+
+    @property
+    def matrix(self) -> ImmutableMatrix:
+        """The conic matrix."""
+        return self._matrix
+
+    def as_mutable(self) -> Matrix:
+        """Returns the conic matrix as a mutable `Matrix`."""
+        return self._matrix.as_mutable()
+
+    @property
+    def det(self) -> Expr:
+        """The determinant of the conic matrix. Cached."""
+        if self._det is _UNSET:
+            self._det = conic_det(self._matrix)
+        return self._det
+
+    @property
+    def adjugate(self) -> ImmutableMatrix:
+        """The adjugate of the conic matrix, i.e. the dual conic. Cached."""
+        if self._adjugate is _UNSET:
+            self._adjugate = ImmutableMatrix(conic_adjugate(self._matrix))
+        return self._adjugate
+
+    @property
+    def submatrix_det(self) -> Expr:
+        """The determinant of the upper-left 2x2 submatrix. Cached."""
+        if self._submatrix_det is _UNSET:
+            self._submatrix_det = submatrix_det(self._matrix)
+        return self._submatrix_det
+
+    @property
+    def center(self) -> ImmutableMatrix:
+        """The center point as a 2D column vector. Cached.
+
+        See [conic_center](#central_conic.conic_center) for the details.
+        """
+        if self._center is _UNSET:
+            self._center = ImmutableMatrix(conic_center(self._matrix))
+        return self._center
+
+    @property
+    def normalized(self) -> ImmutableMatrix:
+        """The conic matrix multiplied by its
+        [ConicNormFactor](#conic_direction.ConicNormFactor). Cached.
+        """
+        if self._normalized is _UNSET:
+            self._normalized = self._matrix * ConicNormFactor(self._matrix)
+        return self._normalized
+
+    @property
+    def conic_type(self) -> ConicType | None:
+        """The type of the conic, or `None` if undecidable. Cached.
+
+        See [classify_conic](#conic_classes.classify_conic).
+        """
+        if self._conic_type is _UNSET:
+            self._conic_type = classify_conic(self._matrix)
+        return self._conic_type
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._matrix == other._matrix
+
+    @override
+    def __hash__(self) -> int:
+        return self._hash
+
+    @override
+    def __repr__(self) -> str:
+        return f"Conic({self._matrix.tolist()})"
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+import time
+from collections.abc import Callable
+
+from sympy import Matrix, symbols
+
+from lib.central_conic import conic_from_foci_and_radius
+from lib.circle import circle
+from lib.conic import conic_from_focus_and_directrix
+from lib.conic_classes import (
+    ConicType,
+    classify_conic,
+    is_double_line,
+    is_ellipse,
+    is_hyperbola,
+    is_imaginary_ellipse,
+    is_line_pair,
+    is_parabola,
+    is_point_conic,
+)
+from lib.degenerate_conic import line_pair_conic
+from lib.ellipse import ellipse
+from lib.invariants import clear_invariant_cache
+from lib.line import X_AXIS
+from lib.matrix import conic_matrix
+
+REPEAT = 3
+
+
+def classify_with_predicates(conic: Matrix) -> ConicType | None:
+    """Finds the conic type by evaluating the predicates one after another."""
+    if conic.is_zero_matrix:
+        return ConicType.ZERO_MATRIX
+    cascade = [
+        (is_imaginary_ellipse, ConicType.IMAGINARY_ELLIPSE),
+        (is_ellipse, ConicType.ELLIPSE),
+        (is_parabola, ConicType.PARABOLA),
+        (is_hyperbola, ConicType.HYPERBOLA),
+        (is_double_line, ConicType.DOUBLE_LINE),
+        (is_point_conic, ConicType.POINT_CONIC),
+        (is_line_pair, ConicType.LINE_PAIR),
+    ]
+    for predicate, conic_type in cascade:
+        if predicate(conic):
+            return conic_type
+    return None
+
+
+def measure_ms(
+    classifier: Callable[[Matrix], ConicType | None],
+    conic: Matrix,
+) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        clear_invariant_cache()
+        start = time.perf_counter()
+        classifier(conic)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+x, y = symbols("x y")
+p = symbols("p", positive=True)
+r1, r2 = symbols("r1 r2", positive=True)
+directrix = Matrix(symbols("a b c", positive=True))
+
+conics = {
+    "numeric ellipse": ellipse((1, 2), 3, 4, r1_angle=1),
+    "numeric line pair": line_pair_conic(Matrix([1, 2, 3]), Matrix([4, 5, 6])),
+    "numeric general conic": conic_matrix(1, 2, 3, 4, 5, 6),
+    "symbolic circle": circle((x, y), p),
+    "symbolic ellipse": ellipse((x, y), r1, r2, r1_direction=(1, 2)),
+    "symbolic parabola": conic_from_focus_and_directrix((0, 0), directrix, 1),
+    "symbolic hyperbola": conic_from_foci_and_radius((x, y), (x + 4 * p, y), p),
+    "symbolic line pair": line_pair_conic(directrix, X_AXIS),
+}
+
+print("\nClassification time, predicate cascade vs. classify_conic:\n")
+
+for name, conic in conics.items():
+    conic_type = classify_conic(conic)
+    assert classify_with_predicates(conic) == conic_type, name
+    cascade_ms = measure_ms(classify_with_predicates, conic)
+    single_pass_ms = measure_ms(classify_conic, conic)
+    print(
+        f"  {name} ({conic_type.name if conic_type else 'unknown'}): "
+        f"{cascade_ms:.1f} ms vs. {single_pass_ms:.1f} ms "
+        f"({cascade_ms / single_pass_ms:.1f}x)",
+    )
+print()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+import time
+from collections.abc import Callable, Sequence
+
+from sympy import Matrix, Symbol, expand, symbols
+from sympy.core.cache import clear_cache
+
+from lib.incidence import are_collinear
+from lib.point import point_to_vec3
+
+#: Above this many points the Gram determinant takes too long to measure.
+MAX_GRAM_POINTS = {"integer": 1000, "symbolic": 100}
+
+
+def gram_determinant_collinearity(points: Sequence[Matrix]) -> bool | None:
+    """The previous implementation, which computes det(M·Mᵀ) for the 3xn
+    matrix of the points.
+    """
+    matrix = Matrix.hstack(*(point_to_vec3(p) for p in points))
+    return expand((matrix * matrix.T).det()).is_zero
+
+
+def measure_ms(
+    is_collinear: Callable[[Sequence[Matrix]], bool | None],
+    points: Sequence[Matrix],
+) -> float:
+    clear_cache()
+    start = time.perf_counter()
+    assert is_collinear(points) is True
+    return (time.perf_counter() - start) * 1000
+
+
+def integer_points(n: int) -> list[tuple[int, int]]:
+    return [(i, 3 * i - 7) for i in range(n)]
+
+
+def symbolic_points(n: int) -> list[tuple[Symbol, Symbol]]:
+    t, c = symbols("t c")
+    return [(i * t, 2 * i * t + c) for i in range(n)]
+
+
+print("\nCollinearity check of n points, Gram determinant vs. pivot pair:\n")
+
+for name, make_points in [("integer", integer_points), ("symbolic", symbolic_points)]:
+    for n in (10, 100, 1000, 10_000):
+        points = make_points(n)
+        pivot_ms = measure_ms(are_collinear, points)
+        if n > MAX_GRAM_POINTS[name]:
+            print(f"  {name}, n={n}: skipped vs. {pivot_ms:.1f} ms")
+            continue
+        gram_ms = measure_ms(gram_determinant_collinearity, points)
+        print(
+            f"  {name}, n={n}: {gram_ms:.1f} ms vs. {pivot_ms:.1f} ms "
+            f"({gram_ms / pivot_ms:.1f}x)",
+        )
+print()
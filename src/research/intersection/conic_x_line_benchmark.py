@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+import time
+from collections.abc import Callable
+
+from sympy import Matrix, Rational
+from sympy.core.cache import clear_cache
+
+from lib.circle import UNIT_CIRCLE
+from lib.ellipse import ellipse
+from lib.intersection import _symbolic_conic_x_line, conic_x_line
+from lib.matrix import conic_matrix
+
+REPEAT = 20
+
+
+def measure_us(
+    intersect: Callable[[Matrix, Matrix], object],
+    conic: Matrix,
+    line: Matrix,
+) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        clear_cache()
+        start = time.perf_counter()
+        intersect(conic, line)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+cases = {
+    "unit circle, secant": (UNIT_CIRCLE, Matrix([1, 2, 1])),
+    "unit circle, tangent": (UNIT_CIRCLE, Matrix([0, 1, -1])),
+    "unit circle, ideal line": (UNIT_CIRCLE, Matrix([0, 0, 1])),
+    "rational ellipse": (
+        ellipse((1, 2), 3, Rational(5, 2)),
+        Matrix([Rational(1, 3), -1, 4]),
+    ),
+    "general integer conic": (conic_matrix(1, 2, 3, 4, 5, -6), Matrix([1, 2, 3])),
+}
+
+print("\nconic_x_line time, Piecewise path vs. rational fast path:\n")
+
+for name, (conic, line) in cases.items():
+    assert conic_x_line(conic, line) == _symbolic_conic_x_line(conic, line), name
+    piecewise_us = measure_us(_symbolic_conic_x_line, conic, line)
+    fast_us = measure_us(conic_x_line, conic, line)
+    print(
+        f"  {name}: {piecewise_us:.0f} µs vs. {fast_us:.0f} µs "
+        f"({piecewise_us / fast_us:.1f}x)",
+    )
+print()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+import time
+from collections.abc import Callable
+
+from sympy import Expr, Matrix, Rational, atan, factor, simplify, symbols
+from sympy.core.cache import clear_cache
+
+from lib.central_conic import conic_center
+from lib.conic_classes import is_finite_conic, is_nondegenerate
+from lib.ellipse import ellipse
+from lib.invariants import clear_invariant_cache
+from lib.transform import rotate, rotate_by_tangent, transform_conic
+
+REPEAT = 3
+
+theta, t, x, y = symbols("theta t x y", real=True)
+conic = ellipse((3, -2), 5, 2)
+
+
+def pipeline(rotation: Matrix, simplifier: Callable[[Expr], Expr]) -> tuple:
+    """Rotates the ellipse, checks that it's still an ellipse, and finds its
+    center.
+    """
+    rotated = transform_conic(conic, rotation)
+    is_ellipse = is_nondegenerate(rotated, simplifier=simplifier) and (
+        is_finite_conic(rotated, simplifier=simplifier)
+    )
+    return is_ellipse, conic_center(rotated).applyfunc(simplifier)
+
+
+def measure_ms(rotation: Matrix, simplifier: Callable[[Expr], Expr]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        clear_cache()
+        clear_invariant_cache()
+        start = time.perf_counter()
+        pipeline(rotation, simplifier)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+# The trigonometric form needs simplify to decide the predicates, while factor
+# is enough for the polynomial tangent form.
+cases = {
+    "symbolic angle, rational pivot": (
+        rotate(theta, (1, Rational(1, 2))),
+        rotate_by_tangent(t, (1, Rational(1, 2))),
+    ),
+    "symbolic angle, symbolic pivot": (
+        rotate(theta, (x, y)),
+        rotate_by_tangent(t, (x, y)),
+    ),
+    "angle 2·atan(1/3), symbolic pivot": (
+        rotate(2 * atan(Rational(1, 3)), (x, y)),
+        rotate_by_tangent(Rational(1, 3), (x, y)),
+    ),
+}
+
+print("\nRotate an ellipse, classify it and find its center, trig vs. tangent form:\n")
+
+for name, (trig_rotation, tangent_rotation) in cases.items():
+    assert pipeline(trig_rotation, simplify)[0], name
+    assert pipeline(tangent_rotation, factor)[0], name
+    trig_ms = measure_ms(trig_rotation, simplify)
+    tangent_ms = measure_ms(tangent_rotation, factor)
+    print(
+        f"  {name}: {trig_ms:.0f} ms vs. {tangent_ms:.0f} ms "
+        f"({trig_ms / tangent_ms:.1f}x)",
+    )
+print()
@@ -0,0 +1,369 @@
+import itertools
+
+import numpy as np
+import pytest
+from sympy import Matrix
+
+from lib.batch import (
+    LineIntersectionType,
+    classify_conic,
+    conic_bounding_boxes,
+    conic_contains_point,
+    conic_through_points,
+    conic_x_conic,
+    conic_x_line,
+    quadratic_form,
+    sampson_distances,
+)
+from lib.circle import UNIT_CIRCLE, circle
+from lib.conic import conic_through_points as exact_conic_through_points
+from lib.conic_classes import ConicType
+from lib.conic_classes import classify_conic as exact_classify_conic
+from lib.degenerate_conic import line_pair_conic
+from lib.ellipse import ellipse
+from lib.hyperbola import UNIT_HYPERBOLA
+from lib.intersection import conic_x_line as exact_conic_x_line
+from lib.line import line_between
+from lib.matrix import conic_matrix
+from lib.matrix import quadratic_form as exact_quadratic_form
+from lib.transform import transform_conic, translate
+
+
+class TestQuadraticForm:
+    def test_single_conic(self):
+        conic = conic_matrix(1, 2, 3, 4, 5, 6)
+        points = [(1, 2), (-3, 4), (0, 0)]
+        expected = [float(exact_quadratic_form(conic, Matrix([*p, 1]))) for p in points]
+        assert quadratic_form(conic, points).tolist() == expected
+
+    def test_homogeneous_points(self):
+        conic = conic_matrix(1, 2, 3, 4, 5, 6)
+        points = [(1, 2, 3), (-3, 4, 0), (0, 0, -1)]
+        expected = [float(exact_quadratic_form(conic, Matrix(p))) for p in points]
+        assert quadratic_form(conic, points).tolist() == expected
+
+    def test_conic_stack(self):
+        conics = [UNIT_CIRCLE, circle((1, 1), 2), conic_matrix(1, 2, 3, 4, 5, 6)]
+        points = [(1, 0, 1), (3, 1, 1), (2, -1, 2)]
+        values = quadratic_form(np.array(conics, dtype=float), points)
+        assert values.shape == (3, 3)
+        for i, conic in enumerate(conics):
+            for j, point in enumerate(points):
+                expected = exact_quadratic_form(conic, Matrix(point))
+                assert values[i, j] == float(expected)
+
+    def test_invalid_shapes(self):
+        with pytest.raises(ValueError, match="points"):
+            quadratic_form(UNIT_CIRCLE, [(1, 2, 3, 4)])
+        with pytest.raises(ValueError, match="conics"):
+            quadratic_form(np.eye(4), [(1, 2)])
+
+
+class TestConicContainsPoint:
+    def test_single_conic(self):
+        angles = np.linspace(0, 2 * np.pi, 100)
+        on_circle = np.column_stack([np.cos(angles), np.sin(angles)])
+        assert conic_contains_point(UNIT_CIRCLE, on_circle).all()
+        assert not conic_contains_point(UNIT_CIRCLE, on_circle * 1.001).any()
+
+    def test_ideal_points(self):
+        hyperbola = conic_matrix(0, 1, 0, 0, 0, -1)
+        mask = conic_contains_point(hyperbola, [(1, 0, 0), (0, 1, 0), (1, 1, 0)])
+        assert mask.tolist() == [True, True, False]
+
+    def test_scale_invariance(self):
+        conic = np.array(circle((1, 2), 3), dtype=float)
+        points = [(4, 2, 1), (4e6, 2e6, 1e6), (4e-6, 2e-6, 1e-6)]
+        assert conic_contains_point(conic, points).all()
+        assert conic_contains_point(conic * 1e9, points).all()
+        assert conic_contains_point(conic * 1e-9, points).all()
+
+    def test_tolerance(self):
+        points = [(1.001, 0)]
+        assert not conic_contains_point(UNIT_CIRCLE, points).any()
+        assert conic_contains_point(UNIT_CIRCLE, points, tolerance=1e-2).all()
+
+    def test_conic_stack(self):
+        conics = np.array([UNIT_CIRCLE, circle((1, 0), 1)], dtype=float)
+        mask = conic_contains_point(conics, [(0, 1), (2, 0), (0, 0), (1, 0)])
+        assert mask.tolist() == [[True, False, False, True], [False, True, True, False]]
+
+
+class TestSampsonDistances:
+    def test_circle(self):
+        distances = sampson_distances(circle((0, 0), 2), [(2, 0), (0, -2), (0, 0)])
+        assert distances[:2].tolist() == [0, 0]
+        assert distances[2] == np.inf
+
+    def test_line_pair_is_exact(self):
+        line = line_between((0, 0), (3, 4))
+        conic = np.array(line * line.T, dtype=float)
+        assert sampson_distances(conic, [(4, -3)]) == pytest.approx([2.5])
+
+    def test_conic_stack(self):
+        conics = np.array([circle((0, 0), 1), circle((1, 1), 2)], dtype=float)
+        assert sampson_distances(conics, np.zeros((4, 2))).shape == (2, 4)
+
+
+class TestClassifyConic:
+    def test_single_conic(self):
+        assert ConicType(classify_conic(UNIT_CIRCLE)) == ConicType.ELLIPSE
+        assert ConicType(classify_conic(np.eye(3))) == ConicType.IMAGINARY_ELLIPSE
+        assert ConicType(classify_conic(np.zeros((3, 3)))) == ConicType.ZERO_MATRIX
+
+    def test_agrees_with_exact_classification(self):
+        coefficients = np.array(list(itertools.product([-1, 0, 1, 2], repeat=6)))
+        conics = np.array([conic_matrix(*c) for c in coefficients], dtype=float)
+        codes = classify_conic(conics)
+        for conic, code in zip(conics, codes, strict=True):
+            exact_type = exact_classify_conic(Matrix(conic.astype(int)))
+            assert ConicType(code) == exact_type
+
+    def test_scale_invariance(self):
+        conics = np.array([UNIT_CIRCLE, UNIT_HYPERBOLA, circle((1, 2), 0)], dtype=float)
+        codes = classify_conic(conics)
+        assert (classify_conic(conics * 1e-12) == codes).all()
+        assert (classify_conic(conics * 1e12) == codes).all()
+        assert (classify_conic(-conics) == codes).all()
+
+    def test_small_circle_far_from_origin(self):
+        small_circle = np.array(circle((100, 100), 0.01), dtype=float)
+        assert ConicType(classify_conic(small_circle)) == ConicType.ELLIPSE
+        point_conic = np.array(circle((100, 100), 0), dtype=float)
+        assert ConicType(classify_conic(point_conic)) == ConicType.POINT_CONIC
+
+    def test_translation_invariance(self):
+        coefficients = list(itertools.product([-1, 0, 1], repeat=6))
+        conics = [conic_matrix(*c) for c in coefficients]
+        codes = classify_conic(np.array(conics, dtype=float))
+        translated = [transform_conic(c, translate((1e4, -3e3))) for c in conics]
+        assert (classify_conic(np.array(translated, dtype=float)) == codes).all()
+
+    def test_tolerance(self):
+        nearly_parabola = conic_matrix(1, 0, 1e-12, 0, -1, 0)
+        assert ConicType(classify_conic(nearly_parabola)) == ConicType.PARABOLA
+        assert (
+            ConicType(classify_conic(nearly_parabola, tolerance=1e-15))
+            == ConicType.ELLIPSE
+        )
+
+        nearly_point = np.array(circle((1, 2), 1e-6), dtype=float)
+        assert ConicType(classify_conic(nearly_point)) == ConicType.POINT_CONIC
+        assert (
+            ConicType(classify_conic(nearly_point, tolerance=1e-15))
+            == ConicType.ELLIPSE
+        )
+
+
+class TestConicThroughPoints:
+    def test_matches_exact_counterpart(self):
+        point_tuples = [
+            [(0, 0, 1), (1, 0, 1), (0, 1, 1), (2, 3, 1), (-1, 4, 1)],
+            [(1, 2, 1), (3, -1, 2), (0, 5, 1), (-2, -2, 1), (1, 0, 0)],
+            [(0, 0, 1), (1, 0, 1), (2, 0, 1), (0, 1, 1), (1, 1, 1)],
+        ]
+        conics, is_ambiguous = conic_through_points(point_tuples)
+        assert conics.shape == (3, 3, 3)
+        assert is_ambiguous.tolist() == [False, False, False]
+        for points, conic in zip(point_tuples, conics, strict=True):
+            expected = exact_conic_through_points(*points)
+            assert conic.tolist() == np.array(expected, dtype=float).tolist()
+
+    def test_single_tuple(self):
+        points = [(0, 0), (1, 0), (0, 1), (2, 3), (-1, 4)]
+        conic, is_ambiguous = conic_through_points(points)
+        assert conic.shape == (3, 3)
+        assert not is_ambiguous
+        assert conic_contains_point(conic, points).all()
+
+    def test_ambiguous(self):
+        coincident = [(0, 0), (0, 0), (0, 1), (2, 3), (-1, 4)]
+        four_collinear = [(0, 0), (1, 0), (2, 0), (3, 0), (-1, 4)]
+        _, is_ambiguous = conic_through_points([coincident, four_collinear])
+        assert is_ambiguous.tolist() == [True, True]
+
+    def test_ambiguity_tolerance(self):
+        nearly_coincident = np.array([(1e6, 0), (1e6, 1e-9), (0, 1), (2, 3), (-1, 4)])
+        assert conic_through_points(nearly_coincident)[1]
+        assert not conic_through_points(nearly_coincident, tolerance=1e-20)[1]
+
+    def test_invalid_shapes(self):
+        with pytest.raises(ValueError, match=r"\(5,2\|3\)"):
+            conic_through_points(np.zeros((4, 2)))
+        with pytest.raises(ValueError, match=r"\(5,2\|3\)"):
+            conic_through_points(np.zeros((3, 5, 4)))
+
+
+class TestConicXLine:
+    def test_intersection_types(self):
+        lines = [(0, 1, 0), (0, 1, -1), (0, 1, -2), (0, 0, 0), (0, 0, 1)]
+        points, types = conic_x_line(np.array(UNIT_CIRCLE, dtype=float), lines)
+        assert points.shape == (5, 2, 3)
+        assert [LineIntersectionType(t) for t in types] == [
+            LineIntersectionType.REAL,
+            LineIntersectionType.TANGENT,
+            LineIntersectionType.COMPLEX,
+            LineIntersectionType.UNDEFINED,
+            LineIntersectionType.COMPLEX,
+        ]
+        xy = points[:2, :, :2].real / points[:2, :, 2:].real
+        assert sorted(xy[0].tolist()) == [[-1, 0], [1, 0]]
+        assert xy[1].tolist() == [[0, 1], [0, 1]]
+        assert points[2][0] == pytest.approx(points[2][1].conj())
+        assert np.isnan(points[3]).all()
+
+    def test_many_lines(self):
+        conic = np.array(UNIT_HYPERBOLA, dtype=float)
+        lines = np.random.default_rng(0).normal(size=(1000, 3))
+        points, types = conic_x_line(conic, lines)
+        assert np.abs(np.einsum("nki,ij,nkj->nk", points, conic, points)).max() < 1e-12
+        assert np.abs(np.einsum("nki,ni->nk", points, lines)).max() < 1e-12
+        is_real = types == LineIntersectionType.REAL.value
+        assert (points[is_real].imag == 0).all()
+        assert (points[~is_real].imag != 0).any(axis=(1, 2)).all()
+
+    def test_matches_exact_counterpart(self):
+        conic = conic_matrix(1, 2, 3, 4, 5, -6)
+        line = Matrix([1, 2, 3])
+        points, _ = conic_x_line(np.array(conic, dtype=float), [1, 2, 3])
+        for exact_point in exact_conic_x_line(conic, line):
+            expected = np.array(exact_point.evalf(), dtype=complex).ravel()
+            expected /= expected[np.argmax(np.abs(expected))]
+            assert any(expected == pytest.approx(point) for point in points)
+
+    def test_line_on_conic(self):
+        line_pair = line_pair_conic(Matrix([1, 0, 0]), Matrix([0, 1, 0]))
+        _, line_type = conic_x_line(np.array(line_pair, dtype=float), [1, 0, 0])
+        assert line_type == LineIntersectionType.UNDEFINED.value
+
+    def test_invalid_shapes(self):
+        with pytest.raises(ValueError, match="3x3"):
+            conic_x_line(np.eye(2), [1, 2, 3])
+        with pytest.raises(ValueError, match=r"\(N,3\)"):
+            conic_x_line(np.eye(3), [1, 2])
+
+
+def residuals(conics: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Evaluates the quadratic forms of (N,3,3) conics at (N,4,3) points."""
+    return np.abs(np.einsum("nki,nij,nkj->nk", points, conics, points))
+
+
+class TestConicXConic:
+    def test_random_conics(self):
+        rng = np.random.default_rng(0)
+        conics1 = rng.normal(size=(1000, 3, 3))
+        conics2 = rng.normal(size=(1000, 3, 3))
+        conics1 += conics1.transpose(0, 2, 1)
+        conics2 += conics2.transpose(0, 2, 1)
+        points = conic_x_conic(conics1, conics2)
+        assert points.shape == (1000, 4, 3)
+        scale1 = np.linalg.norm(conics1, axis=(1, 2))[:, np.newaxis]
+        scale2 = np.linalg.norm(conics2, axis=(1, 2))[:, np.newaxis]
+        assert (residuals(conics1, points) < 1e-10 * scale1).all()
+        assert (residuals(conics2, points) < 1e-10 * scale2).all()
+
+    def test_single_pair(self):
+        points = conic_x_conic(
+            np.array(circle((0, 0), 2), dtype=float),
+            np.array(circle((2, 2), 2), dtype=float),
+        )
+        assert points.shape == (4, 3)
+        real_points = points[np.abs(points.imag).max(axis=1) < 1e-12].real
+        xy = np.round(real_points[:, :2] / real_points[:, 2:], 12) + 0
+        assert sorted(map(tuple, xy)) == [(0, 2), (2, 0)]
+
+    @pytest.mark.parametrize(
+        ("conic1", "conic2"),
+        [
+            (UNIT_CIRCLE, circle((0, 0), 2)),
+            (UNIT_CIRCLE, circle((2, 0), 1)),
+            (UNIT_CIRCLE, ellipse((0, 0), 1, 2)),
+            (UNIT_CIRCLE, line_pair_conic(Matrix([1, 0, 0]), Matrix([0, 1, 0]))),
+            (
+                line_pair_conic(Matrix([1, 0, 0]), Matrix([0, 1, 0])),
+                line_pair_conic(Matrix([1, 1, 0]), Matrix([1, 2, 3])),
+            ),
+        ],
+        ids=["concentric", "touching", "osculating", "line_pair", "two_line_pairs"],
+    )
+    def test_special_configurations(self, conic1: Matrix, conic2: Matrix):
+        conics = np.array([conic1, conic2], dtype=float)
+        points = conic_x_conic(conics[0], conics[1])
+        assert residuals(conics[:1], points[np.newaxis]) == pytest.approx(
+            0,
+            abs=1e-12,
+        )
+        assert residuals(conics[1:], points[np.newaxis]) == pytest.approx(
+            0,
+            abs=1e-12,
+        )
+
+    def test_coincident_conics(self):
+        circle_matrix = np.array(UNIT_CIRCLE, dtype=float)
+        assert np.isnan(conic_x_conic(circle_matrix, -2 * circle_matrix)).all()
+
+    def test_common_line_component(self):
+        x_axis, y_axis = Matrix([0, 1, 0]), Matrix([1, 0, 0])
+        line_pair1 = np.array(line_pair_conic(x_axis, y_axis), dtype=float)
+        line_pair2 = np.array(line_pair_conic(x_axis, Matrix([1, 1, 1])), dtype=float)
+        points = conic_x_conic(line_pair1, line_pair2)
+        assert np.isnan(points).any()
+
+    def test_mismatched_shapes(self):
+        with pytest.raises(ValueError, match="same shape"):
+            conic_x_conic(np.eye(3), np.tile(np.eye(3), (2, 1, 1)))
+
+
+class TestConicBoundingBoxes:
+    def test_circle(self):
+        box = conic_bounding_boxes(np.array(circle((1, 2), 3), dtype=float))
+        assert box == pytest.approx([-2, -1, 4, 5])
+
+    def test_rotated_ellipses_far_from_origin(self):
+        rng = np.random.default_rng(0)
+        centers = rng.uniform(-1000, 1000, (50, 2))
+        radii = rng.uniform(1, 10, (50, 2))
+        angles = rng.uniform(0, np.pi, 50)
+        conics = np.array(
+            [
+                ellipse(center, r1, r2, r1_angle=angle)
+                for center, (r1, r2), angle in zip(centers, radii, angles, strict=True)
+            ],
+            dtype=float,
+        )
+        half_widths = np.column_stack(
+            [
+                np.hypot(radii[:, 0] * np.cos(angles), radii[:, 1] * np.sin(angles)),
+                np.hypot(radii[:, 0] * np.sin(angles), radii[:, 1] * np.cos(angles)),
+            ],
+        )
+        boxes = conic_bounding_boxes(conics)
+        assert boxes[:, :2] == pytest.approx(centers - half_widths, abs=1e-6)
+        assert boxes[:, 2:] == pytest.approx(centers + half_widths, abs=1e-6)
+
+    @pytest.mark.parametrize(
+        ("conic", "expected"),
+        [
+            # y = x²
+            (conic_matrix(1, 0, 0, 0, -0.5, 0), [-np.inf, 0, np.inf, np.inf]),
+            # y = 2 - x²
+            (conic_matrix(1, 0, 0, 0, 0.5, -1), [-np.inf, -np.inf, np.inf, 1]),
+            # x = y²
+            (conic_matrix(0, 0, 1, -0.5, 0, 0), [0, -np.inf, np.inf, np.inf]),
+            (UNIT_HYPERBOLA, [-np.inf, -np.inf, np.inf, np.inf]),
+            (
+                line_pair_conic(Matrix([1, 0, 0]), Matrix([0, 1, -1])),
+                [-np.inf, -np.inf, np.inf, np.inf],
+            ),
+            # (x - 1)² + (y - 2)² = 0
+            (conic_matrix(1, 0, 1, -1, -2, 5), [1, 2, 1, 2]),
+            (conic_matrix(1, 0, 1, 0, 0, 1), [np.nan] * 4),
+        ],
+    )
+    def test_special_conics(self, conic: Matrix, expected: list[float]):
+        box = conic_bounding_boxes(np.array(conic, dtype=float))
+        np.testing.assert_allclose(box, expected)
+
+    def test_conic_stack(self):
+        conics = np.array([circle((0, 0), 1), UNIT_HYPERBOLA], dtype=float)
+        assert conic_bounding_boxes(conics).shape == (2, 4)
@@ -1,9 +1,13 @@
+import itertools
+
 from sympy import I, Matrix, Rational, pi, sqrt, symbols
 from sympy.abc import x, y
 
 from lib.circle import IMAGINARY_UNIT_CIRCLE, UNIT_CIRCLE, circle
 from lib.conic import conic_from_focus_and_directrix, conic_from_poly
 from lib.conic_classes import (
+    ConicType,
+    classify_conic,
     is_central_conic,
     is_circle,
     is_circular,
@@ -541,3 +545,61 @@ class TestIsRectangularHyperbola:
     def test_undecidable(self):
         conic = conic_matrix(*symbols("a,b,c,d,e,f"))
         assert is_rectangular_hyperbola(conic) is None
+
+
+class TestClassifyConic:
+    def test_nondegenerate(self):
+        assert classify_conic(UNIT_CIRCLE) == ConicType.ELLIPSE
+        assert classify_conic(ellipse((1, 2), 3, 4)) == ConicType.ELLIPSE
+        assert classify_conic(IMAGINARY_UNIT_CIRCLE) == ConicType.IMAGINARY_ELLIPSE
+        assert classify_conic(conic_from_poly(x * x - y)) == ConicType.PARABOLA
+        assert classify_conic(UNIT_HYPERBOLA) == ConicType.HYPERBOLA
+
+    def test_degenerate(self):
+        assert classify_conic(line_pair_conic(X_AXIS, Y_AXIS)) == ConicType.LINE_PAIR
+        parallel_lines = line_pair_conic(X_AXIS, horizontal_line(1))
+        assert classify_conic(parallel_lines) == ConicType.LINE_PAIR
+        with_ideal_line = line_pair_conic(X_AXIS, IDEAL_LINE)
+        assert classify_conic(with_ideal_line) == ConicType.LINE_PAIR
+        assert classify_conic(point_conic((1, 2))) == ConicType.POINT_CONIC
+        assert classify_conic(point_conic((1, 2, 0))) == ConicType.POINT_CONIC
+        double_line = line_pair_conic(X_AXIS, X_AXIS)
+        assert classify_conic(double_line) == ConicType.DOUBLE_LINE
+        assert classify_conic(Matrix.zeros(3, 3)) == ConicType.ZERO_MATRIX
+
+    def test_symbolic(self):
+        center = symbols("x y")
+        r1, r2 = symbols("r1 r2", positive=True)
+        assert classify_conic(ellipse(center, r1, r2)) == ConicType.ELLIPSE
+        assert classify_conic(circle(center, 0)) == ConicType.POINT_CONIC
+
+        directrix = Matrix(symbols("a b c", positive=True))
+        parabola = conic_from_focus_and_directrix(ORIGIN, directrix, eccentricity=1)
+        assert classify_conic(parabola) == ConicType.PARABOLA
+
+        line = Matrix(symbols("a b c", positive=True))
+        assert classify_conic(line_pair_conic(line, X_AXIS)) == ConicType.LINE_PAIR
+
+    def test_undecidable(self):
+        assert classify_conic(conic_matrix(*symbols("a b c d e f"))) is None
+        assert classify_conic(ellipse(symbols("x y"), *symbols("r1 r2"))) is None
+
+    def test_agrees_with_predicates(self):
+        predicates = {
+            ConicType.ELLIPSE: is_ellipse,
+            ConicType.IMAGINARY_ELLIPSE: is_imaginary_ellipse,
+            ConicType.PARABOLA: is_parabola,
+            ConicType.HYPERBOLA: is_hyperbola,
+            ConicType.POINT_CONIC: is_point_conic,
+            ConicType.DOUBLE_LINE: is_double_line,
+        }
+        for coefficients in itertools.product([-1, 0, 1], repeat=6):
+            conic = conic_matrix(*coefficients)
+            conic_type = classify_conic(conic)
+            if conic_type == ConicType.ZERO_MATRIX:
+                assert conic.is_zero_matrix
+            elif conic_type == ConicType.LINE_PAIR:
+                assert is_line_pair(conic) is True
+                assert is_double_line(conic) is False
+            else:
+                assert predicates[conic_type](conic) is True
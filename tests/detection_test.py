@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+from lib.batch import conic_contains_point
+from lib.circle import circle
+from lib.conic_classes import ConicType
+from lib.detection import ConicDetector
+from lib.hyperbola import hyperbola_from_foci_and_point
+
+
+def ellipse_points(
+    rng: np.random.Generator,
+    center: tuple[float, float],
+    radii: tuple[float, float],
+    count: int,
+    noise: float = 0.01,
+) -> np.ndarray:
+    angles = rng.uniform(0, 2 * np.pi, count)
+    points = np.column_stack(
+        [center[0] + radii[0] * np.cos(angles), center[1] + radii[1] * np.sin(angles)],
+    )
+    return points + rng.normal(scale=noise, size=points.shape)
+
+
+def cloud(seed: int = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    ellipse1 = ellipse_points(rng, (0, 0), (5, 3), 150)
+    ellipse2 = ellipse_points(rng, (12, 4), (2, 4), 100)
+    outliers = rng.uniform(-6, 15, (80, 2))
+    return np.concatenate([ellipse1, ellipse2, outliers]), ellipse1, ellipse2
+
+
+class TestConicDetector:
+    def test_detects_multiple_conics(self):
+        points, ellipse1, ellipse2 = cloud()
+        detector = ConicDetector(threshold=0.05, min_inliers=50, seed=1)
+        detected = detector.detect(points, max_conics=3)
+        assert len(detected) == 2
+        for found, expected in zip(detected, [ellipse1, ellipse2], strict=True):
+            assert len(found.inliers) >= 0.9 * len(expected)
+            conic = np.array(found.conic, dtype=float)
+            assert conic_contains_point(conic, expected, tolerance=1e-2).mean() > 0.9
+
+    def test_inliers_are_disjoint(self):
+        points, _, _ = cloud()
+        detector = ConicDetector(threshold=0.05, min_inliers=50, seed=1)
+        first, second = detector.detect(points, max_conics=2)
+        assert not set(first.inliers) & set(second.inliers)
+
+    def test_reproducible_with_seed(self):
+        points, _, _ = cloud()
+        results = [
+            ConicDetector(threshold=0.05, hypotheses=200, seed=7).detect(points)
+            for _ in range(2)
+        ]
+        assert results[0][0].conic == results[1][0].conic
+        assert results[0][0].inliers.tolist() == results[1][0].inliers.tolist()
+
+    def test_circles_only(self):
+        rng = np.random.default_rng(2)
+        points = np.concatenate(
+            [ellipse_points(rng, (1, 2), (3, 3), 100), rng.uniform(-3, 5, (50, 2))],
+        )
+        detector = ConicDetector(threshold=0.05, circles_only=True, seed=3)
+        (found,) = detector.detect(points)
+        assert np.array(found.conic, dtype=float) == pytest.approx(
+            np.array(circle((1, 2), 3), dtype=float),
+            abs=0.1,
+        )
+
+    def test_conic_type_filter(self):
+        hyperbola = np.array(
+            hyperbola_from_foci_and_point((0, 0), (4, 2), (5, 5)),
+            dtype=float,
+        )
+        rng = np.random.default_rng(4)
+        xs = rng.uniform(-10, 10, 200)
+        a, b, c, d, e, f = hyperbola.ravel()[[0, 1, 4, 2, 5, 8]]
+        # Solve c·y² + 2(bx + e)y + (ax² + 2dx + f) = 0 for y.
+        p, q = 2 * (b * xs + e), a * xs * xs + 2 * d * xs + f
+        discriminant = p * p - 4 * c * q
+        real = discriminant >= 0
+        ys = (-p[real] + np.sqrt(discriminant[real])) / (2 * c)
+        points = np.column_stack([xs[real], ys])
+        ellipses = ConicDetector(
+            threshold=0.01,
+            min_inliers=50,
+            conic_types={ConicType.ELLIPSE},
+            seed=5,
+        )
+        assert ellipses.detect(points) == []
+        hyperbolas = ConicDetector(
+            threshold=0.01,
+            min_inliers=50,
+            conic_types={ConicType.HYPERBOLA},
+            seed=5,
+        )
+        (found,) = hyperbolas.detect(points)
+        assert len(found.inliers) == len(points)
+
+    def test_process_pool(self):
+        points, _, _ = cloud()
+        serial = ConicDetector(threshold=0.05, hypotheses=300, seed=6)
+        parallel = ConicDetector(threshold=0.05, hypotheses=300, processes=2, seed=6)
+        assert serial.detect(points)[0].conic == parallel.detect(points)[0].conic
+        assert parallel.hypothesis_count == serial.hypothesis_count
+
+    def test_throughput(self):
+        points, _, _ = cloud()
+        detector = ConicDetector(threshold=0.05, hypotheses=500, seed=0)
+        assert detector.hypotheses_per_second == 0
+        detector.detect(points)
+        assert 0 < detector.hypothesis_count <= 500
+        assert detector.hypotheses_per_second > 0
+
+    def test_nothing_to_detect(self):
+        detector = ConicDetector(threshold=0.05, min_inliers=10, seed=0)
+        assert detector.detect(np.zeros((0, 2))) == []
+        points = np.array([(0, 0), (1, 0), (0, 1)])
+        assert detector.detect(points) == []
+
+    def test_collinear_points(self):
+        # Any 5 of them determine infinitely many conics.
+        points = np.column_stack([np.arange(20), np.zeros(20)])
+        detector = ConicDetector(threshold=0.05, seed=0)
+        assert detector.detect(points) == []
+        assert detector.hypothesis_count == 0
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="threshold"):
+            ConicDetector(threshold=0)
+        with pytest.raises(ValueError, match="hypothesis"):
+            ConicDetector(threshold=1, hypotheses=0)
+        with pytest.raises(ValueError, match=r"\(M,2\)"):
+            ConicDetector(threshold=1).detect(np.zeros((5, 3)))
@@ -0,0 +1,172 @@
+import numpy as np
+import pytest
+from sympy import Matrix
+
+from lib.circle import circle, circle_radius
+from lib.ellipse import ellipse
+from lib.fitting import ConicFitter
+from lib.hyperbola import hyperbola_from_foci_and_point
+from lib.matrix import is_nonzero_multiple
+
+ELLIPSE = ellipse((3, -2), 5, 2, r1_angle=0.4)
+HYPERBOLA = hyperbola_from_foci_and_point((0, 0), (4, 2), (5, 5))
+
+
+def sample_points(conic: Matrix, count: int) -> np.ndarray:
+    """Samples points on a conic by intersecting it with lines through its
+    center.
+    """
+    conic = np.array(conic, dtype=float)
+    center = np.linalg.solve(conic[:2, :2], -conic[:2, 2])
+    points = []
+    for angle in np.linspace(0, np.pi, count, endpoint=False):
+        direction = np.array([np.cos(angle), np.sin(angle)])
+        a = direction @ conic[:2, :2] @ direction
+        value = np.append(center, 1) @ conic @ np.append(center, 1)
+        if -value / a > 0:
+            t = np.sqrt(-value / a)
+            points.extend([center + t * direction, center - t * direction])
+    return np.array(points)
+
+
+def assert_same_conic(fitted: Matrix, expected: Matrix, tolerance: float = 1e-6):
+    fitted = np.array(fitted, dtype=float).ravel()
+    expected = np.array(expected, dtype=float).ravel()
+    fitted /= np.linalg.norm(fitted)
+    expected /= np.linalg.norm(expected)
+    assert min(
+        np.linalg.norm(fitted - expected),
+        np.linalg.norm(fitted + expected),
+    ) == pytest.approx(0, abs=tolerance)
+
+
+class TestAddPoints:
+    def test_point_count(self):
+        fitter = ConicFitter()
+        fitter.add_points((1, 2))
+        fitter.add_points([(1, 2), (3, 4)])
+        assert fitter.point_count == 3
+
+    def test_chunks_are_equivalent(self):
+        points = sample_points(ELLIPSE, 20)
+        at_once = ConicFitter()
+        at_once.add_points(points)
+        in_chunks = ConicFitter()
+        for chunk in np.array_split(points, 7):
+            in_chunks.add_points(chunk)
+        assert in_chunks.scatter_matrix == pytest.approx(at_once.scatter_matrix)
+
+    def test_homogeneous_points(self):
+        euclidean = ConicFitter()
+        euclidean.add_points([(1, 2), (3, 4)])
+        homogeneous = ConicFitter()
+        homogeneous.add_points([(1, 2, 1), (3, 4, 1)])
+        assert homogeneous.scatter_matrix == pytest.approx(euclidean.scatter_matrix)
+
+    def test_invalid_shape(self):
+        with pytest.raises(ValueError, match=r"\(M,2\)"):
+            ConicFitter().add_points([(1, 2, 3, 4)])
+
+    def test_invalid_scale(self):
+        with pytest.raises(ValueError, match="scale"):
+            ConicFitter(scale=0)
+
+
+class TestFitConic:
+    @pytest.mark.parametrize("conic", [ELLIPSE, HYPERBOLA])
+    def test_exact_points(self, conic: Matrix):
+        fitter = ConicFitter()
+        fitter.add_points(sample_points(conic, 10))
+        assert_same_conic(fitter.fit_conic(), conic)
+
+    def test_five_points(self):
+        points = sample_points(ELLIPSE, 3)[:5]
+        fitter = ConicFitter()
+        fitter.add_points(points)
+        assert_same_conic(fitter.fit_conic(), ELLIPSE)
+
+    def test_too_few_points(self):
+        fitter = ConicFitter()
+        fitter.add_points(sample_points(ELLIPSE, 2))
+        with pytest.raises(ValueError, match="5 points"):
+            fitter.fit_conic()
+
+    def test_local_coordinate_system(self):
+        conic = ellipse((1000, 2000), 3, 2)
+        fitter = ConicFitter(center=(1000, 2000), scale=3)
+        fitter.add_points(sample_points(conic, 10))
+        assert_same_conic(fitter.fit_conic(), conic)
+
+
+class TestFitEllipse:
+    def test_exact_points(self):
+        fitter = ConicFitter()
+        fitter.add_points(sample_points(ELLIPSE, 10))
+        assert_same_conic(fitter.fit_ellipse(), ELLIPSE)
+
+    def test_noisy_points(self):
+        rng = np.random.default_rng(0)
+        points = sample_points(ELLIPSE, 500)
+        fitter = ConicFitter(center=(3, -2), scale=5)
+        fitter.add_points(points + rng.normal(scale=0.01, size=points.shape))
+        assert_same_conic(fitter.fit_ellipse(), ELLIPSE, tolerance=1e-2)
+
+    def test_always_returns_ellipse(self):
+        fitter = ConicFitter()
+        fitter.add_points(sample_points(HYPERBOLA, 10))
+        a, b, c = np.array(fitter.fit_ellipse(), dtype=float).ravel()[[0, 1, 4]]
+        assert a * c - b * b > 0
+
+    def test_collinear_points(self):
+        fitter = ConicFitter()
+        fitter.add_points([(i, 2 * i) for i in range(10)])
+        with pytest.raises(ValueError, match="collinear"):
+            fitter.fit_ellipse()
+
+
+class TestFitCircle:
+    @pytest.mark.parametrize("method", ["pratt", "kasa"])
+    def test_exact_points(self, method: str):
+        fitter = ConicFitter()
+        fitter.add_points(sample_points(circle((1, 2), 3), 5))
+        fitted = fitter.fit_circle(method=method)
+        assert np.array(fitted, dtype=float) == pytest.approx(
+            np.array(circle((1, 2), 3), dtype=float),
+        )
+
+    def test_local_coordinate_system(self):
+        fitter = ConicFitter(center=(100, 100), scale=10)
+        fitter.add_points(sample_points(circle((101, 99), 7), 5))
+        fitted = fitter.fit_circle()
+        assert is_nonzero_multiple(fitted.evalf(6), circle((101, 99), 7).evalf(6))
+
+    def test_noisy_arc(self):
+        rng = np.random.default_rng(0)
+        angles = rng.uniform(0, 1, 200)
+        points = np.column_stack([5 * np.cos(angles), 5 * np.sin(angles)])
+        points += rng.normal(scale=0.05, size=points.shape)
+        fitter = ConicFitter()
+        fitter.add_points(points)
+        pratt_radius = circle_radius(fitter.fit_circle(method="pratt"))
+        kasa_radius = circle_radius(fitter.fit_circle(method="kasa"))
+        assert abs(pratt_radius - 5) < abs(kasa_radius - 5)
+
+    @pytest.mark.parametrize("method", ["pratt", "kasa"])
+    @pytest.mark.parametrize(
+        "points",
+        [
+            [(i, 2 * i) for i in range(10)],
+            [(0.1 * i, 0.3 * i + 0.7) for i in range(10)],
+        ],
+    )
+    def test_collinear_points(self, method: str, points: list[tuple[float, float]]):
+        fitter = ConicFitter()
+        fitter.add_points(points)
+        with pytest.raises(ValueError, match="collinear"):
+            fitter.fit_circle(method=method)
+
+    def test_unknown_method(self):
+        fitter = ConicFitter()
+        fitter.add_points([(0, 0), (1, 0), (0, 1)])
+        with pytest.raises(ValueError, match="Unknown method"):
+            fitter.fit_circle(method="hyper")
@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+
+from lib.homography import fit_homography, ransac_homography, transfer_distances
+from lib.transform import homography_from_samples
+
+HOMOGRAPHY = np.array([[1.2, 0.1, 3], [-0.2, 0.9, 1], [1e-3, 2e-3, 1]])
+
+
+def apply_homography(homography: np.ndarray, points: np.ndarray) -> np.ndarray:
+    mapped = np.column_stack([points, np.ones(len(points))]) @ homography.T
+    return mapped[:, :2] / mapped[:, 2:]
+
+
+def correspondences(
+    seed: int = 0,
+    count: int = 200,
+    noise: float = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    source = rng.uniform(0, 500, (count, 2))
+    target = apply_homography(HOMOGRAPHY, source)
+    return source, target + rng.normal(scale=noise, size=target.shape)
+
+
+def assert_same_homography(
+    actual: object,
+    expected: np.ndarray,
+    tolerance: float = 1e-9,
+):
+    actual = np.array(actual, dtype=float)
+    assert actual / actual[2, 2] == pytest.approx(
+        expected / expected[2, 2],
+        rel=tolerance,
+        abs=tolerance,
+    )
+
+
+class TestTransferDistances:
+    def test_exact_correspondences(self):
+        source, target = correspondences(count=10)
+        assert transfer_distances(HOMOGRAPHY, source, target) == pytest.approx(
+            np.zeros(10),
+            abs=1e-9,
+        )
+
+    def test_translated_target(self):
+        source = np.array([(0, 0), (1, 2)])
+        distances = transfer_distances(np.eye(3), source, source + np.array([3, 4]))
+        assert distances.tolist() == [5, 5]
+
+    def test_ideal_image(self):
+        homography = np.array([[1, 0, 0], [0, 1, 0], [1, 0, 0]])
+        source = np.array([(0, 1), (1, 1), (2, 1), (3, 1)])
+        assert transfer_distances(homography, source, source)[0] == np.inf
+
+    def test_homography_stack(self):
+        source, target = correspondences(count=7)
+        homographies = np.stack([HOMOGRAPHY, np.eye(3)])
+        assert transfer_distances(homographies, source, target).shape == (2, 7)
+
+
+class TestFitHomography:
+    def test_exact_correspondences(self):
+        source, target = correspondences()
+        assert_same_homography(fit_homography(source, target), HOMOGRAPHY)
+
+    def test_matches_four_point_homography(self):
+        source = np.array([(0, 0), (1, 0), (0, 1), (1, 1)])
+        target = np.array([(1, 0), (2, 1), (0, 2), (4, 5)])
+        expected = np.array(homography_from_samples(source, target), dtype=float)
+        assert_same_homography(fit_homography(source, target), expected)
+
+    def test_noisy_correspondences(self):
+        source, target = correspondences(noise=0.1)
+        fitted = np.array(fit_homography(source, target), dtype=float)
+        errors = transfer_distances(fitted, source, target)
+        assert np.sqrt(np.mean(errors**2)) < 0.15
+
+    def test_unit_norm(self):
+        source, target = correspondences(count=10)
+        fitted = np.array(fit_homography(source, target), dtype=float)
+        assert np.linalg.norm(fitted) == pytest.approx(1)
+
+    def test_too_few_points(self):
+        source, target = correspondences(count=3)
+        with pytest.raises(ValueError, match="4 correspondences"):
+            fit_homography(source, target)
+
+    def test_length_mismatch(self):
+        source, target = correspondences(count=10)
+        with pytest.raises(ValueError, match="same length"):
+            fit_homography(source, target[:9])
+
+    def test_invalid_shape(self):
+        with pytest.raises(ValueError, match=r"\(M,2\)"):
+            fit_homography(np.zeros((4, 3)), np.zeros((4, 2)))
+
+
+class TestRansacHomography:
+    def test_outliers(self):
+        source, target = correspondences(noise=0.3)
+        rng = np.random.default_rng(1)
+        target[:60] = rng.uniform(0, 600, (60, 2))
+        result = ransac_homography(source, target, threshold=1.5, seed=2)
+        assert result is not None
+        assert set(result.inliers.tolist()) >= set(range(70, 200))
+        assert np.count_nonzero(result.inliers < 60) <= 2
+        errors = transfer_distances(result.matrix, source[60:], target[60:])
+        assert np.sqrt(np.mean(errors**2)) < 0.5
+
+    def test_reproducible_with_seed(self):
+        source, target = correspondences(noise=0.3)
+        target[::3] += 50
+        first = ransac_homography(source, target, threshold=1, seed=3)
+        second = ransac_homography(source, target, threshold=1, seed=3)
+        assert first is not None
+        assert second is not None
+        assert first.matrix == second.matrix
+        assert first.inliers.tolist() == second.inliers.tolist()
+
+    def test_collinear_points(self):
+        source = np.array([(i, 2 * i) for i in range(10)], dtype=float)
+        assert ransac_homography(source, source, threshold=0.1, seed=0) is None
+
+    def test_too_few_inliers(self):
+        source, target = correspondences(count=20)
+        target[5:] = np.random.default_rng(4).uniform(0, 600, (15, 2))
+        result = ransac_homography(
+            source,
+            target,
+            threshold=0.1,
+            min_inliers=10,
+            seed=0,
+        )
+        assert result is None
+
+    def test_invalid_arguments(self):
+        source, target = correspondences(count=10)
+        with pytest.raises(ValueError, match="threshold"):
+            ransac_homography(source, target, threshold=0)
+        with pytest.raises(ValueError, match="hypothesis"):
+            ransac_homography(source, target, threshold=1, hypotheses=0)
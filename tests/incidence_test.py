@@ -1,12 +1,16 @@
 import itertools
+from collections.abc import Iterator
 
-from sympy import I, Matrix, cos, simplify, sin, sqrt, symbols
+import numpy as np
+import pytest
+from sympy import I, Matrix, Rational, cos, simplify, sin, sqrt, symbols
 from sympy.abc import x, y
 
 from lib.circle import circle
 from lib.conic import conic_from_focus_and_directrix, conic_from_poly
 from lib.degenerate_conic import line_pair_conic
 from lib.incidence import (
+    ConconicityChecker,
     are_cocircular,
     are_collinear,
     are_concurrent,
@@ -128,6 +132,26 @@ class TestAreCollinear:
         assert are_collinear([(1, 2), (3, 4), (5, 6), (7, 8)]) is True
         assert are_collinear([(1, 2), (3, 4), (5, 6), (7, 9)]) is False
 
+    def test_many_points(self):
+        points = [(i, 2 * i + 1) for i in range(1000)]
+        assert are_collinear(points) is True
+        assert are_collinear([*points, (1, 2, 0)]) is True
+        assert are_collinear([*points, (1, 2)]) is False
+        assert are_collinear([(0, 1), (0, 1), *points]) is True
+
+    def test_rational_points(self):
+        points = [(Rational(i, 3), Rational(i, 5) - 1) for i in range(10)]
+        assert are_collinear(points) is True
+        assert are_collinear([*points, (Rational(1, 3), 1)]) is False
+
+    def test_many_symbolic_points(self):
+        x = symbols("x")
+        points = [(i, i * x + 1) for i in range(20)]
+        assert are_collinear(points) is True
+        assert are_collinear([*points, (x, x * x)]) is False
+        assert are_collinear([*points, (x, 1)]) is None
+        assert are_collinear([*points, (x, 1), (1, x)]) is False
+
 
 class TestAreConcurrent:
     def test_symbolic_lines(self):
@@ -153,8 +177,15 @@ class TestAreConcurrent:
         assert are_concurrent([X_AXIS, horiz1, horiz2, horiz3]) is True
         assert are_concurrent([horiz1, horiz2, Y_AXIS]) is False
         assert are_concurrent([horiz1, horiz2, X_AXIS, Y_AXIS]) is False
-        # This is actually False, but Sympy 1.14 can't prove it.
-        assert are_concurrent([horiz1, horiz2, horiz3, Y_AXIS]) is None
+        assert are_concurrent([horiz1, horiz2, horiz3, Y_AXIS]) is False
+
+    def test_zero_first_line(self):
+        zero = Matrix([0, 0, 0])
+        assert are_concurrent([zero, X_AXIS, Y_AXIS, Matrix([0, 0, 1])]) is False
+        assert are_concurrent([zero, X_AXIS, Y_AXIS, Matrix([1, 1, 0])]) is True
+        assert are_concurrent([zero, zero, X_AXIS]) is True
+        line = Matrix(symbols("a b c", positive=True))
+        assert are_concurrent([zero, X_AXIS, Y_AXIS, line]) is False
 
 
 class TestAreOnSameConic:
@@ -180,6 +211,119 @@ class TestAreOnSameConic:
         assert are_on_same_conic(points) is None
         assert are_on_same_conic(points, simplifier=simplify) is True
 
+    def test_many_points(self):
+        points = [(x, x * x) for x in range(-10, 10)]
+        assert are_on_same_conic(points) is True
+        assert are_on_same_conic([*points, (0, 1, 0)]) is True
+        assert are_on_same_conic([*points, (1, 2)]) is False
+        assert are_on_same_conic([(1, 2), *points]) is False
+
+    def test_many_rational_points(self):
+        points = [(Rational(t, 7), 3 - Rational(t * t, 49)) for t in range(10)]
+        assert are_on_same_conic(points) is True
+
+    def test_many_float_points(self):
+        points = [(0.1 * t, 0.01 * t * t) for t in range(10)]
+        assert are_on_same_conic(points) is True
+        assert are_on_same_conic([*points, (0.5, 0.2)]) is False
+        assert are_on_same_conic([*points, (0.5, 0.25 + 1e-12)]) is True
+        assert are_on_same_conic([*points, (0.5, 0.25 + 1e-12)], tolerance=0) is False
+
+    def test_rational_function_coordinates(self):
+        ts = [Rational(i, 7) for i in range(6)]
+        points = [((1 - t * t) / (1 + t * t), 2 * t / (1 + t * t)) for t in ts]
+        symbolic_point = ((1 - x * x) / (1 + x * x), 2 * x / (1 + x * x))
+        assert are_on_same_conic([*points[:5], symbolic_point]) is True
+        assert are_on_same_conic([*points[:5], symbolic_point, points[5]]) is True
+        assert are_on_same_conic([symbolic_point, *points]) is True
+        assert are_on_same_conic([*points, symbolic_point, (2, 3)]) is False
+
+    def test_large_float_coordinates(self):
+        rng = np.random.default_rng(0)
+        for random_points in rng.uniform(0, 1e4, (50, 7, 2)):
+            assert are_on_same_conic(random_points.tolist()) is False
+        angles = np.linspace(0, 6, 12)
+        ellipse_points = np.column_stack(
+            [5000 + 3000 * np.cos(angles), 4000 + 1000 * np.sin(angles)],
+        )
+        assert are_on_same_conic(ellipse_points.tolist()) is True
+
+    def test_many_symbolic_points(self):
+        x1, x2, y1, y2 = symbols("x1 x2 y1 y2")
+        points = [(x1, 0), (x2, 0), (1, 0), (0, y1), (0, y2), (0, 1), (0, 2)]
+        assert are_on_same_conic(points) is True
+        points[-1] = (1, 1)
+        assert are_on_same_conic(points) is None
+
+
+class TestConconicityChecker:
+    def test_generator(self):
+        checker = ConconicityChecker()
+        checker.add_points((t, t * t) for t in range(100))
+        assert checker.point_count == 100
+        assert checker.rank == 5
+        assert checker.result() is True
+
+    def test_counterexample(self):
+        checker = ConconicityChecker()
+        checker.add_points([(0, 0), (1, 0), (0, 1), (1, 1), (2, 3), (5, 7)])
+        assert checker.rank == 6
+        assert checker.result() is False
+        checker.add_point(symbols("x y"))
+        assert checker.result() is False
+
+    def test_fewer_than_six_points(self):
+        checker = ConconicityChecker()
+        assert checker.result() is True
+        checker.add_points([(1, 1), (2, 3), (3, 5)])
+        assert checker.rank == 3
+        assert checker.result() is True
+
+    def test_switch_to_floats(self):
+        checker = ConconicityChecker()
+        checker.add_points([(0, 1), (0, -1), (1, 0), (-1, 0)])
+        checker.add_point((0.6, 0.8))
+        checker.add_point((-0.8, 0.6))
+        assert checker.result() is True
+        checker.add_point((0.5, 0.5))
+        assert checker.result() is False
+
+    def test_float_points_far_from_origin(self):
+        angles = np.linspace(0, 6, 20)
+        points = np.column_stack([1e4 + np.cos(angles), 1e4 + np.sin(angles)])
+        checker = ConconicityChecker()
+        checker.add_points(points.tolist())
+        assert checker.result() is True
+        checker.add_point((1e4 + 1.5, 1e4))
+        assert checker.result() is False
+
+    def test_switch_to_floats_far_from_origin(self):
+        checker = ConconicityChecker()
+        offsets = [(5, 0), (-5, 0), (0, 5), (3, 4), (-4, 3)]
+        checker.add_points([(10**4 + dx, 10**4 + dy) for dx, dy in offsets])
+        checker.add_point((1e4 + 3, 1e4 - 4))
+        assert checker.result() is True
+        checker.add_point((1e4 + 5.5, 1e4))
+        assert checker.result() is False
+
+    def test_mixed_float_and_symbolic_points(self):
+        checker = ConconicityChecker()
+        checker.add_point(symbols("x y"))
+        with pytest.raises(ValueError, match="mixed"):
+            checker.add_point((0.5, 1))
+        checker = ConconicityChecker()
+        checker.add_point((0.5, 1))
+        with pytest.raises(ValueError, match="mixed"):
+            checker.add_point(symbols("x y"))
+
+    def test_undecidable_point(self):
+        x, y = symbols("x y")
+        checker = ConconicityChecker()
+        checker.add_points([(1, 0), (0, 1), (-1, 0), (0, -1), (sin(x), cos(x))])
+        checker.add_point((sin(y), cos(y)))
+        checker.add_point((x, 0))
+        assert checker.result() is None
+
 
 class TestAreCocircular:
     def test_three_points(self):
@@ -214,3 +358,31 @@ class TestAreCocircular:
     def test_parallel_lines(self):
         parallel_lines = list(itertools.product([0, 1, 2], [0, 1]))
         assert are_cocircular(parallel_lines) is False
+
+    def test_many_rational_points(self):
+        def unit_circle_points(count: int) -> Iterator[tuple[Rational, Rational]]:
+            for i in range(count):
+                t = Rational(i, count)
+                yield (1 - t * t) / (1 + t * t), 2 * t / (1 + t * t)
+
+        assert are_cocircular(unit_circle_points(1000)) is True
+        assert are_cocircular([*unit_circle_points(100), (1, 1)]) is False
+
+    def test_stops_at_first_counterexample(self):
+        points = itertools.chain(
+            [(1, 0), (0, 1), (-1, 0), (0, -1), (0, 2)],
+            itertools.repeat((1, 0)),
+        )
+        assert are_cocircular(points) is False
+
+    def test_coincident_reference_points(self):
+        points = [(1, 0), (1, 0), (2, 0, 2), (0, 1), (-1, 0), (0, -1)]
+        assert are_cocircular(points) is True
+        assert are_cocircular([*points, (1, 1)]) is False
+
+    def test_many_symbolic_points(self):
+        r = symbols("r", positive=True)
+        points = [(r, 0), (0, r), (-r, 0), (0, -r), (r * sqrt(2) / 2, r * sqrt(2) / 2)]
+        assert are_cocircular(points * 10) is True
+        assert are_cocircular([*points, (r, r)]) is False
+        assert are_cocircular([*points, symbols("x y")]) is None
@@ -1,11 +1,28 @@
-from sympy import Function, I, Matrix, nan, sqrt, symbols
-
-from lib.circle import UNIT_CIRCLE
+import pytest
+from sympy import (
+    CRootOf,
+    Function,
+    I,
+    Matrix,
+    Rational,
+    nan,
+    simplify,
+    sqrt,
+    symbols,
+)
+
+from lib.circle import UNIT_CIRCLE, circle
 from lib.degenerate_conic import line_pair_conic
+from lib.ellipse import ellipse
 from lib.incidence import conic_contains_point
-from lib.intersection import conic_x_line, line_x_line
+from lib.intersection import (
+    _symbolic_conic_x_line,
+    conic_x_conic,
+    conic_x_line,
+    line_x_line,
+)
 from lib.line import IDEAL_LINE, X_AXIS, Y_AXIS, horizontal_line, vertical_line
-from lib.matrix import conic_matrix, is_nonzero_multiple
+from lib.matrix import conic_matrix, is_nonzero_multiple, quadratic_form
 from lib.point import ORIGIN, ideal_point, point_to_xy
 
 
@@ -86,3 +103,82 @@ class TestConicXLine:
         conic = conic_matrix(*symbols("a b c d e f"))
         intersections = conic_x_line(conic, IDEAL_LINE)
         assert isinstance(intersections, Function)
+
+    @pytest.mark.parametrize(
+        ("conic", "line"),
+        [
+            (conic_matrix(1, 2, 3, 4, 5, 6), Matrix([1, 2, 3])),
+            (conic_matrix(Rational(1, 2), 0, -3, 1, 0, 7), Matrix([0, 3, -1])),
+            (UNIT_CIRCLE, horizontal_line(1)),
+            (UNIT_CIRCLE, horizontal_line(2)),
+            (UNIT_CIRCLE, Matrix([3, 4, 5])),
+            (line_pair_conic(X_AXIS, Y_AXIS), IDEAL_LINE),
+            (line_pair_conic(X_AXIS, X_AXIS), Y_AXIS),
+            (line_pair_conic(X_AXIS, Y_AXIS), X_AXIS),
+            (UNIT_CIRCLE, Matrix([0, 0, 0])),
+        ],
+    )
+    def test_rational_fast_path(self, conic: Matrix, line: Matrix):
+        expected = _symbolic_conic_x_line(conic, line)
+        assert conic_x_line(conic, line) == expected
+
+
+class TestConicXConic:
+    def test_two_circles(self):
+        points = conic_x_conic(circle((0, 0), 2), circle((2, 2), 2))
+        real_points = {tuple(point_to_xy(p)) for p in points if p[2] != 0}
+        assert real_points == {(0, 2), (2, 0)}
+        # Circles also meet at the complex circular points at infinity.
+        ideal_points = [p for p in points if p[2] == 0]
+        assert len(ideal_points) == 2
+        assert all(quadratic_form(UNIT_CIRCLE, p) == 0 for p in ideal_points)
+
+    def test_two_ellipses(self):
+        conic1 = ellipse((0, 0), 3, 2)
+        conic2 = ellipse((1, 0), 2, 3)
+        points = conic_x_conic(conic1, conic2)
+        assert len(points) == 4
+        for point in points:
+            assert conic_contains_point(conic1, point)
+            assert conic_contains_point(conic2, point)
+
+    def test_general_case(self):
+        conic1 = conic_matrix(1, 2, -3, 4, 5, -6)
+        conic2 = conic_matrix(2, -1, 3, 1, -2, -7)
+        for point in conic_x_conic(conic1, conic2):
+            # Evaluating the root of the cubic first is much faster.
+            approx_point = Matrix(point).xreplace(
+                {root: root.evalf(30) for root in Matrix(point).atoms(CRootOf)},
+            )
+            approx_point = approx_point.evalf()
+            approx_point /= approx_point.norm()
+            assert abs(quadratic_form(conic1, approx_point)) < 1e-12
+            assert abs(quadratic_form(conic2, approx_point)) < 1e-12
+
+    def test_degenerate_conic(self):
+        points = conic_x_conic(UNIT_CIRCLE, line_pair_conic(X_AXIS, Y_AXIS))
+        xy_points = sorted(tuple(point_to_xy(p)) for p in points)
+        assert xy_points == [(-1, 0), (0, -1), (0, 1), (1, 0)]
+
+    def test_touching_conics(self):
+        points = conic_x_conic(UNIT_CIRCLE, circle((2, 0), 1))
+        assert sum(is_nonzero_multiple(p, Matrix([1, 0, 1])) for p in points) == 2
+
+    def test_coincident_conics(self):
+        assert conic_x_conic(UNIT_CIRCLE, UNIT_CIRCLE * 3) is nan
+
+    def test_common_line_component(self):
+        line_pair1 = line_pair_conic(X_AXIS, Y_AXIS)
+        line_pair2 = line_pair_conic(X_AXIS, Matrix([1, 1, 1]))
+        assert conic_x_conic(line_pair1, line_pair2) is nan
+
+    def test_symbolic_radius(self):
+        r = symbols("r", positive=True)
+        points = conic_x_conic(circle((0, 0), r), circle((1, 0), 1))
+        x, y = point_to_xy(points[0])
+        assert x == r**2 / 2
+        assert simplify(x**2 + y**2 - r**2) == 0
+
+    def test_symbolic_conic(self):
+        conic = conic_matrix(*symbols("a b c d e f"))
+        assert isinstance(conic_x_conic(conic, UNIT_CIRCLE), Function)
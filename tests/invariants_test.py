@@ -0,0 +1,50 @@
+from sympy import ImmutableMatrix, Matrix, symbols
+
+from lib.invariants import (
+    clear_invariant_cache,
+    conic_adjugate,
+    conic_det,
+    submatrix_det,
+)
+from lib.matrix import conic_matrix
+
+
+class TestConicDet:
+    def test_value(self):
+        conic = conic_matrix(*symbols("a b c d e f"))
+        assert conic_det(conic) == conic.det()
+
+    def test_memoized(self):
+        conic = conic_matrix(*symbols("a b c d e f"))
+        assert conic_det(conic) is conic_det(conic.copy())
+        assert conic_det(conic) is conic_det(ImmutableMatrix(conic))
+
+    def test_distinguishes_number_types(self):
+        assert conic_det(Matrix.diag(1, 2, 3)).is_Integer
+        assert conic_det(Matrix.diag(1.0, 2, 3)).is_Float
+
+    def test_clear_cache(self):
+        conic = conic_matrix(*symbols("a b c d e f"))
+        det = conic_det(conic)
+        clear_invariant_cache()
+        assert conic_det(conic) is not det
+        assert conic_det(conic) == det
+
+
+class TestConicAdjugate:
+    def test_value(self):
+        conic = conic_matrix(*symbols("a b c d e f"))
+        assert conic_adjugate(conic) == conic.adjugate()
+
+    def test_result_is_mutable_copy(self):
+        conic = Matrix.diag(1, 2, 3)
+        adjugate = conic_adjugate(conic)
+        assert isinstance(adjugate, Matrix)
+        adjugate[0, 0] = 0
+        assert conic_adjugate(conic) == Matrix.diag(6, 3, 2)
+
+
+class TestSubmatrixDet:
+    def test_value(self):
+        a, b, c, d, e, f = symbols("a b c d e f")
+        assert submatrix_det(conic_matrix(a, b, c, d, e, f)) == a * c - b * b
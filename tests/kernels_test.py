@@ -0,0 +1,129 @@
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+from sympy import Matrix, Rational
+
+from lib import kernels
+from lib.central_conic import (
+    center_to_covertex_vector,
+    center_to_focus_vector,
+    center_to_vertex_vector,
+    conic_center,
+    linear_eccentricity,
+    primary_radius,
+    secondary_radius,
+    semi_axis_lengths,
+    shrink_conic_to_zero,
+)
+from lib.circle import circle, circle_radius, director_circle
+from lib.conic import conic_from_focus_and_directrix
+from lib.conic_direction import conjugate_axis_direction, focal_axis_direction
+from lib.degenerate_conic import line_pair_conic
+from lib.ellipse import ellipse
+from lib.hyperbola import hyperbola_from_foci_and_point
+from lib.parabola import (
+    parabola_axis,
+    parabola_direction,
+    parabola_directrix,
+    parabola_focal_parameter,
+    parabola_focus,
+    parabola_vertex,
+)
+from scripts.generate_kernels import FUNCTIONS, generate_module
+
+CENTRAL_CONICS = [
+    ellipse((1, 2), 5, 3),
+    ellipse((-1, 3), 2, 4) * -3,
+    hyperbola_from_foci_and_point((0, 0), (4, 2), (5, 5)),
+    hyperbola_from_foci_and_point((1, 1), (-2, 3), (0, 6)) * -1,
+    conic_from_focus_and_directrix((1, 2), Matrix([1, -2, 3]), Rational(1, 2)),
+]
+
+CIRCLES = [circle((1, 2), 3), circle((-4, 0), Rational(1, 2)) * -2]
+
+PARABOLAS = [
+    conic_from_focus_and_directrix((1, 2), Matrix([1, 1, 3]), 1),
+    conic_from_focus_and_directrix((-2, 0), Matrix([-3, 2, 1]), 1) * -5,
+]
+
+DEGENERATE_CONICS = [
+    # Ideal point conics
+    Matrix.diag(1, 0, 1),
+    Matrix.diag(0, 1, 1),
+    Matrix.diag(-1, 0, -1),
+    Matrix([[1, -1, 0], [-1, 1, 0], [0, 0, 1]]),
+    # Finite point conics
+    Matrix.diag(-2, -1, 0),
+    Matrix([[1, 0, -1], [0, 1, -2], [-1, -2, 5]]),
+    line_pair_conic(Matrix([1, 0, 0]), Matrix([0, 1, -1])),
+]
+
+CASES: list[tuple[Callable, list[Matrix]]] = [
+    (conic_center, CENTRAL_CONICS),
+    (semi_axis_lengths, CENTRAL_CONICS[:2]),
+    (primary_radius, CENTRAL_CONICS),
+    (secondary_radius, CENTRAL_CONICS[:2]),
+    (linear_eccentricity, CENTRAL_CONICS),
+    (center_to_focus_vector, CENTRAL_CONICS),
+    (center_to_vertex_vector, CENTRAL_CONICS),
+    (center_to_covertex_vector, CENTRAL_CONICS[:2]),
+    (shrink_conic_to_zero, CENTRAL_CONICS),
+    (circle_radius, CIRCLES),
+    (director_circle, CENTRAL_CONICS),
+    (parabola_directrix, PARABOLAS),
+    (parabola_focus, PARABOLAS),
+    (parabola_vertex, PARABOLAS),
+    (parabola_direction, PARABOLAS),
+    (parabola_axis, PARABOLAS),
+    (parabola_focal_parameter, PARABOLAS),
+    (focal_axis_direction, CENTRAL_CONICS + PARABOLAS + DEGENERATE_CONICS),
+    (conjugate_axis_direction, CENTRAL_CONICS + PARABOLAS + DEGENERATE_CONICS),
+]
+
+
+def as_float_array(result: object) -> np.ndarray:
+    if isinstance(result, Matrix):
+        shape = (result.rows,) if result.cols == 1 else result.shape
+        return np.array(result.evalf(), dtype=float).reshape(shape)
+    if isinstance(result, tuple):
+        return np.array([float(el) for el in result])
+    return np.array(float(result))
+
+
+def test_covers_all_generated_functions():
+    assert [function for function, _ in CASES] == list(FUNCTIONS)
+
+
+@pytest.mark.parametrize(
+    ("function", "conics"),
+    CASES,
+    ids=[function.__name__ for function, _ in CASES],
+)
+def test_matches_symbolic_counterpart(function: Callable, conics: list[Matrix]):
+    kernel = getattr(kernels, function.__name__)
+    coefficients = kernels.conic_coefficients(np.array(conics, dtype=float))
+    results = kernel(*coefficients)
+    assert len(results) == len(conics)
+    for conic, result in zip(conics, results, strict=True):
+        assert result == pytest.approx(as_float_array(function(conic)))
+
+
+def test_scalar_inputs():
+    center = kernels.conic_center(*kernels.conic_coefficients(ellipse((1, 2), 5, 3)))
+    assert center.shape == (2,)
+    assert center == pytest.approx([1, 2])
+
+
+def test_matrix_output_shape():
+    coefficients = kernels.conic_coefficients(np.tile(np.eye(3), (4, 5, 1, 1)))
+    assert kernels.shrink_conic_to_zero(*coefficients).shape == (4, 5, 3, 3)
+
+
+def test_invalid_conic_stack():
+    with pytest.raises(ValueError, match=r"\(\.\.\.,3,3\)"):
+        kernels.conic_coefficients(np.zeros((4, 3)))
+
+
+def test_generated_module_is_up_to_date():
+    assert generate_module() == kernels.__loader__.get_source(kernels.__name__)
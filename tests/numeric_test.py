@@ -0,0 +1,163 @@
+import math
+
+import numpy as np
+import pytest
+from sympy import Matrix, MatrixBase, symbols
+
+from lib import numeric
+from lib.central_conic import conic_center
+from lib.circle import UNIT_CIRCLE, circle
+from lib.conic import conic_from_focus_and_directrix, eccentricity
+from lib.degenerate_conic import line_pair_conic
+from lib.ellipse import ellipse
+from lib.hyperbola import UNIT_HYPERBOLA
+from lib.line import X_AXIS, line_between
+from lib.matrix import conic_matrix
+
+ELLIPSE = ellipse((1, 2), 3, 4, r1_angle=0.5)
+PARABOLA = conic_from_focus_and_directrix((1, 2), Matrix([1, 1, 3]), 1)
+
+
+def as_floats(matrix: Matrix) -> list[list[float]]:
+    return [[float(el) for el in row] for row in matrix.tolist()]
+
+
+class TestDispatch:
+    def test_numeric_inputs(self):
+        assert numeric.line_between((1, 2), (3, 4.0)) == (-2.0, 2.0, -2.0)
+        assert numeric.line_between(np.array([1, 2]), [3, 4]) == (-2.0, 2.0, -2.0)
+
+    def test_symbolic_inputs(self):
+        x = symbols("x")
+        assert numeric.line_between((x, 2), (3, 4)) == line_between((x, 2), (3, 4))
+        assert numeric.line_between(Matrix([1, 2]), (3, 4)) == Matrix([-2, 2, -2])
+
+    def test_keyword_arguments(self):
+        expected = numeric.circle((1, 2), 3)
+        assert numeric.circle(center=(1, 2), radius=3).tolist() == expected.tolist()
+        assert numeric.circle((1, 2), radius=3).tolist() == expected.tolist()
+        x = symbols("x")
+        assert numeric.circle(center=(x, 2), radius=3) == circle((x, 2), 3)
+        assert numeric.circle(center=(1, 2), radius=3, exact=True) == circle((1, 2), 3)
+
+    def test_exact(self):
+        result = numeric.line_between((1, 2), (3, 4), exact=True)
+        assert result == Matrix([-2, 2, -2])
+        assert numeric.eccentricity(as_floats(UNIT_HYPERBOLA), exact=True).is_Float
+
+    def test_metadata(self):
+        assert numeric.line_between.__name__ == "line_between"
+        assert "Exact counterpart" in numeric.line_between.__doc__
+
+
+class TestLines:
+    def test_line_between_ideal_point(self):
+        assert numeric.line_between((1, 2, 0), (3, 4)) == (2.0, -1.0, -2.0)
+
+    def test_parallel_line(self):
+        line = numeric.parallel_line((1, 2, 3), (4, 5))
+        assert line == (1.0, 2.0, -14.0)
+
+    def test_perpendicular_line(self):
+        line = numeric.perpendicular_line((1, 2, 3), (4, 5))
+        assert line == (-2.0, 1.0, -3.0)
+
+
+class TestConics:
+    def test_circle(self):
+        assert numeric.circle((1, 2), 3).tolist() == as_floats(
+            conic_matrix(-1, 0, -1, 1, 2, 4),
+        )
+
+    def test_conic_center(self):
+        center = numeric.conic_center(as_floats(ELLIPSE))
+        assert center == pytest.approx([float(c) for c in conic_center(ELLIPSE)])
+
+    def test_conic_center_of_parabola(self):
+        x, y = numeric.conic_center(as_floats(PARABOLA))
+        assert math.isinf(x) or math.isinf(y)
+
+    @pytest.mark.parametrize(
+        "conic",
+        [
+            ELLIPSE,
+            UNIT_CIRCLE,
+            -UNIT_CIRCLE,
+            UNIT_HYPERBOLA,
+            ellipse((1, 2), 1, 3) * -2,
+            PARABOLA,
+            line_pair_conic(X_AXIS, Matrix([1, 2, 3])),
+            Matrix.diag(1, 2, 0),
+            Matrix.diag(1, 2, 3),
+            # Ideal point conics
+            Matrix.diag(0, 1, 1),
+            Matrix.diag(1, 0, 1),
+            Matrix([[1, -1, 0], [-1, 1, 0], [0, 0, 1]]),
+            Matrix([[1, 1, 0], [1, 1, 0], [0, 0, 1]]),
+        ],
+    )
+    def test_eccentricity(self, conic: Matrix):
+        expected = complex(eccentricity(conic))
+        assert numeric.eccentricity(as_floats(conic)) == pytest.approx(expected)
+
+    def test_conic_x_line(self):
+        conic = as_floats(ELLIPSE)
+        for line in [(1, -1, 0.5), (0, 1, -2), (1, 0, -1e6), (0, 0, 1)]:
+            for point in numeric.conic_x_line(conic, line):
+                scale = np.linalg.norm(point)
+                assert abs(point @ np.array(line)) < 1e-9 * scale
+                assert abs(point @ np.array(conic) @ point) < 1e-9 * scale**2
+
+    def test_conic_x_line_tangent(self):
+        point1, point2 = numeric.conic_x_line(as_floats(UNIT_CIRCLE), (1, 0, -1))
+        assert point1 / point1[2] == pytest.approx([1, 0, 1])
+        assert point2 / point2[2] == pytest.approx([1, 0, 1])
+
+    def test_conic_x_line_complex(self):
+        point1, point2 = numeric.conic_x_line(as_floats(UNIT_CIRCLE), (1, 0, -2))
+        assert point1.dtype.kind == "c"
+        assert point1 == pytest.approx(point2.conj())
+
+    def test_conic_x_line_special_cases(self):
+        line_pair = as_floats(line_pair_conic(X_AXIS, Matrix([1, 2, 3])))
+        assert math.isnan(numeric.conic_x_line(line_pair, (0, 1, 0)))
+        assert math.isnan(numeric.conic_x_line(as_floats(UNIT_CIRCLE), (0, 0, 0)))
+
+    def test_agrees_with_exact_conic_x_line(self):
+        exact_point = numeric.conic_x_line(ELLIPSE, Matrix([2, -2, 1]))[0]
+        float_points = numeric.conic_x_line(as_floats(ELLIPSE), [2, -2, 1])
+        exact_point = np.array(exact_point, dtype=float).ravel()
+        exact_point /= np.linalg.norm(exact_point)
+        assert any(
+            np.cross(exact_point, point / np.linalg.norm(point))
+            == pytest.approx([0, 0, 0], abs=1e-9)
+            for point in float_points
+        )
+
+    def test_conic_x_conic(self):
+        conic1, conic2 = as_floats(ELLIPSE), as_floats(UNIT_HYPERBOLA)
+        points = numeric.conic_x_conic(conic1, conic2)
+        assert len(points) == 4
+        for point in points:
+            assert abs(point @ np.array(conic1) @ point) < 1e-9
+            assert abs(point @ np.array(conic2) @ point) < 1e-9
+
+    def test_conic_x_conic_coincident(self):
+        circle = as_floats(UNIT_CIRCLE)
+        assert math.isnan(numeric.conic_x_conic(circle, circle))
+
+    def test_conic_x_conic_exact(self):
+        points = numeric.conic_x_conic(UNIT_CIRCLE, Matrix.diag(1, 4, -1))
+        assert all(isinstance(point, MatrixBase) for point in points)
+
+
+class TestDistances:
+    def test_point_point_distance(self):
+        assert numeric.point_point_distance((0, 0), (3, 4)) == 5
+        assert numeric.point_point_distance((0, 0, 2), (3, 4, -1)) == -5
+        assert numeric.point_point_distance((0, 0), (3, 4, 0)) == math.inf
+        assert math.isnan(numeric.point_point_distance((1, 0, 0), (3, 4, 0)))
+
+    def test_point_line_distance(self):
+        assert numeric.point_line_distance((1, 1), (3, 4, 0)) == 7 / 5
+        assert numeric.point_line_distance((1, 1), (0, -1, 0)) == -1
@@ -0,0 +1,309 @@
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+from sympy import (
+    Expr,
+    Matrix,
+    Rational,
+    cos,
+    expand,
+    factor,
+    simplify,
+    sin,
+    sqrt,
+    symbols,
+)
+
+from lib.conic_classes import is_degenerate
+from lib.incidence import are_on_same_conic, conic_contains_point
+from lib.matrix import conic_matrix, is_full_rank
+from lib.simplifier import (
+    BudgetedSimplifier,
+    ProbabilisticZeroTest,
+    TieredSimplifier,
+)
+from lib.transform_classes import is_homography, is_involution
+
+
+def unit_circle_point(t: Expr) -> Matrix:
+    return Matrix([1 - t * t, 2 * t, 1 + t * t])
+
+
+class TestProbabilisticZeroTest:
+    def test_zero_polynomial(self):
+        x, y = symbols("x y")
+        zero_test = ProbabilisticZeroTest(seed=0)
+        assert zero_test((x + y) ** 3 - x**3 - 3 * x * y * (x + y) - y**3) == 0
+
+    def test_nonzero_polynomial(self):
+        x, y = symbols("x y")
+        zero_test = ProbabilisticZeroTest(seed=0)
+        assert zero_test((x + y) ** 2 - x**2 - y**2).is_zero is False
+
+    def test_nonzero_realness(self):
+        x = symbols("x")
+        r = symbols("r", real=True)
+        zero_test = ProbabilisticZeroTest(seed=0)
+        assert zero_test((x + 1) ** 2 - 1).is_nonzero is None
+        assert zero_test((r + 1) ** 2 - 1).is_nonzero
+
+    def test_keeps_decidable_sign(self):
+        p = symbols("p", positive=True)
+        zero_test = ProbabilisticZeroTest(seed=0)
+        assert zero_test(p**2 + 1).is_positive
+
+    def test_rational_function(self):
+        x, y = symbols("x y")
+        zero_test = ProbabilisticZeroTest(seed=0)
+        assert zero_test(1 / (x - y) + 1 / (y - x)) == 0
+        assert zero_test(1 / (x - y) - 1 / (y - x)).is_zero is False
+
+    def test_numbers(self):
+        zero_test = ProbabilisticZeroTest(seed=0)
+        assert zero_test(Rational(3, 4)) == Rational(3, 4)
+        assert zero_test(0) == 0
+
+    def test_rational_arithmetic(self):
+        x, y = symbols("x y")
+        zero_test = ProbabilisticZeroTest(modulus=None, seed=0)
+        assert zero_test(expand((x - y / 3) ** 4) - (x - y / 3) ** 4) == 0
+        assert zero_test(x**4 - y / 3).is_zero is False
+
+    def test_unsupported_expression(self):
+        x = symbols("x")
+        zero_test = ProbabilisticZeroTest(seed=0)
+        assert zero_test(sqrt(x) ** 2 - x) == 0
+        assert zero_test(sqrt(x) + 1) == sqrt(x) + 1
+        assert zero_test(x + 0.5) == x + 0.5
+
+    def test_fallback(self):
+        x, y = symbols("x y")
+        fallback_calls = []
+
+        def fallback(expr: Expr) -> Expr:
+            fallback_calls.append(expr)
+            return expand(expr)
+
+        zero_test = ProbabilisticZeroTest(fallback=fallback, seed=0)
+        assert zero_test((x + y) ** 2 - x**2 - 2 * x * y - y**2) == 0
+        assert len(fallback_calls) == 1
+        assert zero_test(x + y).is_zero is False
+        assert len(fallback_calls) == 1
+        assert zero_test(sqrt(x) * (sqrt(x) + 1) - x - sqrt(x)) == 0
+        assert len(fallback_calls) == 2
+
+    def test_matrix(self):
+        x, y = symbols("x y")
+        zero_test = ProbabilisticZeroTest(seed=0)
+        matrix = Matrix([[(x + y) * (x - y) - x**2 + y**2, 1]])
+        assert zero_test(matrix) == Matrix([[0, 1]])
+
+    def test_reproducible(self):
+        x, y = symbols("x y")
+        expr = (x + y) ** 2 - x**2
+        assert ProbabilisticZeroTest(seed=1).is_probably_zero(expr) is False
+        assert ProbabilisticZeroTest(trials=1, seed=1).is_probably_zero(x - x) is True
+
+
+def slow_expand(expr: Expr) -> Expr:
+    time.sleep(2)
+    return expand(expr)
+
+
+class TestPredicatesWithProbabilisticZeroTest:
+    def test_are_on_same_conic(self):
+        ts = symbols("t1:7")
+        points = [unit_circle_point(t) for t in ts]
+        zero_test = ProbabilisticZeroTest(seed=0)
+        assert are_on_same_conic(points, simplifier=zero_test) is True
+
+        points[0] = Matrix([ts[0], 0, 1])
+        assert are_on_same_conic(points, simplifier=zero_test) is not True
+
+    def test_conic_contains_point(self):
+        t = symbols("t")
+        unit_circle = conic_matrix(1, 0, 1, 0, 0, -1)
+        zero_test = ProbabilisticZeroTest(seed=0)
+        point = unit_circle_point(t)
+        assert conic_contains_point(unit_circle, point, simplifier=zero_test)
+
+    def test_is_degenerate(self):
+        a, b, c = symbols("a b c", real=True)
+        line1, line2 = Matrix([a, b, c]), Matrix([b, c, a])
+        line_pair = line1 * line2.T + line2 * line1.T
+        zero_test = ProbabilisticZeroTest(fallback=factor, seed=0)
+        assert is_degenerate(line_pair, simplifier=zero_test) is True
+        assert is_degenerate(Matrix.diag(a, 1, 1), simplifier=zero_test) is False
+
+    def test_is_full_rank(self):
+        a, b = symbols("a b", real=True)
+        zero_test = ProbabilisticZeroTest(seed=0)
+        assert is_full_rank(Matrix([[a, b], [b, a + 1]]), simplifier=zero_test)
+        assert not is_full_rank(Matrix([[a, b], [2 * a, 2 * b]]), simplifier=zero_test)
+
+
+class TestBudgetedSimplifier:
+    def test_within_budget(self):
+        x, y = symbols("x y")
+        budgeted = BudgetedSimplifier(expand, max_seconds=5, max_ops=100)
+        assert budgeted((x + y) ** 2 - x**2 - 2 * x * y - y**2) == 0
+        assert budgeted.calls == 1
+        assert budgeted.timeouts == budgeted.size_limit_hits == 0
+
+    def test_timeout(self):
+        x = symbols("x")
+        budgeted = BudgetedSimplifier(slow_expand, max_seconds=0.05)
+        start = time.perf_counter()
+        result = budgeted(x - x)
+        assert time.perf_counter() - start < 1
+        assert result.is_zero is None
+        assert budgeted.timeouts == 1
+
+    def test_nested_budgets(self):
+        x = symbols("x")
+        inner = BudgetedSimplifier(expand, max_seconds=5)
+
+        def inner_then_slow(expr: Expr) -> Expr:
+            inner(expr)
+            return slow_expand(expr)
+
+        outer = BudgetedSimplifier(inner_then_slow, max_seconds=0.05)
+        start = time.perf_counter()
+        assert outer(x - x).is_zero is None
+        assert time.perf_counter() - start < 1
+        assert (outer.timeouts, inner.timeouts) == (1, 0)
+
+    def test_enclosing_budget_expires_first(self):
+        x = symbols("x")
+        inner = BudgetedSimplifier(slow_expand, max_seconds=5)
+
+        def inner_then_slow(expr: Expr) -> Expr:
+            inner(expr)
+            return slow_expand(expr)
+
+        outer = BudgetedSimplifier(inner_then_slow, max_seconds=0.05)
+        start = time.perf_counter()
+        assert outer(x - x).is_zero is None
+        assert time.perf_counter() - start < 1
+        assert outer.timeouts == 1
+
+    def test_timeout_outside_main_thread(self):
+        x = symbols("x")
+        budgeted = BudgetedSimplifier(slow_expand, max_seconds=0.05)
+        results = []
+        thread = threading.Thread(target=lambda: results.append(budgeted(x - x)))
+        thread.start()
+        thread.join(timeout=1)
+        assert results[0].is_zero is None
+        assert budgeted.timeouts == 1
+
+    def test_abandoned_call_does_not_block_exit(self):
+        script = textwrap.dedent(
+            """
+            import threading
+            import time
+            from sympy import symbols
+            from lib.simplifier import BudgetedSimplifier
+
+            def runaway(expr):
+                time.sleep(60)
+                return expr
+
+            budgeted = BudgetedSimplifier(runaway, max_seconds=0.05)
+            thread = threading.Thread(target=budgeted, args=(symbols("x"),))
+            thread.start()
+            thread.join()
+            """,
+        )
+        start = time.perf_counter()
+        subprocess.run(  # noqa: S603 (trusted input)
+            [sys.executable, "-c", script],
+            check=True,
+            timeout=30,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        assert time.perf_counter() - start < 30
+
+    def test_size_limit(self):
+        x, y = symbols("x y")
+        budgeted = BudgetedSimplifier(expand, max_ops=5)
+        assert budgeted(x * y - y * x) == 0
+        assert budgeted(((x + y) ** 3 - x**3 - y**3) * x).is_zero is None
+        assert budgeted.size_limit_hits == 1
+        assert budgeted.calls == 2
+
+    def test_reset_counters(self):
+        budgeted = BudgetedSimplifier(expand, max_ops=0)
+        budgeted(symbols("x") + 1)
+        budgeted.reset_counters()
+        assert (budgeted.calls, budgeted.size_limit_hits) == (0, 0)
+
+    def test_matrix(self):
+        x = symbols("x")
+        budgeted = BudgetedSimplifier(expand, max_ops=0)
+        result = budgeted(Matrix([[x + 1, x + 2]]))
+        assert result.shape == (1, 2)
+        assert result[0] != result[1]
+
+    def test_predicates_become_undecidable(self):
+        x = symbols("x")
+        transformation = Matrix.diag(x, 1, 1)
+        budgeted = BudgetedSimplifier(slow_expand, max_seconds=0.05)
+        assert is_homography(transformation, simplifier=budgeted) is None
+        assert is_involution(transformation, simplifier=budgeted) is None
+        assert budgeted.timeouts == 2
+
+
+class TestTieredSimplifier:
+    def test_stops_at_first_decided_tier(self):
+        x, y = symbols("x y")
+        tiered = TieredSimplifier()
+        assert tiered(x - x) == 0
+        assert tiered((x + y) ** 2 - x**2 - 2 * x * y - y**2) == 0
+        assert tiered((x**2 - y**2) / (x - y) - x - y) == 0
+        assert tiered(sin(x) ** 2 + cos(x) ** 2 - 1) == 0
+        assert tiered.tier_counts == {
+            "identity": 1,
+            "expand": 1,
+            "cancel": 1,
+            "simplify": 1,
+        }
+
+    def test_unresolved(self):
+        x = symbols("x")
+        tiered = TieredSimplifier()
+        assert tiered(x + 1) == x + 1
+        assert tiered.tier_counts == {"unresolved": 1}
+
+    def test_custom_tiers_and_condition(self):
+        x = symbols("x", real=True)
+        tiered = TieredSimplifier(
+            [expand, factor],
+            is_decided=lambda expr: expr.is_positive is not None,
+        )
+        assert tiered(x**2 + 2 * x + 1).is_positive is None
+        assert tiered((x + 1) ** 2 - 2 * x).is_positive
+        assert tiered.tier_counts == {"unresolved": 1, "expand": 1}
+
+    def test_matrix(self):
+        x = symbols("x")
+        tiered = TieredSimplifier()
+        assert tiered(Matrix([[x - x, (x + 1) ** 2 - x**2 - 2 * x]])) == Matrix(
+            [[0, 1]],
+        )
+        assert tiered.tier_counts == {"identity": 1, "expand": 1}
+
+    def test_same_answers_as_simplify(self):
+        theta = symbols("theta")
+        rotation = Matrix(
+            [[cos(theta), -sin(theta), 0], [sin(theta), cos(theta), 0], [0, 0, 1]],
+        )
+        for transformation in [rotation, Matrix.diag(*symbols("a b c"))]:
+            assert is_homography(
+                transformation,
+                simplifier=TieredSimplifier(),
+            ) == is_homography(transformation, simplifier=simplify)
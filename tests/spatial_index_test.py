@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+from lib.batch import conic_bounding_boxes, sampson_distances
+from lib.circle import circle
+from lib.hyperbola import UNIT_HYPERBOLA
+from lib.matrix import conic_matrix
+from lib.spatial_index import ConicIndex
+
+
+def random_circles(count: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-100, 100, (count, 2))
+    radii = rng.uniform(0.5, 5, count)
+    conics = np.zeros((count, 3, 3))
+    conics[:, 0, 0] = conics[:, 1, 1] = 1
+    conics[:, :2, 2] = conics[:, 2, :2] = -centers
+    conics[:, 2, 2] = (centers**2).sum(axis=1) - radii**2
+    return conics
+
+
+def brute_force_intersecting(
+    boxes: np.ndarray,
+    min_corner: tuple[float, float],
+    max_corner: tuple[float, float],
+) -> list[int]:
+    return np.flatnonzero(
+        (boxes[:, 0] <= max_corner[0])
+        & (boxes[:, 1] <= max_corner[1])
+        & (boxes[:, 2] >= min_corner[0])
+        & (boxes[:, 3] >= min_corner[1]),
+    ).tolist()
+
+
+class TestConicIndex:
+    @pytest.mark.parametrize("node_capacity", [2, 4, 16])
+    def test_matches_brute_force(self, node_capacity: int):
+        conics = random_circles(1000)
+        index = ConicIndex(conics, node_capacity=node_capacity)
+        boxes = conic_bounding_boxes(conics)
+        rng = np.random.default_rng(1)
+        for _ in range(20):
+            corner = rng.uniform(-110, 110, 2)
+            size = rng.uniform(0, 20, 2)
+            expected = brute_force_intersecting(boxes, corner, corner + size)
+            assert index.intersecting(corner, corner + size).tolist() == expected
+
+    def test_containing(self):
+        conics = random_circles(500)
+        index = ConicIndex(conics)
+        center = -conics[42, :2, 2]
+        radius = np.sqrt(center @ center - conics[42, 2, 2])
+        point = center + radius * np.array([0.6, 0.8])
+        assert 42 in index.containing(point)
+        assert 42 not in index.containing(center)
+
+    def test_near(self):
+        conics = random_circles(500)
+        index = ConicIndex(conics)
+        point = (10, 20)
+        distances = sampson_distances(conics, [point])[:, 0]
+        found = index.near(point, 3)
+        assert np.all(distances[found] <= 3)
+        boxes = conic_bounding_boxes(conics)
+        box_distances = np.hypot(
+            np.maximum(0, np.maximum(boxes[:, 0] - 10, 10 - boxes[:, 2])),
+            np.maximum(0, np.maximum(boxes[:, 1] - 20, 20 - boxes[:, 3])),
+        )
+        expected = np.flatnonzero((distances <= 3) & (box_distances <= 3))
+        assert found.tolist() == expected.tolist()
+
+    @pytest.mark.parametrize(
+        ("center", "radius"),
+        [((1e5, 1e5), 5), ((4000, 3000), 0.1), ((1000, 1000), 0.01)],
+    )
+    def test_small_circles_far_from_origin(
+        self,
+        center: tuple[float, float],
+        radius: float,
+    ):
+        conic = np.array(circle(center, radius), dtype=float)
+        index = ConicIndex(conic[np.newaxis])
+        assert index.bounds[0] == pytest.approx(
+            [
+                center[0] - radius,
+                center[1] - radius,
+                center[0] + radius,
+                center[1] + radius,
+            ],
+            rel=1e-6,
+        )
+        point = np.array(center) + radius * np.array([0.6, 0.8])
+        assert index.containing(point).tolist() == [0]
+        assert index.near(point, radius / 10).tolist() == [0]
+
+    def test_unbounded_conics(self):
+        parabola = np.array(conic_matrix(1, 0, 0, 0, -0.5, 0), dtype=float)  # y = x²
+        conics = np.stack(
+            [np.array(circle((0, 0), 1), dtype=float), parabola, UNIT_HYPERBOLA],
+        ).astype(float)
+        index = ConicIndex(conics)
+        assert index.intersecting((100, 50), (101, 51)).tolist() == [1, 2]
+        assert index.intersecting((100, -51), (101, -50)).tolist() == [2]
+        assert index.containing((3, 9)).tolist() == [1]
+        assert index.containing((1, 0)).tolist() == [0, 2]
+
+    def test_imaginary_ellipse_is_never_found(self):
+        imaginary = np.array(conic_matrix(1, 0, 1, 0, 0, 1), dtype=float)
+        index = ConicIndex(imaginary[np.newaxis])
+        assert index.intersecting((-1e9, -1e9), (1e9, 1e9)).tolist() == []
+
+    def test_empty_index(self):
+        index = ConicIndex(np.empty((0, 3, 3)))
+        assert len(index) == 0
+        assert index.near((0, 0), 1).tolist() == []
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match=r"\(N,3,3\)"):
+            ConicIndex(np.eye(3))
+        with pytest.raises(ValueError, match="capacity"):
+            ConicIndex(random_circles(3), node_capacity=1)
+        with pytest.raises(ValueError, match="distance"):
+            ConicIndex(random_circles(3)).near((0, 0), -1)
@@ -1,7 +1,9 @@
-from sympy import Matrix, expand, pi, simplify, symbols
+import numpy as np
+from sympy import Matrix, Rational, expand, pi, simplify, symbols
 
 from lib.circle import UNIT_CIRCLE
 from lib.hyperbola import UNIT_HYPERBOLA
+from lib.simplifier import TieredSimplifier
 from lib.transform import reflect_to_line, rotate, scale, transform_conic, translate
 from lib.transform_classes import (
     is_affine_transform,
@@ -17,6 +19,17 @@ class TestIsHomography:
         t = Matrix(3, 3, symbols("a b c d e f g h i"))
         assert is_homography(t) is None
 
+    def test_tier_counts_of_passed_simplifier(self):
+        t = Matrix(3, 3, symbols("a b c d e f g h i"))
+        tiered = TieredSimplifier()
+        is_homography(t, simplifier=tiered)
+        is_involution(t, simplifier=tiered)
+        counts = tiered.tier_counts.copy()
+        assert counts.total() > 0
+        is_homography(t)
+        is_involution(t)
+        assert tiered.tier_counts == counts
+
     def test_singular_matrix(self):
         t = Matrix([[1, 2, 3], [4, 5, 6], [5, 7, 9]])  # Row 3 = Row 1 + Row 2
         assert t.det() == 0
@@ -31,6 +44,17 @@ class TestIsHomography:
         assert is_homography(Matrix([[1, 2], [3, 4]])) is False
         assert is_homography(Matrix([1, 2])) is False
 
+    def test_float_matrix(self):
+        t = np.array([[1, 2, 3], [4, 5, 6], [5, 7, 9 + 1e-10]])
+        assert is_homography(t) is False
+        assert is_homography(t, tolerance=1e-18) is True
+        assert is_homography(Matrix(t)) is False
+
+    def test_rational_matrix_is_exact(self):
+        t = Matrix([[1, 2, 3], [4, 5, 6], [5, 7, 9 + Rational(1, 10**20)]])
+        assert is_homography(t) is True
+        assert is_homography(np.array([[1, 2, 3], [4, 5, 6], [5, 7, 9]])) is False
+
     def test_simplifier(self):
         t = rotate(symbols("theta"))
         assert is_homography(t) is True
@@ -166,6 +190,13 @@ class TestIsCongruence:
         t = translate((1, 2)) * -3
         assert is_congruence(t) is True
 
+    def test_float_matrix(self):
+        t = np.array(rotate(0.5) * translate((1, 2)), dtype=float)
+        assert is_congruence(t) is True
+        assert is_congruence(t * 1e-8) is True
+        assert is_congruence(t + 1e-6) is False
+        assert is_congruence(t + 1e-6, tolerance=1e-4) is True
+
     def test_symbolic_congruence(self):
         t = rotate(symbols("theta"), symbols("x y"))
         assert is_congruence(t) is True
@@ -227,3 +258,8 @@ class TestIsInvolution:
     def test_undecidable(self):
         t = translate(symbols("dx dy"))
         assert is_involution(t) is None
+
+    def test_float_matrix(self):
+        t = np.array(reflect_to_line(Matrix([1, 2, 3])), dtype=float)
+        assert is_involution(t) is True
+        assert is_involution(t @ np.array(rotate(1e-3), dtype=float)) is False
@@ -1,4 +1,19 @@
-from sympy import Matrix, expand, nan, pi, simplify, symbols
+import numpy as np
+import pytest
+from sympy import (
+    Matrix,
+    Rational,
+    atan,
+    cancel,
+    cos,
+    expand,
+    nan,
+    pi,
+    simplify,
+    sin,
+    symbols,
+    tan,
+)
 
 from lib.central_conic import conic_center
 from lib.circle import circle
@@ -6,9 +21,12 @@ from lib.line import IDEAL_LINE, X_AXIS, horizontal_line, line_between
 from lib.matrix import conic_matrix, is_nonzero_multiple
 from lib.polar_conic import conic_from_polar_matrix, point_at_angle
 from lib.transform import (
+    Transform,
     homography_from_samples,
     reflect_to_line,
     rotate,
+    rotate_by_half_angle_direction,
+    rotate_by_tangent,
     scale,
     scale_xy,
     transform_conic,
@@ -58,6 +76,31 @@ class TestRotate:
         rotation_sequence = translate(center) * rotate(angle) * translate(-center)
         assert simplify(rotation) == simplify(rotation_sequence)
 
+    def test_rotate_by_tangent(self):
+        angle = symbols("theta")
+        center = symbols("x y")
+        rotation = rotate_by_tangent(tan(angle / 2), center)
+        difference = rotation / rotation[2, 2] - rotate(angle, center)
+        assert simplify(difference).is_zero_matrix
+
+    def test_rotate_by_rational_tangent(self):
+        rotation = rotate_by_tangent(Rational(1, 2), (1, 2))
+        assert all(el.is_Rational for el in rotation)
+        assert is_nonzero_multiple(rotation, rotate(2 * atan(Rational(1, 2)), (1, 2)))
+
+    def test_rotate_by_half_angle_direction(self):
+        assert is_nonzero_multiple(
+            rotate_by_half_angle_direction((1, 1)), rotate(pi / 2)
+        )
+        assert is_nonzero_multiple(rotate_by_half_angle_direction((0, 3)), rotate(pi))
+
+    def test_polynomial_rotated_conic(self):
+        t = symbols("t", real=True)
+        conic = conic_matrix(*symbols("a b c d e f", real=True))
+        rotated = transform_conic(conic, rotate_by_tangent(t))
+        assert all(el.is_polynomial(t) for el in rotated)
+        assert not rotated.has(cos, sin)
+
 
 class TestReflection:
     def test_reflect_to_finite_line(self):
@@ -85,6 +128,41 @@ class TestScale:
         assert simplify(scaling) == simplify(scaling_sequence)
 
 
+def projective_transform_conic(conic: Matrix, transformation: Matrix) -> Matrix:
+    """The general formula of transform_conic, without the affine fast path."""
+    return transformation.adjugate().T * conic * transformation.adjugate()
+
+
+class TestTransformConic:
+    @pytest.mark.parametrize(
+        "transformation",
+        [
+            rotate(symbols("theta"), symbols("x y")),
+            translate(symbols("dx dy")),
+            scale_xy(*symbols("sx sy"), center=(1, 2)),
+            reflect_to_line(Matrix(symbols("p q r"))),
+            Matrix(3, 3, [*symbols("t0:6"), 0, 0, symbols("w")]),
+            Matrix([[1, 2, 3], [4, 5, 6], [0, 0, 7]]),
+        ],
+        ids=["rotate", "translate", "scale_xy", "reflect", "symbolic", "numeric"],
+    )
+    def test_affine_fast_path(self, transformation: Matrix):
+        expected = projective_transform_conic(conic, transformation)
+        actual = transform_conic(conic, transformation)
+        assert (actual - expected).applyfunc(cancel).is_zero_matrix
+
+    def test_projective_transformation(self):
+        transformation = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+        expected = projective_transform_conic(conic, transformation)
+        assert transform_conic(conic, transformation) == expected
+
+    def test_non_symmetric_matrix(self):
+        matrix = Matrix(3, 3, symbols("m0:9"))
+        transformation = translate((1, 2))
+        expected = projective_transform_conic(matrix, transformation)
+        assert transform_conic(matrix, transformation) == expected
+
+
 class TestTransformPoint:
     def test_translate(self):
         assert transform_point((1, 2), translate((3, 5))) == Matrix([4, 7, 1])
@@ -152,3 +230,104 @@ class TestHomographyFromSamples:
             transformed = transform_point(source, transform)
             assert is_nonzero_multiple(transformed, expected)
         assert transform == Matrix([[0, 0, 1], [0, 1, 0], [1, 0, 0]])
+
+
+class TestTransform:
+    def test_identity(self):
+        assert Transform().matrix == Matrix.eye(3)
+
+    def test_chain_order(self):
+        angle = symbols("theta")
+        transform = Transform().translate((1, 2)).rotate(angle).scale(3)
+        assert transform.matrix == scale(3) * rotate(angle) * translate((1, 2))
+        assert len(transform.steps) == 3
+
+    def test_immutable(self):
+        transform = Transform().translate((1, 2))
+        transform.rotate(pi / 2)
+        assert transform.matrix == translate((1, 2))
+
+    def test_then(self):
+        first = Transform().reflect(X_AXIS)
+        second = Transform(scale_xy(2, 3))
+        assert first.then(second).matrix == scale_xy(2, 3) * reflect_to_line(X_AXIS)
+        assert first.then(translate((1, 1))).matrix == translate(
+            (1, 1),
+        ) * reflect_to_line(X_AXIS)
+
+    def test_homography(self):
+        source = [(0, 0), (1, 0), (0, 1), (1, 1)]
+        target = [(1, 1), (2, 1), (1, 2), (3, 3)]
+        transform = Transform().homography(source, target)
+        for point, image in zip(source, target, strict=True):
+            assert is_nonzero_multiple(transform.transform_point(point), [*image, 1])
+
+    def test_polynomial_rotations(self):
+        transform = (
+            Transform().rotate_by_tangent(2).rotate_by_half_angle_direction((3, 1))
+        )
+        expected = rotate_by_half_angle_direction((3, 1)) * rotate_by_tangent(2)
+        assert transform.matrix == expected
+
+    def test_inverse(self):
+        transform = Transform().rotate(pi / 3, (1, 2)).scale_xy(2, 5)
+        product = transform.inverse().matrix * transform.matrix
+        assert is_nonzero_multiple(simplify(product), Matrix.eye(3))
+
+    def test_invalid_matrix(self):
+        with pytest.raises(ValueError, match="3x3"):
+            Transform(Matrix.eye(2))
+
+    def test_matches_module_functions(self):
+        matrix = homography_from_samples(
+            [(0, 0), (1, 0), (0, 1), (1, 1)],
+            [(1, 0), (2, 1), (0, 2), (3, 2)],
+        )
+        transform = Transform(matrix)
+        line = Matrix([1, 2, 3])
+        circle_matrix = circle((1, 2), 3)
+        polar_circle = Matrix([[3, 0, 1], [0, 3, 2], [0, 0, 1]])
+        assert transform.transform_point((1, 2)) == transform_point((1, 2), matrix)
+        assert transform.transform_line(line) == transform_line(line, matrix)
+        assert transform.transform_conic(circle_matrix) == transform_conic(
+            circle_matrix,
+            matrix,
+        )
+        assert transform.transform_polar_conic(
+            polar_circle,
+        ) == transform_polar_conic(polar_circle, matrix)
+
+    def test_affine_conic_transformation(self):
+        angle = symbols("theta")
+        transform = Transform().rotate(angle).translate((1, 2))
+        expected = projective_transform_conic(conic, transform.matrix)
+        actual = transform.transform_conic(conic)
+        assert (actual - expected).applyfunc(cancel).is_zero_matrix
+
+    def test_returns_mutable_matrices(self):
+        assert isinstance(Transform().transform_point((1, 2)), Matrix)
+        assert isinstance(Transform().transform_conic(circle((1, 2), 3)), Matrix)
+
+    def test_lists(self):
+        transform = Transform().translate((1, 2))
+        points = transform.transform_point([(0, 0), Matrix([1, 1, 1])])
+        assert points == [Matrix([1, 2, 1]), Matrix([2, 3, 1])]
+        lines = transform.transform_line([X_AXIS, horizontal_line(1)])
+        assert lines == [horizontal_line(2), horizontal_line(3)]
+        conics = transform.transform_conic([circle((0, 0), 1), circle((1, 1), 2)])
+        assert conics == [circle((1, 2), 1), circle((2, 3), 2)]
+
+    def test_numpy_arrays(self):
+        transform = Transform().rotate(pi / 2).translate((1, 0))
+        points = transform.transform_point(np.array([[1.0, 0.0], [0.0, 2.0]]))
+        assert points == pytest.approx(np.array([[1, 1, 1], [-1, 0, 1]]))
+        line = transform.transform_line(np.array([0.0, 1.0, 0.0]))
+        assert is_nonzero_multiple(Matrix(line.round(12)), [1, 0, -1])
+        conics = transform.transform_conic(
+            np.array([circle((1, 0), 1), circle((0, 2), 3)], dtype=float),
+        )
+        expected = [circle((1, 1), 1), circle((-1, 0), 3)]
+        for conic, expected_conic in zip(conics, expected, strict=True):
+            assert conic == pytest.approx(np.array(expected_conic, dtype=float))
+        polar_conics = transform.transform_polar_conic(np.eye(3)[np.newaxis])
+        assert polar_conics.shape == (1, 3, 3)
@@ -0,0 +1,111 @@
+import pytest
+from sympy import ImmutableMatrix, Matrix, sqrt, symbols
+
+from lib.central_conic import conic_center
+from lib.circle import UNIT_CIRCLE, circle
+from lib.conic_classes import ConicType
+from lib.distance import point_line_distance
+from lib.ellipse import ellipse
+from lib.hyperbola import UNIT_HYPERBOLA
+from lib.line import X_AXIS, line_between
+from lib.matrix import conic_matrix
+from lib.values import Conic, Line, Point
+
+
+class TestPoint:
+    def test_coordinates(self):
+        point = Point([1, 2])
+        assert point.vec == ImmutableMatrix([1, 2, 1])
+        assert list(point) == [1, 2, 1]
+        assert len(point) == 3
+        assert point[1] == 2
+        assert point.as_mutable() == Matrix([1, 2, 1])
+
+    def test_xy(self):
+        point = Point([2, 4, 2])
+        assert point.xy == ImmutableMatrix([1, 2])
+        assert point.xy is point.xy
+
+    def test_invalid_shape(self):
+        with pytest.raises(ValueError, match="2D or 3D"):
+            Point([1, 2, 3, 4])
+
+    def test_equality_and_hash(self):
+        assert Point([1, 2]) == Point(Matrix([1, 2, 1]))
+        assert Point([1, 2]) != Point([2, 4, 2])
+        assert Point([1, 2]) != Line([1, 2, 1])
+        assert len({Point([1, 2]), Point((1, 2, 1)), Point([0, 0])}) == 2
+
+    def test_immutable(self):
+        point = Point([1, 2])
+        with pytest.raises(AttributeError):
+            point.vec = ImmutableMatrix([0, 0, 1])
+        with pytest.raises(AttributeError):
+            point.label = "P"
+
+    def test_interoperability(self):
+        line = line_between(Point([0, 0]), Point([1, 1]))
+        assert line == Matrix([-1, 1, 0])
+        assert point_line_distance(Point([1, 0]), Line(line)) == -sqrt(2) / 2
+
+    def test_repr(self):
+        assert repr(Point([1, 2])) == "Point([1, 2, 1])"
+
+
+class TestLine:
+    def test_invalid_shape(self):
+        with pytest.raises(ValueError, match="3D column vector"):
+            Line([1, 2])
+
+    def test_normalized(self):
+        line = Line([3, 4, 5])
+        assert line.normalized == ImmutableMatrix([3, 4, 5]) / 5
+        assert line.normalized is line.normalized
+
+    def test_from_existing_function(self):
+        assert Line(X_AXIS) == Line([0, 1, 0])
+
+
+class TestConic:
+    def test_invalid_shape(self):
+        with pytest.raises(ValueError, match="3x3"):
+            Conic(Matrix([1, 2, 3]))
+
+    def test_matrix(self):
+        conic = Conic(UNIT_CIRCLE)
+        assert conic.matrix == UNIT_CIRCLE
+        assert isinstance(conic.matrix, ImmutableMatrix)
+        assert conic.as_mutable() == UNIT_CIRCLE
+
+    def test_invariants(self):
+        matrix = conic_matrix(*symbols("a b c d e f"))
+        conic = Conic(matrix)
+        assert conic.det == matrix.det()
+        assert conic.adjugate == matrix.adjugate()
+        assert conic.submatrix_det == matrix[:2, :2].det()
+        assert conic.det is conic.det
+        assert conic.adjugate is conic.adjugate
+
+    def test_center(self):
+        conic = Conic(ellipse((1, 2), 3, 4))
+        assert conic.center == ImmutableMatrix([1, 2])
+        assert conic.center is conic.center
+
+    def test_normalized(self):
+        assert Conic(-UNIT_CIRCLE).normalized == UNIT_CIRCLE
+        assert Conic(UNIT_HYPERBOLA * 2).normalized == UNIT_HYPERBOLA * 2
+
+    def test_conic_type(self):
+        assert Conic(circle((1, 2), 3)).conic_type == ConicType.ELLIPSE
+        assert Conic(UNIT_HYPERBOLA).conic_type == ConicType.HYPERBOLA
+        assert Conic(conic_matrix(*symbols("a b c d e f"))).conic_type is None
+
+    def test_equality_and_hash(self):
+        assert Conic(UNIT_CIRCLE) == Conic(UNIT_CIRCLE.copy())
+        assert Conic(UNIT_CIRCLE) != Conic(-UNIT_CIRCLE)
+        cache = {Conic(UNIT_CIRCLE): "circle"}
+        assert cache[Conic(circle((0, 0), 1))] == "circle"
+
+    def test_interoperability(self):
+        conic = Conic(ellipse((1, 2), 3, 4))
+        assert conic_center(conic.matrix) == Matrix([1, 2])